@@ -50,6 +50,10 @@ class ServerConfig:
     log_level: str = "INFO"
     simulation_timeout: int = 300  # seconds
     tool_timeout: int = 60  # seconds
+    # Simulations allowed to run at once; further requests wait in a queue
+    max_parallel_simulations: int = field(
+        default_factory=lambda: max(1, int(os.getenv('EPLUS_MAX_PARALLEL_SIMS', '2')))
+    )
 
 
 @dataclass
@@ -103,20 +107,6 @@ class Config:
             "USA_CA_San.Francisco.Intl.AP.724940_TMY3.epw"
         )
 
-    def _setup_logging(self):
-        """Configure logging based on configuration"""
-        log_level = getattr(logging, self.server.log_level.upper(), logging.INFO)
-        
-        # Configure logging format
-        logging.basicConfig(
-            level=log_level,
-            format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-            datefmt='%Y-%m-%d %H:%M:%S'
-        )
-        
-        logger = logging.getLogger(__name__)
-        logger.info(f"Logging configured: level={self.server.log_level}")
-
     def _validate_config(self):
         """Validate configuration and log warnings for missing components"""
         logger = logging.getLogger(__name__)
@@ -205,6 +195,15 @@ class Config:
         return log_dir
 
 
+# Incremented on every reload so caches derived from the configuration can key on it
+_config_version = 0
+
+
+def get_config_version() -> int:
+    """Get the version number of the current configuration"""
+    return _config_version
+
+
 def get_config() -> Config:
     """Get the global configuration instance"""
     if not hasattr(get_config, '_config'):
@@ -215,6 +214,8 @@ def get_config() -> Config:
 
 def reload_config() -> Config:
     """Reload configuration (useful for testing)"""
+    global _config_version
+    _config_version += 1
     if hasattr(get_config, '_config'):
         delattr(get_config, '_config')
     return get_config()
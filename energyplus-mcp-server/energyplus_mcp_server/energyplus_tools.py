@@ -11,7 +11,11 @@ See License.txt in the parent directory for license details.
 
 import os
 import json
+import heapq
+import shutil
 import logging
+import functools
+import threading
 from typing import Dict, List, Any, Optional
 from pathlib import Path
 
@@ -21,6 +25,8 @@ from eppy import hvacbuilder
 from eppy.useful_scripts import loopdiagram
 from eppy import walk_hvac
 from datetime import datetime
+import matplotlib
+matplotlib.use("Agg")  # Diagrams are only written to files; skip GUI backend probing
 import matplotlib.pyplot as plt
 import matplotlib.patches as patches
 from matplotlib.patches import FancyBboxPatch
@@ -34,17 +40,127 @@ import pandas as pd
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 
-from .config import get_config, Config
+from .config import get_config, get_config_version, Config
 from .utils.diagrams import HVACDiagramGenerator
+from .utils.idf_cache import get_idf, parse_idf, clear_idf_cache, idf_cache_info
 from .utils.schedules import ScheduleValueParser
 from .utils.output_variables import OutputVariableManager
 from .utils.output_meters import OutputMeterManager
 from .utils.people_utils import PeopleManager
 from .utils.lights_utils import LightsManager
 from .utils.electric_equipment_utils import ElectricEquipmentManager
+from .utils.jsonx import dumps as _dumps
+from .utils.path_utils import resolve_path, find_weather_files_by_name
+from .utils.runner import run_idf
 
 logger = logging.getLogger(__name__)
 
+# ZoneInfiltration:DesignFlowRate field holding the rate for each calculation
+# method, keyed by the casefolded method name
+_INFILTRATION_FLOW_FIELDS = {
+    "flow/exteriorarea": "Flow_Rate_per_Exterior_Surface_Area",
+    "flow/area": "Flow_Rate_per_Floor_Area",
+    "flow/zone": "Design_Flow_Rate",
+    "flow/exteriorwallarea": "Flow_Rate_per_Exterior_Surface_Area",
+    "airchanges/hour": "Air_Changes_per_Hour",
+}
+
+# Modifiable fields reported by check_simulation_settings; static, so built once
+_SIMULATION_CONTROL_FIELD_DESCRIPTIONS = {
+    "Do_Zone_Sizing_Calculation": "Yes/No - Controls zone sizing calculations",
+    "Do_System_Sizing_Calculation": "Yes/No - Controls system sizing calculations",
+    "Do_Plant_Sizing_Calculation": "Yes/No - Controls plant sizing calculations",
+    "Run_Simulation_for_Sizing_Periods": "Yes/No - Run design day simulations",
+    "Run_Simulation_for_Weather_File_Run_Periods": "Yes/No - Run annual weather file simulation",
+    "Do_HVAC_Sizing_Simulation_for_Sizing_Periods": "Yes/No - Run HVAC sizing simulations",
+    "Maximum_Number_of_HVAC_Sizing_Simulation_Passes": "Integer - Max number of sizing passes (typically 1-3)"
+}
+
+_RUN_PERIOD_FIELD_DESCRIPTIONS = {
+    "Name": "String - Name of the run period",
+    "Begin_Month": "Integer 1-12 - Starting month",
+    "Begin_Day_of_Month": "Integer 1-31 - Starting day",
+    "Begin_Year": "Integer - Starting year (optional)",
+    "End_Month": "Integer 1-12 - Ending month",
+    "End_Day_of_Month": "Integer 1-31 - Ending day",
+    "End_Year": "Integer - Ending year (optional)",
+    "Day_of_Week_for_Start_Day": "String - Monday/Tuesday/etc or UseWeatherFile",
+    "Use_Weather_File_Holidays_and_Special_Days": "Yes/No",
+    "Use_Weather_File_Daylight_Saving_Period": "Yes/No",
+    "Apply_Weekend_Holiday_Rule": "Yes/No",
+    "Use_Weather_File_Rain_Indicators": "Yes/No",
+    "Use_Weather_File_Snow_Indicators": "Yes/No"
+}
+
+# Fields modify_simulation_settings accepts for each object type
+_SIMULATION_CONTROL_FIELDS = frozenset(_SIMULATION_CONTROL_FIELD_DESCRIPTIONS)
+_RUN_PERIOD_FIELDS = frozenset(_RUN_PERIOD_FIELD_DESCRIPTIONS)
+
+# Objects validate_idf requires in every model
+_REQUIRED_OBJECTS = ("Building", "Zone", "SimulationControl")
+
+# Report objects whose .eso/.mtr output ReadVarsESO turns into CSV files
+_READVARS_OUTPUT_OBJECTS = (
+    "Output:Variable",
+    "Output:Meter",
+    "Output:Meter:MeterFileOnly",
+    "Output:Meter:Cumulative",
+    "Output:Meter:Cumulative:MeterFileOnly",
+)
+
+# Output CSV files create_interactive_plot tries for each file_type, in order: (name suffix, data type)
+_PLOT_FILE_CANDIDATES = {
+    "auto": (("Meter.csv", "Meter"), (".csv", "Variable")),
+    "meter": (("Meter.csv", "Meter"),),
+    "variable": ((".csv", "Variable"),),
+}
+
+# Loop object types get_loop_topology searches, in lookup order
+_LOOP_TYPES = ("PlantLoop", "CondenserLoop", "AirLoopHVAC")
+
+# Supply-side field names for each water loop type (inlet node, outlet node, branch list, connector list)
+_SUPPLY_SIDE_LOOP_FIELDS = {
+    "PlantLoop": ("Plant_Side_Inlet_Node_Name", "Plant_Side_Outlet_Node_Name",
+                  "Plant_Side_Branch_List_Name", "Plant_Side_Connector_List_Name"),
+    "CondenserLoop": ("Condenser_Side_Inlet_Node_Name", "Condenser_Side_Outlet_Node_Name",
+                      "Condenser_Side_Branch_List_Name", "Condenser_Side_Connector_List_Name"),
+}
+
+# Schedule object types inspect_schedules reports, grouped the way the inventory is
+_DAY_SCHEDULE_TYPES = ("Schedule:Day:Hourly", "Schedule:Day:Interval", "Schedule:Day:List")
+_WEEK_SCHEDULE_TYPES = ("Schedule:Week:Daily", "Schedule:Week:Compact")
+_ANNUAL_SCHEDULE_TYPES = ("Schedule:Year", "Schedule:Compact", "Schedule:Constant", "Schedule:File")
+_SCHEDULE_OBJECT_TYPES = (("ScheduleTypeLimits",) + _DAY_SCHEDULE_TYPES + _WEEK_SCHEDULE_TYPES
+                          + _ANNUAL_SCHEDULE_TYPES + ("Schedule:File:Shading",))
+
+# Annual schedule types whose values ScheduleValueParser can extract
+_VALUE_PARSED_ANNUAL_SCHEDULE_TYPES = frozenset({"Schedule:Compact", "Schedule:Constant"})
+
+# Day types referenced by Schedule:Week:Daily (<day type>_Schedule_Day_Name fields)
+_WEEK_SCHEDULE_DAY_TYPES = ('Sunday', 'Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday',
+                            'Holiday', 'SummerDesignDay', 'WinterDesignDay', 'CustomDay1', 'CustomDay2')
+
+# Zone equipment types that can be connected to air loop zone splitter outlet nodes
+_ZONE_EQUIPMENT_TYPES = (
+    "AirTerminal:SingleDuct:Uncontrolled",
+    "AirTerminal:SingleDuct:VAV:Reheat",
+    "AirTerminal:SingleDuct:VAV:NoReheat",
+    "AirTerminal:SingleDuct:ConstantVolume:Reheat",
+    "AirTerminal:SingleDuct:ConstantVolume:NoReheat",
+    "AirTerminal:DualDuct:VAV",
+    "AirTerminal:DualDuct:ConstantVolume",
+    "ZoneHVAC:Baseboard:Convective:Electric",
+    "ZoneHVAC:Baseboard:Convective:Water",
+    "ZoneHVAC:PackagedTerminalAirConditioner",
+    "ZoneHVAC:PackagedTerminalHeatPump",
+    "ZoneHVAC:WindowAirConditioner",
+    "ZoneHVAC:UnitHeater",
+    "ZoneHVAC:UnitVentilator",
+    "ZoneHVAC:EnergyRecoveryVentilator",
+    "ZoneHVAC:FourPipeFanCoil",
+    "ZoneHVAC:IdealLoadsAirSystem",
+)
+
 
 class EnergyPlusManager:
     """Manager class for EnergyPlus operations using eppy with configuration management"""
@@ -62,9 +178,131 @@ class EnergyPlusManager:
         self.lights_manager = LightsManager()
         self.electric_equipment_manager = ElectricEquipmentManager()
         
+        # Read-only results keyed by (resolved path, mtime_ns, size) so edits to the file invalidate them
+        self._zone_list_cache = functools.lru_cache(maxsize=128)(self._build_zone_list)
+        self._validation_cache = functools.lru_cache(maxsize=64)(self._build_validation)
+        self._model_basics_cache = functools.lru_cache(maxsize=64)(self._build_model_basics)
+        self._surfaces_cache = functools.lru_cache(maxsize=64)(self._build_surfaces)
+        self._materials_cache = functools.lru_cache(maxsize=64)(self._build_materials)
+        
+        # Results of file-producing operations (model modifications, loop diagrams) keyed by operation,
+        # input file version and parameters, so an identical re-run can reuse the file it already wrote
+        self._modification_results: Dict[tuple, tuple] = {}
+        self._modification_lock = threading.Lock()
+        
+        # Fuzzy weather file matches (e.g. a city name) keyed by (name, config version, weather
+        # directory mtimes); matching scans the weather directories, direct lookups stay uncached
+        self._weather_match_cache = functools.lru_cache(maxsize=256)(self._match_weather_file)
+        
         logger.info(f"EnergyPlus Manager initialized with IDD: {self.config.energyplus.idd_path}")
     
 
+    def _cached_file_result(self, cache, resolved_path: str) -> Any:
+        """Look up a per-file result cache using the file's current mtime and size"""
+        stat_result = os.stat(resolved_path)
+        return cache(resolved_path, stat_result.st_mtime_ns, stat_result.st_size)
+    
+
+    def _load_idf(self, resolved_path: str) -> IDF:
+        """
+        Return the parsed IDF for read-only use, reusing the previous parse while the file is unchanged
+        
+        The returned object is shared between calls. Tools that modify a model must parse
+        their own copy with parse_idf instead.
+        """
+        return get_idf(resolved_path)
+    
+
+    def invalidate_cached_results(self) -> None:
+        """Drop all cached read-only results; called after a tool writes an IDF file"""
+        clear_idf_cache()
+        self._zone_list_cache.cache_clear()
+        self._validation_cache.cache_clear()
+        self._model_basics_cache.cache_clear()
+        self._surfaces_cache.cache_clear()
+        self._materials_cache.cache_clear()
+    
+
+    def get_cache_stats(self) -> Dict[str, Dict[str, int]]:
+        """Hit/miss counters and sizes of the read-only result caches"""
+        caches = {
+            "parsed_idf": idf_cache_info(),
+            "validation": self._validation_cache.cache_info(),
+            "model_basics": self._model_basics_cache.cache_info(),
+            "zones": self._zone_list_cache.cache_info(),
+            "surfaces": self._surfaces_cache.cache_info(),
+            "materials": self._materials_cache.cache_info(),
+        }
+        stats = {name: info._asdict() for name, info in caches.items()}
+        stats["weather_matches"] = self._weather_match_cache.cache_info()._asdict()
+        stats["modification_results"] = {"currsize": len(self._modification_results)}
+        return stats
+    
+
+    def _modification_cache_key(self, operation: str, resolved_path: str, params: Dict[str, Any]) -> tuple:
+        """Build the modification result cache key for an operation on the current input file"""
+        stat_result = os.stat(resolved_path)
+        params_key = json.dumps(params, sort_keys=True, default=str)
+        return (operation, resolved_path, stat_result.st_mtime_ns, stat_result.st_size, params_key)
+    
+
+    def _get_cached_modification(self, cache_key: tuple, output_path: str) -> Optional[str]:
+        """
+        Return the result of an identical earlier run of an operation, or None
+        
+        The file that run wrote must still be exactly as it was written. If the earlier run
+        wrote to a different path, the file is copied to output_path. The returned result is
+        marked with "reused_result" (and "copied_from" when the file was copied).
+        """
+        with self._modification_lock:
+            cached = self._modification_results.get(cache_key)
+        if cached is None:
+            return None
+        
+        requested_path, output_file, output_signature, result = cached
+        try:
+            stat_result = os.stat(output_file)
+        except OSError:
+            return None
+        
+        if (stat_result.st_mtime_ns, stat_result.st_size) != output_signature:
+            return None
+        
+        result = dict(result, reused_result=True)
+        if os.path.abspath(output_path) != os.path.abspath(requested_path):
+            try:
+                shutil.copyfile(output_file, output_path)
+            except OSError:
+                # Let the operation run normally and report the problem with the output path
+                return None
+            self.invalidate_cached_results()
+            result["output_file"] = output_path
+            result["copied_from"] = output_file
+        return _dumps(result, pretty=True)
+    
+
+    def _remember_modification(self, cache_key: tuple, output_path: str, result: Dict[str, Any],
+                               output_file: Optional[str] = None) -> None:
+        """
+        Record a modification result together with the signature of the file it wrote
+        
+        Args:
+            cache_key: Key from _modification_cache_key
+            output_path: Output path the operation was asked to write
+            result: Result dictionary returned by the operation
+            output_file: File actually written, if it differs from output_path
+        """
+        output_file = output_file or output_path
+        stat_result = os.stat(output_file)
+        entry = (output_path, output_file, (stat_result.st_mtime_ns, stat_result.st_size), result)
+        
+        with self._modification_lock:
+            if cache_key not in self._modification_results and len(self._modification_results) >= 128:
+                # Evict the oldest entry (dicts keep insertion order)
+                self._modification_results.pop(next(iter(self._modification_results)))
+            self._modification_results[cache_key] = entry
+    
+
     def _initialize_eppy(self):
         """Initialize eppy with the IDD file from configuration"""
         idd_path = self.config.energyplus.idd_path
@@ -77,14 +315,13 @@ class EnergyPlusManager:
         
         try:
             eppy.modeleditor.IDF.setiddname(idd_path)
-            logger.debug(f"Eppy initialized with IDD: {idd_path}")
+            logger.debug("Eppy initialized with IDD: %s", idd_path)
         except Exception as e:
             raise RuntimeError(f"Failed to initialize eppy with IDD {idd_path}: {e}")
     
 
     def _resolve_idf_path(self, idf_path: str) -> str:
         """Resolve IDF path (handle relative paths, sample files, example files, etc.)"""
-        from .utils.path_utils import resolve_path
         return resolve_path(self.config, idf_path, file_types=['.idf'], description="IDF file")
         
     
@@ -94,7 +331,7 @@ class EnergyPlusManager:
         
         try:
             logger.info(f"Loading IDF file: {resolved_path}")
-            idf = IDF(resolved_path)
+            idf = self._load_idf(resolved_path)
             
             # Get basic counts
             building_count = len(idf.idfobjects.get("Building", []))
@@ -123,107 +360,62 @@ class EnergyPlusManager:
             raise RuntimeError(f"Error loading IDF file: {str(e)}")
     
 
-    def list_available_files(self, include_example_files: bool = False, include_weather_data: bool = False) -> str:
+    def list_available_files(self, include_example_files: bool = False, include_weather_data: bool = False,
+                             limit: Optional[int] = None) -> str:
         """List available files in specified directories
         
         Args:
             include_example_files: Whether to include EnergyPlus example files directory
             include_weather_data: Whether to include EnergyPlus weather data directory
+            limit: Maximum number of files to list per directory (default: None, no limit).
+                   A directory with more files lists the first ones by name and is marked "truncated"
             
         Returns:
             JSON string with available files organized by source and type
+            
+        Raises:
+            ValueError: If limit is negative
         """
+        return _dumps(self.list_available_files_dict(include_example_files, include_weather_data, limit), pretty=True)
+
+
+    def list_available_files_dict(self, include_example_files: bool = False, include_weather_data: bool = False,
+                                  limit: Optional[int] = None) -> Dict[str, Any]:
+        """Same as list_available_files, but returns the listing as a dictionary"""
+        if limit is not None and limit < 0:
+            raise ValueError(f"limit must be zero or positive, got {limit}")
+        
         try:
-            sample_path = Path(self.config.paths.sample_files_path)
-            logger.debug(f"Listing files in sample_files: {sample_path}")
-            
-            files = {
-                "sample_files": {
-                    "path": str(sample_path),
-                    "available": sample_path.exists(),
-                    "IDF files": [],
-                    "Weather files": [],
-                    "Other files": []
-                }
-            }
-            
-            # Always process sample files directory
-            if sample_path.exists():
-                for file_path in sample_path.iterdir():
-                    if file_path.is_file():
-                        file_info = {
-                            "name": file_path.name,
-                            "size_bytes": file_path.stat().st_size,
-                            "modified": file_path.stat().st_mtime,
-                            "source": "sample_files"
-                        }
-                        
-                        if file_path.suffix.lower() == '.idf':
-                            files["sample_files"]["IDF files"].append(file_info)
-                        elif file_path.suffix.lower() == '.epw':
-                            files["sample_files"]["Weather files"].append(file_info)
-                        else:
-                            files["sample_files"]["Other files"].append(file_info)
-            
-            # Conditionally process example files directory
+            sources = [("sample_files", self.config.paths.sample_files_path)]
             if include_example_files:
-                example_path = Path(self.config.energyplus.example_files_path)
-                logger.debug(f"Listing files in example_files: {example_path}")
-                
-                files["example_files"] = {
-                    "path": str(example_path),
-                    "available": example_path.exists(),
-                    "IDF files": [],
-                    "Weather files": [],
-                    "Other files": []
-                }
-                
-                if example_path.exists():
-                    for file_path in example_path.iterdir():
-                        if file_path.is_file():
-                            file_info = {
-                                "name": file_path.name,
-                                "size_bytes": file_path.stat().st_size,
-                                "modified": file_path.stat().st_mtime,
-                                "source": "example_files"
-                            }
-                            
-                            if file_path.suffix.lower() == '.idf':
-                                files["example_files"]["IDF files"].append(file_info)
-                            elif file_path.suffix.lower() == '.epw':
-                                files["example_files"]["Weather files"].append(file_info)
-                            else:
-                                files["example_files"]["Other files"].append(file_info)
-            
-            # Conditionally process weather data directory
+                sources.append(("example_files", self.config.energyplus.example_files_path))
             if include_weather_data:
-                weather_path = Path(self.config.energyplus.weather_data_path)
-                logger.debug(f"Listing files in weather_data: {weather_path}")
-                
-                files["weather_data"] = {
-                    "path": str(weather_path),
-                    "available": weather_path.exists(),
+                sources.append(("weather_data", self.config.energyplus.weather_data_path))
+            
+            files = {}
+            for source, directory in sources:
+                logger.debug(f"Listing files in {source}: {directory}")
+                source_files = {
+                    "path": str(Path(directory)),
+                    "available": os.path.exists(directory),
                     "IDF files": [],
                     "Weather files": [],
                     "Other files": []
                 }
+                files[source] = source_files
                 
-                if weather_path.exists():
-                    for file_path in weather_path.iterdir():
-                        if file_path.is_file():
-                            file_info = {
-                                "name": file_path.name,
-                                "size_bytes": file_path.stat().st_size,
-                                "modified": file_path.stat().st_mtime,
-                                "source": "weather_data"
-                            }
-                            
-                            if file_path.suffix.lower() == '.idf':
-                                files["weather_data"]["IDF files"].append(file_info)
-                            elif file_path.suffix.lower() == '.epw':
-                                files["weather_data"]["Weather files"].append(file_info)
-                            else:
-                                files["weather_data"]["Other files"].append(file_info)
+                if source_files["available"]:
+                    if limit is None:
+                        listed = self.iter_available_files(directory, source)
+                    else:
+                        # Pick the first files by name before any stat call, so a limited listing is
+                        # deterministic and only the files it keeps are statted
+                        entries = self._first_file_entries(directory, limit + 1)
+                        if len(entries) > limit:
+                            source_files["truncated"] = True
+                        listed = (self._categorize_file(entry, source) for entry in entries[:limit])
+                    for category, file_info in listed:
+                        source_files[category].append(file_info)
             
             # Sort files by name in each category for each source
             for source_key in files.keys():
@@ -238,13 +430,54 @@ class EnergyPlusManager:
                 total_counts[source_key] = {"IDF": total_idf, "Weather": total_weather}
                 logger.debug(f"Found {total_idf} IDF files, {total_weather} weather files in {source_key}")
             
-            return json.dumps(files, indent=2)
+            return files
             
         except Exception as e:
             logger.error(f"Error listing available files: {e}")
             raise RuntimeError(f"Error listing available files: {str(e)}")
     
 
+    def iter_available_files(self, directory: str, source: str):
+        """
+        Yield (category, file_info) pairs for the files directly inside a directory
+        
+        Uses os.scandir so directory entries are typed without an extra stat call,
+        and stats each regular file once for its size and modification time.
+        
+        Args:
+            directory: Directory to scan
+            source: Source label stored in each file_info entry
+        """
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if entry.is_file():
+                    yield self._categorize_file(entry, source)
+    
+
+    def _first_file_entries(self, directory: str, count: int) -> List[os.DirEntry]:
+        """Return the first `count` regular files in a directory by name, without stat calls"""
+        with os.scandir(directory) as entries:
+            return heapq.nsmallest(count, (entry for entry in entries if entry.is_file()), key=lambda entry: entry.name)
+    
+
+    def _categorize_file(self, entry: os.DirEntry, source: str) -> tuple:
+        """Stat a directory entry once and return its (category, file_info) pair"""
+        stat_result = entry.stat()
+        file_info = {
+            "name": entry.name,
+            "size_bytes": stat_result.st_size,
+            "modified": stat_result.st_mtime,
+            "source": source
+        }
+        
+        suffix = os.path.splitext(entry.name)[1].lower()
+        if suffix == '.idf':
+            return "IDF files", file_info
+        elif suffix == '.epw':
+            return "Weather files", file_info
+        return "Other files", file_info
+    
+
     def copy_file(self, source_path: str, target_path: str, overwrite: bool = False, file_types: List[str] = None) -> str:
         """
         Copy a file from source to target location with fuzzy path resolution
@@ -303,18 +536,21 @@ class EnergyPlusManager:
             source_size = source_stat.st_size
             source_mtime = source_stat.st_mtime
             
-            # Perform the copy
+            # Perform the copy (shutil uses os.sendfile on Linux, so the data never passes
+            # through Python; a hardlink is not safe because later edits save in place)
             import shutil
             start_time = datetime.now()
             shutil.copy2(resolved_source_path, resolved_target_path)
+            self.invalidate_cached_results()
             end_time = datetime.now()
             copy_duration = end_time - start_time
             
-            # Verify the copy
-            if not os.path.exists(resolved_target_path):
+            # Verify the copy (a single stat both confirms the target exists and gives its size)
+            try:
+                target_stat = os.stat(resolved_target_path)
+            except FileNotFoundError:
                 raise RuntimeError("Copy operation failed - target file not found after copy")
             
-            target_stat = os.stat(resolved_target_path)
             target_size = target_stat.st_size
             
             if source_size != target_size:
@@ -326,7 +562,7 @@ class EnergyPlusManager:
             
             if file_types and '.idf' in file_types:
                 try:
-                    idf = IDF(resolved_target_path)
+                    idf = parse_idf(resolved_target_path)
                     validation_message = "IDF file loads successfully"
                 except Exception as e:
                     validation_passed = False
@@ -357,7 +593,7 @@ class EnergyPlusManager:
             }
             
             logger.info(f"Successfully copied file: {resolved_source_path} -> {resolved_target_path}")
-            return json.dumps(result, indent=2)
+            return _dumps(result, pretty=True)
             
         except FileNotFoundError as e:
             logger.warning(f"Source file not found: {source_path}")
@@ -368,53 +604,53 @@ class EnergyPlusManager:
                 resolver = PathResolver(self.config)
                 suggestions = resolver.suggest_similar_paths(source_path, file_types)
                 
-                return json.dumps({
+                return _dumps({
                     "success": False,
                     "error": "File not found",
                     "message": str(e),
                     "source_path": source_path,
                     "suggestions": suggestions[:5] if suggestions else [],
                     "timestamp": datetime.now().isoformat()
-                }, indent=2)
+                }, pretty=True)
             except Exception:
-                return json.dumps({
+                return _dumps({
                     "success": False,
                     "error": "File not found",
                     "message": str(e),
                     "source_path": source_path,
                     "timestamp": datetime.now().isoformat()
-                }, indent=2)
+                }, pretty=True)
         
         except FileExistsError as e:
             logger.warning(f"Target file already exists: {target_path}")
-            return json.dumps({
+            return _dumps({
                 "success": False,
                 "error": "File already exists",
                 "message": str(e),
                 "target_path": target_path,
                 "suggestion": "Use overwrite=True to replace existing file",
                 "timestamp": datetime.now().isoformat()
-            }, indent=2)
+            }, pretty=True)
         
         except PermissionError as e:
             logger.error(f"Permission error during copy: {e}")
-            return json.dumps({
+            return _dumps({
                 "success": False,
                 "error": "Permission denied",
                 "message": str(e),
                 "timestamp": datetime.now().isoformat()
-            }, indent=2)
+            }, pretty=True)
         
         except Exception as e:
             logger.error(f"Error copying file from {source_path} to {target_path}: {e}")
-            return json.dumps({
+            return _dumps({
                 "success": False,
                 "error": "Copy operation failed",
                 "message": str(e),
                 "source_path": source_path,
                 "target_path": target_path,
                 "timestamp": datetime.now().isoformat()
-            }, indent=2)
+            }, pretty=True)
 
 
     def get_configuration_info(self) -> str:
@@ -451,7 +687,7 @@ class EnergyPlusManager:
                 "debug_mode": self.config.debug_mode
             }
             
-            return json.dumps(config_info, indent=2)
+            return _dumps(config_info, pretty=True)
             
         except Exception as e:
             logger.error(f"Error getting configuration info: {e}")
@@ -461,10 +697,14 @@ class EnergyPlusManager:
     def validate_idf(self, idf_path: str) -> str:
         """Validate an IDF file and return any issues found"""
         resolved_path = self._resolve_idf_path(idf_path)
-        
+        return self._cached_file_result(self._validation_cache, resolved_path)
+    
+
+    def _build_validation(self, resolved_path: str, mtime_ns: int, size: int) -> str:
+        """Build the validate_idf JSON for a resolved path (mtime_ns and size only key the cache)"""
         try:
             logger.debug(f"Validating IDF file: {resolved_path}")
-            idf = IDF(resolved_path)
+            idf = self._load_idf(resolved_path)
             
             validation_results = {
                 "file_path": resolved_path,
@@ -479,8 +719,7 @@ class EnergyPlusManager:
             errors = []
             
             # Check for required objects
-            required_objects = ["Building", "Zone", "SimulationControl"]
-            for obj_type in required_objects:
+            for obj_type in _REQUIRED_OBJECTS:
                 objs = idf.idfobjects.get(obj_type, [])
                 if not objs:
                     errors.append(f"Missing required object type: {obj_type}")
@@ -528,7 +767,7 @@ class EnergyPlusManager:
             }
             
             logger.debug(f"Validation completed: {len(errors)} errors, {len(warnings)} warnings")
-            return json.dumps(validation_results, indent=2)
+            return _dumps(validation_results, pretty=True)
             
         except Exception as e:
             logger.error(f"Error validating IDF file {resolved_path}: {e}")
@@ -538,10 +777,14 @@ class EnergyPlusManager:
     def get_model_basics(self, idf_path: str) -> str:
         """Get basic model information from Building, Site:Location, and SimulationControl"""
         resolved_path = self._resolve_idf_path(idf_path)
-        
+        return self._cached_file_result(self._model_basics_cache, resolved_path)
+    
+
+    def _build_model_basics(self, resolved_path: str, mtime_ns: int, size: int) -> str:
+        """Build the get_model_basics JSON for a resolved path (mtime_ns and size only key the cache)"""
         try:
             logger.debug(f"Getting model basics for: {resolved_path}")
-            idf = IDF(resolved_path)
+            idf = self._load_idf(resolved_path)
             basics = {}
             
             # Building information
@@ -594,7 +837,7 @@ class EnergyPlusManager:
                 }
             
             logger.debug(f"Model basics extracted for {len(basics)} sections")
-            return json.dumps(basics, indent=2)
+            return _dumps(basics, pretty=True)
             
         except Exception as e:
             logger.error(f"Error getting model basics for {resolved_path}: {e}")
@@ -607,39 +850,17 @@ class EnergyPlusManager:
         
         try:
             logger.debug(f"Checking simulation settings for: {resolved_path}")
-            idf = IDF(resolved_path)
+            idf = self._load_idf(resolved_path)
             
             settings_info = {
                 "file_path": resolved_path,
                 "SimulationControl": {
                     "current_values": {},
-                    "modifiable_fields": {
-                        "Do_Zone_Sizing_Calculation": "Yes/No - Controls zone sizing calculations",
-                        "Do_System_Sizing_Calculation": "Yes/No - Controls system sizing calculations", 
-                        "Do_Plant_Sizing_Calculation": "Yes/No - Controls plant sizing calculations",
-                        "Run_Simulation_for_Sizing_Periods": "Yes/No - Run design day simulations",
-                        "Run_Simulation_for_Weather_File_Run_Periods": "Yes/No - Run annual weather file simulation",
-                        "Do_HVAC_Sizing_Simulation_for_Sizing_Periods": "Yes/No - Run HVAC sizing simulations",
-                        "Maximum_Number_of_HVAC_Sizing_Simulation_Passes": "Integer - Max number of sizing passes (typically 1-3)"
-                    }
+                    "modifiable_fields": _SIMULATION_CONTROL_FIELD_DESCRIPTIONS
                 },
                 "RunPeriod": {
                     "current_values": [],
-                    "modifiable_fields": {
-                        "Name": "String - Name of the run period",
-                        "Begin_Month": "Integer 1-12 - Starting month",
-                        "Begin_Day_of_Month": "Integer 1-31 - Starting day", 
-                        "Begin_Year": "Integer - Starting year (optional)",
-                        "End_Month": "Integer 1-12 - Ending month",
-                        "End_Day_of_Month": "Integer 1-31 - Ending day",
-                        "End_Year": "Integer - Ending year (optional)",
-                        "Day_of_Week_for_Start_Day": "String - Monday/Tuesday/etc or UseWeatherFile",
-                        "Use_Weather_File_Holidays_and_Special_Days": "Yes/No",
-                        "Use_Weather_File_Daylight_Saving_Period": "Yes/No",
-                        "Apply_Weekend_Holiday_Rule": "Yes/No",
-                        "Use_Weather_File_Rain_Indicators": "Yes/No",
-                        "Use_Weather_File_Snow_Indicators": "Yes/No"
-                    }
+                    "modifiable_fields": _RUN_PERIOD_FIELD_DESCRIPTIONS
                 }
             }
             
@@ -684,7 +905,7 @@ class EnergyPlusManager:
                 settings_info["RunPeriod"]["error"] = "No RunPeriod objects found"
             
             logger.debug(f"Found {len(sim_objs)} SimulationControl and {len(run_objs)} RunPeriod objects")
-            return json.dumps(settings_info, indent=2)
+            return _dumps(settings_info, pretty=True)
             
         except Exception as e:
             logger.error(f"Error checking simulation settings for {resolved_path}: {e}")
@@ -694,10 +915,14 @@ class EnergyPlusManager:
     def list_zones(self, idf_path: str) -> str:
         """List all zones in the model"""
         resolved_path = self._resolve_idf_path(idf_path)
-        
+        return self._cached_file_result(self._zone_list_cache, resolved_path)
+    
+
+    def _build_zone_list(self, resolved_path: str, mtime_ns: int, size: int) -> str:
+        """Build the list_zones JSON for a resolved path (mtime_ns and size only key the cache)"""
         try:
             logger.debug(f"Listing zones for: {resolved_path}")
-            idf = IDF(resolved_path)
+            idf = self._load_idf(resolved_path)
             zones = idf.idfobjects.get("Zone", [])
             
             zone_info = []
@@ -717,7 +942,7 @@ class EnergyPlusManager:
                 zone_info.append(zone_data)
             
             logger.debug(f"Found {len(zone_info)} zones")
-            return json.dumps(zone_info, indent=2)
+            return _dumps(zone_info, pretty=True)
             
         except Exception as e:
             logger.error(f"Error listing zones for {resolved_path}: {e}")
@@ -727,10 +952,14 @@ class EnergyPlusManager:
     def get_surfaces(self, idf_path: str) -> str:
         """Get detailed surface information"""
         resolved_path = self._resolve_idf_path(idf_path)
-        
+        return self._cached_file_result(self._surfaces_cache, resolved_path)
+    
+
+    def _build_surfaces(self, resolved_path: str, mtime_ns: int, size: int) -> str:
+        """Build the get_surfaces JSON for a resolved path (mtime_ns and size only key the cache)"""
         try:
             logger.debug(f"Getting surfaces for: {resolved_path}")
-            idf = IDF(resolved_path)
+            idf = self._load_idf(resolved_path)
             surfaces = idf.idfobjects.get("BuildingSurface:Detailed", [])
             
             surface_info = []
@@ -749,7 +978,7 @@ class EnergyPlusManager:
                 surface_info.append(surface_data)
             
             logger.debug(f"Found {len(surface_info)} surfaces")
-            return json.dumps(surface_info, indent=2)
+            return _dumps(surface_info, pretty=True)
             
         except Exception as e:
             logger.error(f"Error getting surfaces for {resolved_path}: {e}")
@@ -759,10 +988,14 @@ class EnergyPlusManager:
     def get_materials(self, idf_path: str) -> str:
         """Get material information"""
         resolved_path = self._resolve_idf_path(idf_path)
-        
+        return self._cached_file_result(self._materials_cache, resolved_path)
+    
+
+    def _build_materials(self, resolved_path: str, mtime_ns: int, size: int) -> str:
+        """Build the get_materials JSON for a resolved path (mtime_ns and size only key the cache)"""
         try:
             logger.debug(f"Getting materials for: {resolved_path}")
-            idf = IDF(resolved_path)
+            idf = self._load_idf(resolved_path)
             
             materials = []
             
@@ -795,7 +1028,7 @@ class EnergyPlusManager:
                 materials.append(material_data)
             
             logger.debug(f"Found {len(materials)} materials")
-            return json.dumps(materials, indent=2)
+            return _dumps(materials, pretty=True)
             
         except Exception as e:
             logger.error(f"Error getting materials for {resolved_path}: {e}")
@@ -820,7 +1053,7 @@ class EnergyPlusManager:
             
             if result["success"]:
                 logger.info(f"Found {result['total_people_objects']} People objects")
-                return json.dumps(result, indent=2)
+                return _dumps(result, pretty=True)
             else:
                 raise RuntimeError(result.get("error", "Unknown error"))
                 
@@ -852,11 +1085,11 @@ class EnergyPlusManager:
             # Validate modifications first
             validation = self.people_manager.validate_people_modifications(modifications)
             if not validation["valid"]:
-                return json.dumps({
+                return _dumps({
                     "success": False,
                     "validation_errors": validation["errors"],
                     "input_file": resolved_path
-                }, indent=2)
+                }, pretty=True)
             
             # Determine output path
             if output_path is None:
@@ -867,10 +1100,11 @@ class EnergyPlusManager:
             result = self.people_manager.modify_people_objects(
                 resolved_path, modifications, output_path
             )
+            self.invalidate_cached_results()
             
             if result["success"]:
                 logger.info(f"Successfully modified People objects and saved to: {output_path}")
-                return json.dumps(result, indent=2)
+                return _dumps(result, pretty=True)
             else:
                 raise RuntimeError(result.get("error", "Unknown error"))
                 
@@ -897,7 +1131,7 @@ class EnergyPlusManager:
             
             if result["success"]:
                 logger.info(f"Found {result['total_lights_objects']} Lights objects")
-                return json.dumps(result, indent=2)
+                return _dumps(result, pretty=True)
             else:
                 raise RuntimeError(result.get("error", "Unknown error"))
                 
@@ -929,11 +1163,11 @@ class EnergyPlusManager:
             # Validate modifications first
             validation = self.lights_manager.validate_lights_modifications(modifications)
             if not validation["valid"]:
-                return json.dumps({
+                return _dumps({
                     "success": False,
                     "validation_errors": validation["errors"],
                     "input_file": resolved_path
-                }, indent=2)
+                }, pretty=True)
             
             # Determine output path
             if output_path is None:
@@ -944,10 +1178,11 @@ class EnergyPlusManager:
             result = self.lights_manager.modify_lights_objects(
                 resolved_path, modifications, output_path
             )
+            self.invalidate_cached_results()
             
             if result["success"]:
                 logger.info(f"Successfully modified Lights objects and saved to: {output_path}")
-                return json.dumps(result, indent=2)
+                return _dumps(result, pretty=True)
             else:
                 raise RuntimeError(result.get("error", "Unknown error"))
                 
@@ -974,7 +1209,7 @@ class EnergyPlusManager:
             
             if result["success"]:
                 logger.info(f"Found {result['total_electric_equipment_objects']} ElectricEquipment objects")
-                return json.dumps(result, indent=2)
+                return _dumps(result, pretty=True)
             else:
                 raise RuntimeError(result.get("error", "Unknown error"))
                 
@@ -1006,11 +1241,11 @@ class EnergyPlusManager:
             # Validate modifications first
             validation = self.electric_equipment_manager.validate_electric_equipment_modifications(modifications)
             if not validation["valid"]:
-                return json.dumps({
+                return _dumps({
                     "success": False,
                     "validation_errors": validation["errors"],
                     "input_file": resolved_path
-                }, indent=2)
+                }, pretty=True)
             
             # Determine output path
             if output_path is None:
@@ -1021,10 +1256,11 @@ class EnergyPlusManager:
             result = self.electric_equipment_manager.modify_electric_equipment_objects(
                 resolved_path, modifications, output_path
             )
+            self.invalidate_cached_results()
             
             if result["success"]:
                 logger.info(f"Successfully modified ElectricEquipment objects and saved to: {output_path}")
-                return json.dumps(result, indent=2)
+                return _dumps(result, pretty=True)
             else:
                 raise RuntimeError(result.get("error", "Unknown error"))
                 
@@ -1056,7 +1292,7 @@ class EnergyPlusManager:
                 logger.debug(f"Getting configured output variables for: {resolved_path}")
                 result = self.output_var_manager.get_configured_variables(resolved_path)
             
-            return json.dumps(result, indent=2)
+            return _dumps(result, pretty=True)
             
         except Exception as e:
             logger.error(f"Error getting output variables for {resolved_path}: {e}")
@@ -1110,6 +1346,7 @@ class EnergyPlusManager:
             addition_result = self.output_var_manager.add_variables_to_idf(
                 resolved_path, duplicate_report["new_variables"], output_path
             )
+            self.invalidate_cached_results()
             
             # Compile comprehensive result
             result = {
@@ -1145,16 +1382,16 @@ class EnergyPlusManager:
                 result["addition_error"] = addition_result.get("error", "Unknown error")
             
             logger.info(f"Successfully processed output variables: {addition_result['added_count']} added")
-            return json.dumps(result, indent=2)
+            return _dumps(result, pretty=True)
             
         except Exception as e:
             logger.error(f"Error in add_output_variables: {e}")
-            return json.dumps({
+            return _dumps({
                 "success": False,
                 "error": str(e),
                 "input_file": idf_path,
                 "timestamp": datetime.now().isoformat()
-            }, indent=2)
+            }, pretty=True)
 
     
     def add_output_meters(self, idf_path: str, meters: List, 
@@ -1225,6 +1462,7 @@ class EnergyPlusManager:
             addition_result = self.output_meter_manager.add_meters_to_idf(
                 resolved_path, duplicate_report["new_meters"], output_path
             )
+            self.invalidate_cached_results()
             
             # Compile comprehensive result
             result = {
@@ -1260,16 +1498,134 @@ class EnergyPlusManager:
                 result["addition_error"] = addition_result.get("error", "Unknown error")
             
             logger.info(f"Successfully processed output meters: {addition_result['added_count']} added")
-            return json.dumps(result, indent=2)
+            return _dumps(result, pretty=True)
             
         except Exception as e:
             logger.error(f"Error in add_output_meters: {e}")
-            return json.dumps({
+            return _dumps({
                 "success": False,
                 "error": str(e),
                 "input_file": idf_path,
                 "timestamp": datetime.now().isoformat()
-            }, indent=2)
+            }, pretty=True)
+
+
+    def add_outputs(self, idf_path: str, variables: Optional[List] = None, 
+                    meters: Optional[List] = None,
+                    validation_level: str = "moderate", 
+                    allow_duplicates: bool = False,
+                    output_path: Optional[str] = None) -> str:
+        """
+        Add output variables and output meters to an IDF file in a single load/save pass
+        
+        Equivalent to add_output_variables followed by add_output_meters on its output,
+        but the IDF is parsed and written only once.
+        
+        Args:
+            idf_path: Path to the input IDF file
+            variables: Variable specifications, in any format accepted by add_output_variables
+            meters: Meter specifications, in any format accepted by add_output_meters
+            validation_level: "strict", "moderate", or "lenient"
+            allow_duplicates: Whether to allow duplicate output specifications
+            output_path: Optional path for output file (auto-generated if None)
+        
+        Returns:
+            JSON string with operation results for variables and meters
+        """
+        variables = variables or []
+        meters = meters or []
+        
+        try:
+            logger.info(f"Adding {len(variables)} output variables and {len(meters)} output meters to {idf_path} "
+                        f"(validation: {validation_level})")
+            
+            # Resolve IDF path
+            resolved_path = self._resolve_idf_path(idf_path)
+            
+            # Resolve, validate and de-duplicate both kinds against the input file
+            resolved_variables = self.output_var_manager.auto_resolve_variable_specs(variables)
+            variable_validation = self.output_var_manager.validate_variable_specifications(
+                resolved_path, resolved_variables, validation_level
+            )
+            variable_duplicates = self.output_var_manager.check_duplicate_variables(
+                resolved_path,
+                [v["specification"] for v in variable_validation["valid_variables"]],
+                allow_duplicates
+            )
+            
+            resolved_meters = self.output_meter_manager.auto_resolve_meter_specs(meters)
+            meter_validation = self.output_meter_manager.validate_meter_specifications(
+                resolved_path, resolved_meters, validation_level
+            )
+            meter_duplicates = self.output_meter_manager.check_duplicate_meters(
+                resolved_path,
+                [m["specification"] for m in meter_validation["valid_meters"]],
+                allow_duplicates
+            )
+            
+            # Determine output path
+            if output_path is None:
+                path_obj = Path(resolved_path)
+                output_path = str(path_obj.parent / f"{path_obj.stem}_with_outputs{path_obj.suffix}")
+            
+            # Load once, add both kinds of objects, save once
+            idf = parse_idf(resolved_path)
+            added_variables = self.output_var_manager.append_variables(idf, variable_duplicates["new_variables"])
+            added_meters = self.output_meter_manager.append_meters(idf, meter_duplicates["new_meters"])
+            idf.save(output_path)
+            self.invalidate_cached_results()
+            
+            result = {
+                "success": True,
+                "input_file": resolved_path,
+                "output_file": output_path,
+                "validation_level": validation_level,
+                "allow_duplicates": allow_duplicates,
+                "variables": {
+                    "requested": len(variables),
+                    "resolved": len(resolved_variables),
+                    "added": len(added_variables),
+                    "skipped_duplicates": variable_duplicates["duplicates_found"],
+                    "validation_summary": {
+                        "total_valid": len(variable_validation["valid_variables"]),
+                        "total_invalid": len(variable_validation["invalid_variables"]),
+                        "warnings_count": len(variable_validation["warnings"])
+                    },
+                    "added_specifications": added_variables
+                },
+                "meters": {
+                    "requested": len(meters),
+                    "resolved": len(resolved_meters),
+                    "added": len(added_meters),
+                    "skipped_duplicates": meter_duplicates["duplicates_found"],
+                    "validation_summary": {
+                        "total_valid": len(meter_validation["valid_meters"]),
+                        "total_invalid": len(meter_validation["invalid_meters"]),
+                        "warnings_count": len(meter_validation["warnings"])
+                    },
+                    "added_specifications": added_meters
+                },
+                "timestamp": datetime.now().isoformat()
+            }
+            
+            # Include detailed validation info for strict mode or if there were errors
+            if validation_level == "strict" or variable_validation["invalid_variables"]:
+                result["variables"]["validation_details"] = variable_validation
+            if validation_level == "strict" or meter_validation["invalid_meters"]:
+                result["meters"]["validation_details"] = meter_validation
+            
+            logger.info(f"Successfully processed outputs: {len(added_variables)} variables, "
+                        f"{len(added_meters)} meters added")
+            return _dumps(result, pretty=True)
+            
+        except Exception as e:
+            logger.error(f"Error in add_outputs: {e}")
+            return _dumps({
+                "success": False,
+                "error": str(e),
+                "input_file": idf_path,
+                "timestamp": datetime.now().isoformat()
+            }, pretty=True)
 
     def get_output_meters(self, idf_path: str, discover_available: bool = False, run_days: int = 1) -> str:
         """
@@ -1296,13 +1652,48 @@ class EnergyPlusManager:
                 logger.debug(f"Getting configured output meters for: {resolved_path}")
                 result = self.output_meter_manager.get_configured_meters(resolved_path)
             
-            return json.dumps(result, indent=2)
+            return _dumps(result, pretty=True)
             
         except Exception as e:
             logger.error(f"Error getting output meters for {resolved_path}: {e}")
             raise RuntimeError(f"Error getting output meters: {str(e)}")
 
 
+    def get_outputs(self, idf_path: str, discover_available: bool = False, run_days: int = 1) -> str:
+        """
+        Get output variables and output meters together
+        
+        Args:
+            idf_path: Path to the IDF file
+            discover_available: If True, runs one short simulation to discover all available
+                              variables and meters. If False, returns the configured ones (default)
+            run_days: Number of days to run for discovery simulation (default: 1)
+        
+        Returns:
+            JSON string with "output_variables" and "output_meters" sections
+        """
+        resolved_path = self._resolve_idf_path(idf_path)
+        
+        try:
+            if discover_available:
+                logger.info(f"Discovering available outputs for: {resolved_path}")
+                result = self.output_meter_manager.discover_available_outputs(
+                    resolved_path, self.output_var_manager, run_days
+                )
+            else:
+                logger.debug(f"Getting configured outputs for: {resolved_path}")
+                result = {
+                    "output_variables": self.output_var_manager.get_configured_variables(resolved_path),
+                    "output_meters": self.output_meter_manager.get_configured_meters(resolved_path)
+                }
+            
+            return _dumps(result, pretty=True)
+            
+        except Exception as e:
+            logger.error(f"Error getting outputs for {resolved_path}: {e}")
+            raise RuntimeError(f"Error getting outputs: {str(e)}")
+
+
     # ----------------------- Schedule Inspector Module ------------------------
     def inspect_schedules(self, idf_path: str, include_values: bool = False) -> str:
         """
@@ -1319,22 +1710,7 @@ class EnergyPlusManager:
         
         try:
             logger.debug(f"Inspecting schedules for: {resolved_path} (include_values={include_values})")
-            idf = IDF(resolved_path)
-            
-            # Define all schedule object types to inspect
-            schedule_object_types = [
-                "ScheduleTypeLimits",
-                "Schedule:Day:Hourly", 
-                "Schedule:Day:Interval",
-                "Schedule:Day:List",
-                "Schedule:Week:Daily",
-                "Schedule:Week:Compact", 
-                "Schedule:Year",
-                "Schedule:Compact",
-                "Schedule:Constant",
-                "Schedule:File",
-                "Schedule:File:Shading"
-            ]
+            idf = self._load_idf(resolved_path)
             
             schedule_inventory = {
                 "file_path": resolved_path,
@@ -1367,8 +1743,7 @@ class EnergyPlusManager:
                 schedule_inventory["schedule_type_limits"].append(stl_info)
             
             # Inspect Day Schedules
-            day_schedule_types = ["Schedule:Day:Hourly", "Schedule:Day:Interval", "Schedule:Day:List"]
-            for day_type in day_schedule_types:
+            for day_type in _DAY_SCHEDULE_TYPES:
                 day_schedules = idf.idfobjects.get(day_type, [])
                 for day_sched in day_schedules:
                     day_info = {
@@ -1400,8 +1775,7 @@ class EnergyPlusManager:
                     schedule_inventory["day_schedules"].append(day_info)
             
             # Inspect Week Schedules  
-            week_schedule_types = ["Schedule:Week:Daily", "Schedule:Week:Compact"]
-            for week_type in week_schedule_types:
+            for week_type in _WEEK_SCHEDULE_TYPES:
                 week_schedules = idf.idfobjects.get(week_type, [])
                 for week_sched in week_schedules:
                     week_info = {
@@ -1411,10 +1785,8 @@ class EnergyPlusManager:
                     
                     if week_type == "Schedule:Week:Daily":
                         # Extract day schedule references
-                        day_types = ['Sunday', 'Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday',
-                                   'Holiday', 'SummerDesignDay', 'WinterDesignDay', 'CustomDay1', 'CustomDay2']
                         day_refs = {}
-                        for day_type in day_types:
+                        for day_type in _WEEK_SCHEDULE_DAY_TYPES:
                             field_name = f"{day_type}_Schedule_Day_Name"
                             day_refs[day_type] = getattr(week_sched, field_name, 'Not specified')
                         week_info["day_schedule_references"] = day_refs
@@ -1424,8 +1796,7 @@ class EnergyPlusManager:
                     schedule_inventory["week_schedules"].append(week_info)
             
             # Inspect Annual/Full Schedules
-            annual_schedule_types = ["Schedule:Year", "Schedule:Compact", "Schedule:Constant", "Schedule:File"]
-            for annual_type in annual_schedule_types:
+            for annual_type in _ANNUAL_SCHEDULE_TYPES:
                 annual_schedules = idf.idfobjects.get(annual_type, [])
                 for annual_sched in annual_schedules:
                     annual_info = {
@@ -1446,7 +1817,7 @@ class EnergyPlusManager:
                             annual_info["values"] = {"note": "Schedule:File value extraction skipped"}
                     
                     # Extract values if requested (for Schedule:Compact and Schedule:Constant)
-                    if include_values and annual_type in ["Schedule:Compact", "Schedule:Constant"]:
+                    if include_values and annual_type in _VALUE_PARSED_ANNUAL_SCHEDULE_TYPES:
                         try:
                             values = ScheduleValueParser.parse_schedule_values(annual_sched, annual_type)
                             if values:
@@ -1486,7 +1857,7 @@ class EnergyPlusManager:
                 "annual_schedules_count": len(schedule_inventory["annual_schedules"]),
                 "other_schedules_count": len(schedule_inventory["other_schedules"]),
                 "schedule_types_found": [
-                    obj_type for obj_type in schedule_object_types 
+                    obj_type for obj_type in _SCHEDULE_OBJECT_TYPES 
                     if len(idf.idfobjects.get(obj_type, [])) > 0
                 ]
             }
@@ -1516,7 +1887,7 @@ class EnergyPlusManager:
             
             logger.debug(f"Found {total_objects} schedule objects across {len(schedule_inventory['summary']['schedule_types_found'])} object types")
             logger.info(f"Schedule inspection for {resolved_path} completed successfully")
-            return json.dumps(schedule_inventory, indent=2)
+            return _dumps(schedule_inventory, pretty=True)
             
         except Exception as e:
             logger.error(f"Error inspecting schedules for {resolved_path}: {e}")
@@ -1528,11 +1899,20 @@ class EnergyPlusManager:
     # ------------------------ Loop Discovery and Topology ------------------------
     def discover_hvac_loops(self, idf_path: str) -> str:
         """Discover all HVAC loops (Plant, Condenser, Air) in the EnergyPlus model"""
-        resolved_path = self._resolve_idf_path(idf_path)
+        return _dumps(self.discover_hvac_loops_dict(idf_path), pretty=True)
+
+
+    def discover_hvac_loops_dict(self, idf_path: str, path_resolved: bool = False) -> Dict[str, Any]:
+        """
+        Same as discover_hvac_loops, but returns the loop inventory as a dictionary
+        
+        path_resolved=True skips path resolution for callers that already hold a resolved path.
+        """
+        resolved_path = idf_path if path_resolved else self._resolve_idf_path(idf_path)
         
         try:
             logger.debug(f"Discovering HVAC loops for: {resolved_path}")
-            idf = IDF(resolved_path)
+            idf = self._load_idf(resolved_path)
             
             hvac_info = {
                 "file_path": resolved_path,
@@ -1603,7 +1983,7 @@ class EnergyPlusManager:
             }
             
             logger.debug(f"Found {len(plant_loops)} plant loops, {len(condenser_loops)} condenser loops, {len(air_loops)} air loops")
-            return json.dumps(hvac_info, indent=2)
+            return hvac_info
             
         except Exception as e:
             logger.error(f"Error discovering HVAC loops for {resolved_path}: {e}")
@@ -1612,62 +1992,37 @@ class EnergyPlusManager:
 
     def get_loop_topology(self, idf_path: str, loop_name: str) -> str:
         """Get detailed topology information for a specific HVAC loop"""
-        resolved_path = self._resolve_idf_path(idf_path)
+        return _dumps(self.get_loop_topology_dict(idf_path, loop_name), pretty=True)
+
+
+    def get_loop_topology_dict(self, idf_path: str, loop_name: str, path_resolved: bool = False) -> Dict[str, Any]:
+        """
+        Same as get_loop_topology, but returns the topology as a dictionary
+        
+        path_resolved=True skips path resolution for callers that already hold a resolved path.
+        """
+        resolved_path = idf_path if path_resolved else self._resolve_idf_path(idf_path)
         
         try:
             logger.debug(f"Getting loop topology for '{loop_name}' in: {resolved_path}")
-            idf = IDF(resolved_path)
+            idf = self._load_idf(resolved_path)
             
             # Try to find the loop in different loop types
             loop_obj = None
             loop_type = None
             
-            # Check PlantLoop
-            plant_loops = idf.idfobjects.get("PlantLoop", [])
-            for loop in plant_loops:
-                if getattr(loop, 'Name', '') == loop_name:
-                    loop_obj = loop
-                    loop_type = "PlantLoop"
-                    break
-            
-            # Check CondenserLoop if not found
-            if not loop_obj:
-                condenser_loops = idf.idfobjects.get("CondenserLoop", [])
-                for loop in condenser_loops:
+            for candidate_type in _LOOP_TYPES:
+                for loop in idf.idfobjects.get(candidate_type, []):
                     if getattr(loop, 'Name', '') == loop_name:
                         loop_obj = loop
-                        loop_type = "CondenserLoop"
-                        break
-            
-            # Check AirLoopHVAC if not found
-            if not loop_obj:
-                air_loops = idf.idfobjects.get("AirLoopHVAC", [])
-                for loop in air_loops:
-                    if getattr(loop, 'Name', '') == loop_name:
-                        loop_obj = loop
-                        loop_type = "AirLoopHVAC"
+                        loop_type = candidate_type
                         break
+                if loop_obj:
+                    break
             
             if not loop_obj:
                 raise ValueError(f"Loop '{loop_name}' not found in the IDF file")
             
-            topology_info = {
-                "loop_name": loop_name,
-                "loop_type": loop_type,
-                "supply_side": {
-                    "branches": [],
-                    "inlet_node": "",
-                    "outlet_node": "",
-                    "connector_lists": []
-                },
-                "demand_side": {
-                    "branches": [],
-                    "inlet_node": "",
-                    "outlet_node": "",
-                    "connector_lists": []
-                }
-            }
-            
             # Handle AirLoopHVAC differently from Plant/Condenser loops
             if loop_type == "AirLoopHVAC":
                 topology_info = self._get_airloop_topology(idf, loop_obj, loop_name)
@@ -1676,7 +2031,7 @@ class EnergyPlusManager:
                 topology_info = self._get_plant_condenser_topology(idf, loop_obj, loop_type, loop_name)
             
             logger.debug(f"Topology extracted for loop '{loop_name}' of type {loop_type}")
-            return json.dumps(topology_info, indent=2)
+            return topology_info
             
         except Exception as e:
             logger.error(f"Error getting loop topology for {resolved_path}: {e}")
@@ -1685,16 +2040,18 @@ class EnergyPlusManager:
     def _get_airloop_topology(self, idf, loop_obj, loop_name: str) -> Dict[str, Any]:
         """Get topology information specifically for AirLoopHVAC systems"""
         
-        # Debug: Print all available fields in the loop object
-        logger.debug(f"Loop object fields for {loop_name}:")
-        for field in dir(loop_obj):
-            if not field.startswith('_'):
-                try:
-                    value = getattr(loop_obj, field, None)
-                    if isinstance(value, str) and value.strip():
-                        logger.debug(f"  {field}: {value}")
-                except:
-                    pass
+        # Debug: Print all available fields in the loop object (walking dir() is costly,
+        # so only do it when debug logging is actually enabled)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Loop object fields for %s:", loop_name)
+            for field in dir(loop_obj):
+                if not field.startswith('_'):
+                    try:
+                        value = getattr(loop_obj, field, None)
+                        if isinstance(value, str) and value.strip():
+                            logger.debug("  %s: %s", field, value)
+                    except:
+                        pass
         
         topology_info = {
             "loop_name": loop_name,
@@ -1808,18 +2165,20 @@ class EnergyPlusManager:
         }
         
         # Get supply side information
-        if loop_type in ["PlantLoop", "CondenserLoop"]:
-            topology_info["supply_side"]["inlet_node"] = getattr(loop_obj, f'{loop_type.replace("Loop", "")}_Side_Inlet_Node_Name', 'Unknown')
-            topology_info["supply_side"]["outlet_node"] = getattr(loop_obj, f'{loop_type.replace("Loop", "")}_Side_Outlet_Node_Name', 'Unknown')
+        supply_fields = _SUPPLY_SIDE_LOOP_FIELDS.get(loop_type)
+        if supply_fields:
+            inlet_field, outlet_field, branch_list_field, connector_list_field = supply_fields
+            topology_info["supply_side"]["inlet_node"] = getattr(loop_obj, inlet_field, 'Unknown')
+            topology_info["supply_side"]["outlet_node"] = getattr(loop_obj, outlet_field, 'Unknown')
+        else:
+            branch_list_field, connector_list_field = 'Supply_Side_Branch_List_Name', 'Supply_Side_Connector_List_Name'
         
         # Get demand side information
         topology_info["demand_side"]["inlet_node"] = getattr(loop_obj, 'Demand_Side_Inlet_Node_Names', 'Unknown')
         topology_info["demand_side"]["outlet_node"] = getattr(loop_obj, 'Demand_Side_Outlet_Node_Name', 'Unknown')
         
         # Get branch information
-        supply_branch_list_name = getattr(loop_obj, 'Plant_Side_Branch_List_Name' if loop_type == "PlantLoop" 
-                                        else 'Condenser_Side_Branch_List_Name' if loop_type == "CondenserLoop"
-                                        else 'Supply_Side_Branch_List_Name', '')
+        supply_branch_list_name = getattr(loop_obj, branch_list_field, '')
         
         demand_branch_list_name = getattr(loop_obj, 'Demand_Side_Branch_List_Name', '')
         
@@ -1834,9 +2193,7 @@ class EnergyPlusManager:
             topology_info["demand_side"]["branches"] = demand_branches
         
         # Get connector information (splitters/mixers)
-        supply_connector_list = getattr(loop_obj, 'Plant_Side_Connector_List_Name' if loop_type == "PlantLoop"
-                                    else 'Condenser_Side_Connector_List_Name' if loop_type == "CondenserLoop"
-                                    else 'Supply_Side_Connector_List_Name', '')
+        supply_connector_list = getattr(loop_obj, connector_list_field, '')
         
         demand_connector_list = getattr(loop_obj, 'Demand_Side_Connector_List_Name', '')
         
@@ -1918,35 +2275,6 @@ class EnergyPlusManager:
         
         return return_paths
 
-    def _get_zone_equipment_for_node(self, idf, inlet_node: str) -> List[Dict[str, Any]]:
-        """Get zone equipment objects connected to the specified inlet node"""
-        zone_equipment = []
-        
-        # Check common air terminal types
-        air_terminal_types = [
-            "AirTerminal:SingleDuct:VAV:Reheat",
-            "AirTerminal:SingleDuct:VAV:NoReheat", 
-            "AirTerminal:SingleDuct:ConstantVolume:Reheat",
-            "AirTerminal:SingleDuct:ConstantVolume:NoReheat",
-            "AirTerminal:DualDuct:VAV",
-            "AirTerminal:DualDuct:ConstantVolume"
-        ]
-        
-        for terminal_type in air_terminal_types:
-            terminals = idf.idfobjects.get(terminal_type, [])
-            for terminal in terminals:
-                terminal_inlet = getattr(terminal, 'Air_Inlet_Node_Name', '') or getattr(terminal, 'Air_Inlet_Node', '')
-                if terminal_inlet == inlet_node:
-                    equipment_info = {
-                        "type": terminal_type,
-                        "name": getattr(terminal, 'Name', 'Unknown'),
-                        "inlet_node": terminal_inlet,
-                        "outlet_node": getattr(terminal, 'Air_Outlet_Node_Name', '') or getattr(terminal, 'Air_Outlet_Node', '')
-                    }
-                    zone_equipment.append(equipment_info)
-        
-        return zone_equipment
-
     def _get_airloop_zone_splitter_details(self, idf, splitter_name: str) -> Optional[Dict[str, Any]]:
         """Get detailed information about an AirLoopHVAC:ZoneSplitter"""
         splitter_objs = idf.idfobjects.get("AirLoopHVAC:ZoneSplitter", [])
@@ -2029,28 +2357,7 @@ class EnergyPlusManager:
         """Get zone equipment connected to a specific node"""
         zone_equipment = []
         
-        # Common zone equipment types that might be connected to air loop nodes
-        equipment_types = [
-            "AirTerminal:SingleDuct:Uncontrolled",
-            "AirTerminal:SingleDuct:VAV:Reheat",
-            "AirTerminal:SingleDuct:VAV:NoReheat",
-            "AirTerminal:SingleDuct:ConstantVolume:Reheat",
-            "AirTerminal:SingleDuct:ConstantVolume:NoReheat",
-            "AirTerminal:DualDuct:VAV",
-            "AirTerminal:DualDuct:ConstantVolume",
-            "ZoneHVAC:Baseboard:Convective:Electric",
-            "ZoneHVAC:Baseboard:Convective:Water",
-            "ZoneHVAC:PackagedTerminalAirConditioner",
-            "ZoneHVAC:PackagedTerminalHeatPump",
-            "ZoneHVAC:WindowAirConditioner",
-            "ZoneHVAC:UnitHeater",
-            "ZoneHVAC:UnitVentilator",
-            "ZoneHVAC:EnergyRecoveryVentilator",
-            "ZoneHVAC:FourPipeFanCoil",
-            "ZoneHVAC:IdealLoadsAirSystem"
-        ]
-        
-        for equipment_type in equipment_types:
+        for equipment_type in _ZONE_EQUIPMENT_TYPES:
             equipment_objs = idf.idfobjects.get(equipment_type, [])
             for equipment in equipment_objs:
                 # Check if this equipment is connected to the node
@@ -2108,19 +2415,32 @@ class EnergyPlusManager:
                 diagram_name = f"{path_obj.stem}_hvac_diagram" if not loop_name else f"{path_obj.stem}_{loop_name}_diagram"
                 output_path = str(path_obj.parent / f"{diagram_name}.{format}")
             
+            # Skip rendering if this model version was already drawn to output_path with these options
+            cache_key = self._modification_cache_key("visualize_loop_diagram", resolved_path,
+                                                     {"output_path": output_path, "loop_name": loop_name,
+                                                      "format": format, "show_legend": show_legend})
+            cached_result = self._get_cached_modification(cache_key, output_path)
+            if cached_result is not None:
+                logger.info(f"Reusing unchanged loop diagram: {output_path}")
+                return cached_result
+            
             # Method 1: Use topology data for custom diagram (PRIMARY)
             try:
                 result = self._create_topology_based_diagram(resolved_path, loop_name, output_path, show_legend)
                 if result["success"]:
                     logger.info(f"Custom topology diagram created: {output_path}")
-                    return json.dumps(result, indent=2)
+                    result_json = _dumps(result, pretty=True)
+                    self._remember_modification(cache_key, output_path, result, result["output_file"])
+                    return result_json
             except Exception as e:
                 logger.warning(f"Topology-based diagram failed: {e}. Using simplified approach.")
             
             # Method 2: Simplified diagram (LAST RESORT)
             result = self._create_simplified_diagram(resolved_path, loop_name, output_path, format)
             logger.info(f"Simplified diagram created: {output_path}")
-            return json.dumps(result, indent=2)
+            result_json = _dumps(result, pretty=True)
+            self._remember_modification(cache_key, output_path, result)
+            return result_json
             
         except Exception as e:
             logger.error(f"Error creating loop diagram for {resolved_path}: {e}")
@@ -2130,10 +2450,10 @@ class EnergyPlusManager:
     def _create_topology_based_diagram(self, idf_path: str, loop_name: Optional[str], 
                                      output_path: str, show_legend: bool = True) -> Dict[str, Any]:
         """
-        Create diagram using topology data from get_loop_topology
+        Create diagram using topology data from get_loop_topology (idf_path must already be resolved)
         """
         # Get available loops
-        loops_info = json.loads(self.discover_hvac_loops(idf_path))
+        loops_info = self.discover_hvac_loops_dict(idf_path, path_resolved=True)
         
         # Determine which loop to diagram
         target_loop = None
@@ -2157,21 +2477,19 @@ class EnergyPlusManager:
         if not target_loop:
             raise ValueError("No HVAC loops found or specified loop not found")
         
-        # Get detailed topology for the target loop
-        topology_json = self.get_loop_topology(idf_path, target_loop)
+        # Get detailed topology for the target loop (as a dict, no JSON round trip)
+        topology = self.get_loop_topology_dict(idf_path, target_loop, path_resolved=True)
         
         # Create custom diagram using the topology data
         result = self.diagram_generator.create_diagram_from_topology(
-            topology_json, output_path, f"Custom HVAC Diagram - {target_loop}", show_legend=show_legend
+            topology, output_path, f"Custom HVAC Diagram - {target_loop}", show_legend=show_legend
         )
         
         # Add additional metadata
-        result.update({
-            "input_file": idf_path,
-            "method": "topology_based",
-            "total_loops_available": sum(len(loops_info.get(key, [])) 
-                                       for key in ['plant_loops', 'condenser_loops', 'air_loops'])
-        })
+        result["input_file"] = idf_path
+        result["method"] = "topology_based"
+        result["total_loops_available"] = sum(len(loops_info.get(key, []))
+                                              for key in ['plant_loops', 'condenser_loops', 'air_loops'])
         
         return result
     
@@ -2179,7 +2497,7 @@ class EnergyPlusManager:
     def _create_simplified_diagram(self, idf_path: str, loop_name: str, 
                                 output_path: str, format: str) -> Dict[str, Any]:
         """Create a simplified diagram when eppy's full functionality isn't available"""
-        idf = IDF(idf_path)
+        idf = self._load_idf(idf_path)
         
         # Get basic loop information
         loops_info = []
@@ -2259,14 +2577,21 @@ class EnergyPlusManager:
         """
         resolved_path = self._resolve_idf_path(idf_path)
         
+        # Determine output path
+        if output_path is None:
+            path_obj = Path(resolved_path)
+            output_path = str(path_obj.parent / f"{path_obj.stem}_modified{path_obj.suffix}")
+        
+        # Skip the edit entirely if this exact modification of this input file was already made
+        cache_key = self._modification_cache_key("modify_simulation_settings", resolved_path, {"object_type": object_type, "field_updates": field_updates, "run_period_index": run_period_index})
+        cached_result = self._get_cached_modification(cache_key, output_path)
+        if cached_result is not None:
+            logger.info(f"Reusing earlier {object_type} modification for: {output_path}")
+            return cached_result
+        
         try:
             logger.info(f"Modifying {object_type} settings for: {resolved_path}")
-            idf = IDF(resolved_path)
-            
-            # Determine output path
-            if output_path is None:
-                path_obj = Path(resolved_path)
-                output_path = str(path_obj.parent / f"{path_obj.stem}_modified{path_obj.suffix}")
+            idf = parse_idf(resolved_path)
             
             modifications_made = []
             
@@ -2277,17 +2602,8 @@ class EnergyPlusManager:
                 
                 sim_obj = sim_objs[0]
                 
-                # Valid SimulationControl fields
-                valid_fields = {
-                    "Do_Zone_Sizing_Calculation", "Do_System_Sizing_Calculation", 
-                    "Do_Plant_Sizing_Calculation", "Run_Simulation_for_Sizing_Periods",
-                    "Run_Simulation_for_Weather_File_Run_Periods", 
-                    "Do_HVAC_Sizing_Simulation_for_Sizing_Periods",
-                    "Maximum_Number_of_HVAC_Sizing_Simulation_Passes"
-                }
-                
                 for field_name, new_value in field_updates.items():
-                    if field_name not in valid_fields:
+                    if field_name not in _SIMULATION_CONTROL_FIELDS:
                         logger.warning(f"Invalid field name for SimulationControl: {field_name}")
                         continue
                     
@@ -2313,17 +2629,8 @@ class EnergyPlusManager:
                 
                 run_obj = run_objs[run_period_index]
                 
-                # Valid RunPeriod fields
-                valid_fields = {
-                    "Name", "Begin_Month", "Begin_Day_of_Month", "Begin_Year",
-                    "End_Month", "End_Day_of_Month", "End_Year", "Day_of_Week_for_Start_Day",
-                    "Use_Weather_File_Holidays_and_Special_Days", "Use_Weather_File_Daylight_Saving_Period",
-                    "Apply_Weekend_Holiday_Rule", "Use_Weather_File_Rain_Indicators", 
-                    "Use_Weather_File_Snow_Indicators"
-                }
-                
                 for field_name, new_value in field_updates.items():
-                    if field_name not in valid_fields:
+                    if field_name not in _RUN_PERIOD_FIELDS:
                         logger.warning(f"Invalid field name for RunPeriod: {field_name}")
                         continue
                     
@@ -2344,6 +2651,7 @@ class EnergyPlusManager:
             
             # Save the modified IDF
             idf.save(output_path)
+            self.invalidate_cached_results()
             
             result = {
                 "success": True,
@@ -2356,7 +2664,9 @@ class EnergyPlusManager:
             }
             
             logger.info(f"Successfully modified {object_type} and saved to: {output_path}")
-            return json.dumps(result, indent=2)
+            result_json = _dumps(result, pretty=True)
+            self._remember_modification(cache_key, output_path, result)
+            return result_json
             
         except Exception as e:
             logger.error(f"Error modifying simulation settings for {resolved_path}: {e}")
@@ -2379,17 +2689,25 @@ class EnergyPlusManager:
         """
         resolved_path = self._resolve_idf_path(idf_path)
         
+        # Determine output path
+        if output_path is None:
+            path_obj = Path(resolved_path)
+            output_path = str(path_obj.parent / f"{path_obj.stem}_modified{path_obj.suffix}")
+        
+        # Skip the edit entirely if this exact modification of this input file was already made
+        cache_key = self._modification_cache_key("add_coating_outside", resolved_path, {"location": location, "solar_abs": solar_abs, "thermal_abs": thermal_abs})
+        cached_result = self._get_cached_modification(cache_key, output_path)
+        if cached_result is not None:
+            logger.info(f"Reusing earlier exterior coating modification for: {output_path}")
+            return cached_result
+        
         modifications_made = []
 
         try:
-            idf = IDF(resolved_path)
+            idf = parse_idf(resolved_path)
             
-            # Determine output path
-            if output_path is None:
-                path_obj = Path(resolved_path)
-                output_path = str(path_obj.parent / f"{path_obj.stem}_modified{path_obj.suffix}")
-            
-            all_surfs = idf.idfobjects['BuildingSurface:Detailed']
+            # Copy the object lists: extending idfobjects[...] in place would add the objects to the model
+            all_surfs = list(idf.idfobjects['BuildingSurface:Detailed'])
             if location.casefold() == "wall":
                 all_surfs.extend(idf.idfobjects['Wall:Detailed'])
             elif location.casefold() == "roof":
@@ -2405,7 +2723,7 @@ class EnergyPlusManager:
             construction_names = set([x.Construction_Name for x in ext_surfs])
             constructions = [x for x in idf.idfobjects["Construction"] if x.Name in construction_names]
             ext_layer_names = set([x.Outside_Layer for x in constructions])
-            materials = idf.idfobjects['Material']
+            materials = list(idf.idfobjects['Material'])
             materials.extend(idf.idfobjects['Material:NoMass'])
             ext_layers = [x for x in materials if x.Name in ext_layer_names]
             logger.debug(f"Found {len(ext_layers)} exterior layers for {location} surfaces: {ext_surf_names}")
@@ -2437,6 +2755,7 @@ class EnergyPlusManager:
 
             # Save the modified IDF
             idf.save(output_path)
+            self.invalidate_cached_results()
             
             result = {
                 "success": True,
@@ -2449,7 +2768,9 @@ class EnergyPlusManager:
             }
             
             logger.info(f"Successfully modified exterior coating and saved to: {output_path}")
-            return json.dumps(result, indent=2)
+            result_json = _dumps(result, pretty=True)
+            self._remember_modification(cache_key, output_path, result)
+            return result_json
             
         except Exception as e:
             logger.error(f"Error modifying exterior coating for {resolved_path}: {e}")
@@ -2479,15 +2800,22 @@ class EnergyPlusManager:
 
         resolved_path = self._resolve_idf_path(idf_path)
         
+        # Determine output path
+        if output_path is None:
+            path_obj = Path(resolved_path)
+            output_path = str(path_obj.parent / f"{path_obj.stem}_modified{path_obj.suffix}")
+        
+        # Skip the edit entirely if this exact modification of this input file was already made
+        cache_key = self._modification_cache_key("add_window_film_outside", resolved_path, {"u_value": u_value, "shgc": shgc, "visible_transmittance": visible_transmittance})
+        cached_result = self._get_cached_modification(cache_key, output_path)
+        if cached_result is not None:
+            logger.info(f"Reusing earlier window film modification for: {output_path}")
+            return cached_result
+        
         modifications_made = []
 
         try:
-            idf = IDF(resolved_path)
-            
-            # Determine output path
-            if output_path is None:
-                path_obj = Path(resolved_path)
-                output_path = str(path_obj.parent / f"{path_obj.stem}_modified{path_obj.suffix}")
+            idf = parse_idf(resolved_path)
             
             window_surfs = idf.idfobjects['FenestrationSurface:Detailed']
             window_surfs = [x for x in window_surfs if x.Surface_Type.casefold() == "Window".casefold()]
@@ -2533,6 +2861,7 @@ class EnergyPlusManager:
 
             # Save the modified IDF
             idf.save(output_path)
+            self.invalidate_cached_results()
             
             result = {
                 "success": True,
@@ -2546,7 +2875,9 @@ class EnergyPlusManager:
             }
             
             logger.info(f"Successfully modified {window_film_construction_name} and saved to: {output_path}")
-            return json.dumps(result, indent=2)
+            result_json = _dumps(result, pretty=True)
+            self._remember_modification(cache_key, output_path, result)
+            return result_json
             
         except Exception as e:
             logger.error(f"Error modifying window film properties for {resolved_path}: {e}")
@@ -2565,15 +2896,22 @@ class EnergyPlusManager:
         """
         resolved_path = self._resolve_idf_path(idf_path)
         
+        # Determine output path
+        if output_path is None:
+            path_obj = Path(resolved_path)
+            output_path = str(path_obj.parent / f"{path_obj.stem}_modified{path_obj.suffix}")
+        
+        # Skip the edit entirely if this exact modification of this input file was already made
+        cache_key = self._modification_cache_key("change_infiltration_by_mult", resolved_path, {"mult": mult})
+        cached_result = self._get_cached_modification(cache_key, output_path)
+        if cached_result is not None:
+            logger.info(f"Reusing earlier infiltration modification for: {output_path}")
+            return cached_result
+        
         modifications_made = []
 
         try:
-            idf = IDF(resolved_path)
-            
-            # Determine output path
-            if output_path is None:
-                path_obj = Path(resolved_path)
-                output_path = str(path_obj.parent / f"{path_obj.stem}_modified{path_obj.suffix}")
+            idf = parse_idf(resolved_path)
             
             object_type = "ZoneInfiltration:DesignFlowRate"
             infiltration_objs = idf.idfobjects[object_type]
@@ -2582,19 +2920,10 @@ class EnergyPlusManager:
                 infiltration_obj = infiltration_objs[i]
                 name = infiltration_obj.Name
                 design_flow_method =  infiltration_obj.Design_Flow_Rate_Calculation_Method
-                # print("design_flow_method is {}".format(design_flow_method))
-                if design_flow_method.casefold() == "Flow/ExteriorArea".casefold(): # ignore case
-                    flow_field = "Flow_Rate_per_Exterior_Surface_Area"
-                elif design_flow_method.casefold() == "Flow/Area".casefold(): # ignore case
-                    flow_field = "Flow_Rate_per_Floor_Area"
-                elif design_flow_method.casefold() == "Flow/Zone".casefold(): # ignore case
-                    flow_field = "Design_Flow_Rate"
-                elif design_flow_method.casefold() == "Flow/ExteriorWallArea".casefold(): # ignore case
-                    flow_field = "Flow_Rate_per_Exterior_Surface_Area"
-                elif design_flow_method.casefold() == "AirChanges/Hour".casefold(): # ignore case
-                    flow_field = "Air_Changes_per_Hour"
-                else:
-                    print("didn't find the flow rate!!!!")
+                flow_field = _INFILTRATION_FLOW_FIELDS.get(design_flow_method.casefold())  # ignore case
+                if flow_field is None:
+                    logger.warning(f"Unknown design flow rate calculation method '{design_flow_method}' for {name}")
+                    continue
 
                 try:
                     old_value = getattr(infiltration_obj, flow_field)
@@ -2611,6 +2940,7 @@ class EnergyPlusManager:
 
             # Save the modified IDF
             idf.save(output_path)
+            self.invalidate_cached_results()
             
             result = {
                 "success": True,
@@ -2622,7 +2952,9 @@ class EnergyPlusManager:
             }
             
             logger.info(f"Successfully modified {object_type} and saved to: {output_path}")
-            return json.dumps(result, indent=2)
+            result_json = _dumps(result, pretty=True)
+            self._remember_modification(cache_key, output_path, result)
+            return result_json
             
         except Exception as e:
             logger.error(f"Error modifying infiltration rate for {resolved_path}: {e}")
@@ -2632,7 +2964,7 @@ class EnergyPlusManager:
     # ------------------------ Simulation Execution ------------------------
     def run_simulation(self, idf_path: str, weather_file: str = None, 
                        output_directory: str = None, annual: bool = True,
-                       design_day: bool = False, readvars: bool = True,
+                       design_day: bool = False, readvars: Optional[bool] = None,
                        expandobjects: bool = True) -> str:
             """
             Run EnergyPlus simulation with specified IDF and weather file
@@ -2643,12 +2975,22 @@ class EnergyPlusManager:
                 output_directory: Directory for simulation outputs. If None, creates one in outputs/
                 annual: Run annual simulation (default: True)
                 design_day: Run design day only simulation (default: False)
-                readvars: Run ReadVarsESO after simulation (default: True)
+                readvars: Run ReadVarsESO after simulation. If None (default), it runs only when the
+                          model has Output:Variable or Output:Meter objects for it to convert
                 expandobjects: Run ExpandObjects prior to simulation (default: True)
             
             Returns:
                 JSON string with simulation results and output file paths
             """
+            return _dumps(self.run_simulation_dict(idf_path, weather_file, output_directory, annual,
+                                                   design_day, readvars, expandobjects), pretty=True)
+        
+
+    def run_simulation_dict(self, idf_path: str, weather_file: str = None, 
+                            output_directory: str = None, annual: bool = True,
+                            design_day: bool = False, readvars: Optional[bool] = None,
+                            expandobjects: bool = True) -> Dict[str, Any]:
+            """Same as run_simulation, but returns the result as a dictionary"""
             resolved_idf_path = self._resolve_idf_path(idf_path)
             
             try:
@@ -2672,9 +3014,15 @@ class EnergyPlusManager:
                 
                 # Load IDF file
                 if resolved_weather_path:
-                    idf = IDF(resolved_idf_path, resolved_weather_path)
+                    idf = parse_idf(resolved_idf_path, resolved_weather_path)
                 else:
-                    idf = IDF(resolved_idf_path)
+                    idf = parse_idf(resolved_idf_path)
+                
+                # ReadVarsESO only converts reported variables and meters; skip it when there are none
+                if readvars is None:
+                    readvars = any(idf.idfobjects.get(object_type) for object_type in _READVARS_OUTPUT_OBJECTS)
+                    logger.debug(f"ReadVarsESO {'enabled' if readvars else 'skipped'}: model "
+                                 f"{'has' if readvars else 'has no'} Output:Variable/Output:Meter objects")
                 
                 # Configure simulation options
                 simulation_options = {
@@ -2697,7 +3045,7 @@ class EnergyPlusManager:
                 
                 # Run the simulation
                 try:
-                    result = idf.run(**simulation_options)
+                    result = run_idf(idf, **simulation_options)
                     end_time = datetime.now()
                     duration = end_time - start_time
                     
@@ -2717,19 +3065,20 @@ class EnergyPlusManager:
                     }
                     
                     logger.info(f"Simulation completed successfully in {duration}")
-                    return json.dumps(simulation_result, indent=2)
+                    return simulation_result
                     
                 except Exception as e:
                     # Try to find error file for more detailed error information
                     error_file = Path(output_directory) / f"{Path(resolved_idf_path).stem}.err"
                     error_details = ""
                     
-                    if error_file.exists():
-                        try:
-                            with open(error_file, 'r') as f:
-                                error_details = f.read()
-                        except Exception:
-                            error_details = "Could not read error file"
+                    # Read as bytes in one call; undecodable bytes must not hide the error report
+                    try:
+                        error_details = error_file.read_bytes().decode('utf-8', errors='replace')
+                    except FileNotFoundError:
+                        pass
+                    except Exception:
+                        error_details = "Could not read error file"
                     
                     simulation_result = {
                         "success": False,
@@ -2743,7 +3092,7 @@ class EnergyPlusManager:
                     }
                     
                     logger.error(f"Simulation failed: {str(e)}")
-                    return json.dumps(simulation_result, indent=2)
+                    return simulation_result
                     
             except Exception as e:
                 logger.error(f"Error setting up simulation for {resolved_idf_path}: {e}")
@@ -2752,9 +3101,37 @@ class EnergyPlusManager:
 
     def _resolve_weather_file_path(self, weather_file: str) -> str:
         """Resolve weather file path (handle relative paths, sample files, EnergyPlus weather data, etc.)"""
-        from .utils.path_utils import resolve_path
-        return resolve_path(self.config, weather_file, file_types=['.epw'], description="weather file", 
-                           enable_fuzzy_weather_matching=True)
+        try:
+            return resolve_path(self.config, weather_file, file_types=['.epw'], description="weather file")
+        except FileNotFoundError:
+            pass
+        
+        # Not a path to an existing file; fall back to fuzzy matching (e.g. a city name)
+        resolved_path = self._weather_match_cache(weather_file, get_config_version(), self._weather_dirs_signature())
+        if os.path.isfile(resolved_path):
+            return resolved_path
+        # A file removed within the directory's mtime granularity can leave a stale match; match again
+        self._weather_match_cache.cache_clear()
+        return self._weather_match_cache(weather_file, get_config_version(), self._weather_dirs_signature())
+    
+
+    def _weather_dirs_signature(self) -> tuple:
+        """Modification times of the directories fuzzy weather matching scans (None if missing)"""
+        signature = []
+        for search_dir in (self.config.paths.sample_files_path, self.config.energyplus.weather_data_path):
+            try:
+                signature.append(os.stat(search_dir).st_mtime_ns)
+            except (OSError, TypeError):
+                signature.append(None)
+        return tuple(signature)
+    
+
+    def _match_weather_file(self, weather_file: str, config_version: int, dirs_signature: tuple) -> str:
+        """Best fuzzy match for a weather file name (config_version and dirs_signature only key the cache)"""
+        weather_files = find_weather_files_by_name(self.config, weather_file)
+        if not weather_files:
+            raise FileNotFoundError(f"weather file not found: {weather_file}")
+        return weather_files[0]
     
 
 
@@ -2849,21 +3226,14 @@ class EnergyPlusManager:
             csv_file = None
             data_type = None
             
-            if file_type == "auto":
-                if meter_file.exists():
-                    csv_file = meter_file
-                    data_type = "Meter"
-                elif variable_file.exists():
-                    csv_file = variable_file  
-                    data_type = "Variable"
-            elif file_type == "meter":
-                csv_file = meter_file
-                data_type = "Meter"
-            elif file_type == "variable":
-                csv_file = variable_file
-                data_type = "Variable"
-            
-            if not csv_file or not csv_file.exists():
+            for suffix, candidate_type in _PLOT_FILE_CANDIDATES.get(file_type, ()):
+                candidate_file = output_dir / f"{idf_name}{suffix}"
+                if candidate_file.exists():
+                    csv_file = candidate_file
+                    data_type = candidate_type
+                    break
+            
+            if not csv_file:
                 raise FileNotFoundError(f"Output CSV file not found. Checked: {meter_file}, {variable_file}")
             
             logger.info(f"Processing {data_type} file: {csv_file}")
@@ -2886,36 +3256,19 @@ class EnergyPlusManager:
             
             if datetime_col:
                 try:
-                    # Try MM/DD HH:MM:SS format first
-                    def parse_datetime_mmdd(dt_str):
-                        try:
-                            # Add current year and parse
-                            current_year = datetime.now().year
-                            full_dt_str = f"{current_year}/{dt_str}"
-                            return pd.to_datetime(full_dt_str, format="%Y/%m/%d  %H:%M:%S")
-                        except:
-                            return None
-                    
-                    # Try monthly format
-                    def parse_monthly(dt_str):
-                        try:
-                            dt_str = dt_str.strip()
-                            if dt_str in calendar.month_name[1:]:  # Full month names
-                                month_num = list(calendar.month_name).index(dt_str)
-                                return pd.to_datetime(f"2023-{month_num:02d}-01")  # Use 2023 as default year
-                            return None
-                        except:
-                            return None
-                    
-                    # Try to parse datetime
+                    # Try to parse datetime, converting the whole column at once
                     sample_value = str(df[datetime_col].iloc[0]).strip()
                     
                     if '/' in sample_value and ':' in sample_value:
-                        # MM/DD HH:MM:SS format
-                        df['parsed_datetime'] = df[datetime_col].apply(parse_datetime_mmdd)
+                        # MM/DD HH:MM:SS format, with the current year added; unparseable values become NaT
+                        full_dt_strs = f"{datetime.now().year}/" + df[datetime_col].astype(str)
+                        df['parsed_datetime'] = pd.to_datetime(full_dt_strs, format="%Y/%m/%d  %H:%M:%S",
+                                                               errors='coerce')
                     elif sample_value in calendar.month_name[1:]:
-                        # Monthly format
-                        df['parsed_datetime'] = df[datetime_col].apply(parse_monthly)
+                        # Monthly format (full month names), using 2023 as default year
+                        month_starts = {name: pd.Timestamp(f"2023-{month_num:02d}-01")
+                                        for month_num, name in enumerate(calendar.month_name) if name}
+                        df['parsed_datetime'] = df[datetime_col].astype(str).str.strip().map(month_starts)
                     else:
                         df['parsed_datetime'] = pd.to_datetime(df[datetime_col], errors='coerce')
                     
@@ -2991,7 +3344,7 @@ class EnergyPlusManager:
             }
             
             logger.info(f"Interactive plot created: {html_path}")
-            return json.dumps(result, indent=2)
+            return _dumps(result, pretty=True)
             
         except Exception as e:
             logger.error(f"Error creating interactive plot: {e}")
@@ -10,12 +10,17 @@ See License.txt in the parent directory for license details.
 """
 
 import os
+import sys
+import platform
 import asyncio
+import functools
 import logging
-import json
-from typing import Optional, Dict, Any, List
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Dict, Any, List, Callable
 from pathlib import Path
-from datetime import datetime
+from datetime import datetime, timezone
 
 # Import FastMCP instead of the low-level Server
 from mcp.server.fastmcp import FastMCP
@@ -23,6 +28,7 @@ from mcp.server.fastmcp import FastMCP
 # Import our EnergyPlus utilities and configuration
 from energyplus_mcp_server.energyplus_tools import EnergyPlusManager
 from energyplus_mcp_server.config import get_config, Config
+from energyplus_mcp_server.utils.jsonx import dumps as _dumps
 
 logger = logging.getLogger(__name__)
 
@@ -35,7 +41,74 @@ mcp = FastMCP(config.server.name)
 # Initialize EnergyPlus manager with configuration
 ep_manager = EnergyPlusManager(config)
 
-logger.info(f"EnergyPlus MCP Server '{config.server.name}' v{config.server.version} initialized")
+# Formatted once; reported by get_server_status
+_SERVER_START_TIME = datetime.now(timezone.utc).isoformat(timespec="seconds")
+
+# Shared worker threads for blocking EnergyPlusManager calls. Simulations get their own
+# pool so long runs cannot starve the inspection tools; both stay small and queue the rest.
+# Tools that write files (model edits, copies, diagrams, plots) run one at a time on _EDIT_POOL:
+# they may target the same output path, and matplotlib's pyplot state is not thread-safe
+_EP_POOL = ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 2), thread_name_prefix="ep")
+_EDIT_POOL = ThreadPoolExecutor(max_workers=1, thread_name_prefix="ep-edit")
+_SIM_POOL = ThreadPoolExecutor(max_workers=os.cpu_count() or 1, thread_name_prefix="ep-sim")
+
+
+async def _run_blocking(func, *args, pool: ThreadPoolExecutor = _EP_POOL, **kwargs):
+    """Run a blocking call in a worker pool without blocking the event loop"""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(pool, functools.partial(func, *args, **kwargs))
+
+
+def _file_not_found(e: Exception) -> str:
+    """Tool response for a missing input file"""
+    return "File not found: " + str(e)
+
+
+def _invalid_arguments(e: Exception) -> str:
+    """Tool response for rejected tool arguments"""
+    return "Invalid arguments: " + str(e)
+
+
+def _invalid_input(e: Exception) -> str:
+    """Tool response for rejected modification input"""
+    return "Invalid input: " + str(e)
+
+
+def _tool_error(action: str, e: Exception, idf_path: Optional[str] = None) -> str:
+    """Tool response for an unexpected failure, e.g. 'Error listing zones for model.idf: ...'"""
+    if idf_path is None:
+        return "Error " + action + ": " + str(e)
+    return "Error " + action + " for " + idf_path + ": " + str(e)
+
+
+# Each EnergyPlus run can take gigabytes of memory, so cap how many run at once and queue the rest
+_SIM_SEMAPHORE = asyncio.Semaphore(config.server.max_parallel_simulations)
+_simulation_counts = {"running": 0, "queued": 0}
+
+
+async def _run_simulation(runner: Callable[..., Any] = ep_manager.run_simulation, **kwargs) -> Any:
+    """Run ep_manager.run_simulation (or another simulation runner) once a simulation slot is free"""
+    _simulation_counts["queued"] += 1
+    try:
+        await _SIM_SEMAPHORE.acquire()
+    finally:
+        _simulation_counts["queued"] -= 1
+    
+    _simulation_counts["running"] += 1
+    try:
+        return await _run_blocking(runner, pool=_SIM_POOL, **kwargs)
+    finally:
+        _simulation_counts["running"] -= 1
+        _SIM_SEMAPHORE.release()
+
+
+async def _query_outputs(method: Callable[..., str], idf_path: str, discover_available: bool, run_days: int) -> str:
+    """Call an output query; discovery runs a short simulation, so it waits for a simulation slot"""
+    if discover_available:
+        return await _run_simulation(runner=method, idf_path=idf_path, discover_available=True, run_days=run_days)
+    return await _run_blocking(method, idf_path, discover_available, run_days)
+
+logger.info("EnergyPlus MCP Server '%s' v%s initialized", config.server.name, config.server.version)
 
 
 # Add this tool function to server.py
@@ -75,15 +148,15 @@ async def copy_file(source_path: str, target_path: str, overwrite: bool = False,
         copy_file("san francisco", "my_weather.epw", file_types=[".epw"])
     """
     try:
-        logger.info(f"Copying file: '{source_path}' -> '{target_path}' (overwrite={overwrite}, file_types={file_types})")
-        result = ep_manager.copy_file(source_path, target_path, overwrite, file_types)
+        logger.info("Copying file: '%s' -> '%s' (overwrite=%s, file_types=%s)", source_path, target_path, overwrite, file_types)
+        result = await _run_blocking(ep_manager.copy_file, source_path, target_path, overwrite, file_types, pool=_EDIT_POOL)
         return f"File copy operation completed:\n{result}"
     except ValueError as e:
-        logger.warning(f"Invalid arguments for copy_file: {str(e)}")
-        return f"Invalid arguments: {str(e)}"
+        logger.warning("Invalid arguments for copy_file: %s", e)
+        return _invalid_arguments(e)
     except Exception as e:
-        logger.error(f"Unexpected error copying file: {str(e)}")
-        return f"Error copying file: {str(e)}"
+        logger.error("Unexpected error copying file: %s", e)
+        return _tool_error("copying file", e)
 
 
 @mcp.tool()
@@ -98,17 +171,18 @@ async def load_idf_model(idf_path: str) -> str:
         JSON string with model information and loading status
     """
     try:
-        logger.info(f"Loading IDF model: {idf_path}")
-        result = ep_manager.load_idf(idf_path)
+        logger.info("Loading IDF model: %s", idf_path)
+        result = await _run_blocking(ep_manager.load_idf, idf_path)
         return f"Successfully loaded IDF: {result['original_path']}\nModel info: {result}"
     except FileNotFoundError as e:
-        logger.warning(f"IDF file not found: {idf_path}")
-        return f"File not found: {str(e)}"
+        logger.warning("IDF file not found: %s", idf_path)
+        return _file_not_found(e)
     except ValueError as e:
-        logger.warning(f"Invalid input for load_idf_model: {str(e)}")
-        return f"Invalid input: {str(e)}"
+        logger.warning("Invalid input for load_idf_model: %s", e)
+        return _invalid_input(e)
     except Exception as e:
-        logger.error(f"Unexpected error loading IDF {idf_path}: {str(e)}")
+        logger.error("Unexpected error loading IDF %s: %s", idf_path, e)
+        # Kept inline: this response has no "for" before the path
         return f"Error loading IDF {idf_path}: {str(e)}"
 
 
@@ -124,15 +198,15 @@ async def get_model_summary(idf_path: str) -> str:
         JSON string with model summary information
     """
     try:
-        logger.info(f"Getting model summary: {idf_path}")
-        summary = ep_manager.get_model_basics(idf_path)
+        logger.info("Getting model summary: %s", idf_path)
+        summary = await _run_blocking(ep_manager.get_model_basics, idf_path)
         return f"Model Summary for {idf_path}:\n{summary}"
     except FileNotFoundError as e:
-        logger.warning(f"IDF file not found: {idf_path}")
-        return f"File not found: {str(e)}"
+        logger.warning("IDF file not found: %s", idf_path)
+        return _file_not_found(e)
     except Exception as e:
-        logger.error(f"Error getting model summary for {idf_path}: {str(e)}")
-        return f"Error getting model summary for {idf_path}: {str(e)}"
+        logger.error("Error getting model summary for %s: %s", idf_path, e)
+        return _tool_error("getting model summary", e, idf_path)
 
 
 @mcp.tool()
@@ -147,15 +221,15 @@ async def check_simulation_settings(idf_path: str) -> str:
         JSON string with current settings and descriptions of modifiable fields
     """
     try:
-        logger.info(f"Checking simulation settings: {idf_path}")
-        settings = ep_manager.check_simulation_settings(idf_path)
+        logger.info("Checking simulation settings: %s", idf_path)
+        settings = await _run_blocking(ep_manager.check_simulation_settings, idf_path)
         return f"Simulation settings for {idf_path}:\n{settings}"
     except FileNotFoundError as e:
-        logger.warning(f"IDF file not found: {idf_path}")
-        return f"File not found: {str(e)}"
+        logger.warning("IDF file not found: %s", idf_path)
+        return _file_not_found(e)
     except Exception as e:
-        logger.error(f"Error checking simulation settings for {idf_path}: {str(e)}")
-        return f"Error checking simulation settings for {idf_path}: {str(e)}"
+        logger.error("Error checking simulation settings for %s: %s", idf_path, e)
+        return _tool_error("checking simulation settings", e, idf_path)
 
 
 @mcp.tool()
@@ -171,15 +245,15 @@ async def inspect_schedules(idf_path: str, include_values: bool = False) -> str:
         JSON string with detailed schedule inventory and analysis
     """
     try:
-        logger.info(f"Inspecting schedules: {idf_path} (include_values={include_values})")
-        schedules_info = ep_manager.inspect_schedules(idf_path, include_values)
+        logger.info("Inspecting schedules: %s (include_values=%s)", idf_path, include_values)
+        schedules_info = await _run_blocking(ep_manager.inspect_schedules, idf_path, include_values)
         return f"Schedule inspection for {idf_path}:\n{schedules_info}"
     except FileNotFoundError as e:
-        logger.warning(f"IDF file not found: {idf_path}")
-        return f"File not found: {str(e)}"
+        logger.warning("IDF file not found: %s", idf_path)
+        return _file_not_found(e)
     except Exception as e:
-        logger.error(f"Error inspecting schedules for {idf_path}: {str(e)}")
-        return f"Error inspecting schedules for {idf_path}: {str(e)}"
+        logger.error("Error inspecting schedules for %s: %s", idf_path, e)
+        return _tool_error("inspecting schedules", e, idf_path)
 
 
 @mcp.tool()
@@ -198,15 +272,15 @@ async def inspect_people(idf_path: str) -> str:
         - Summary statistics by zone and calculation method
     """
     try:
-        logger.info(f"Inspecting People objects: {idf_path}")
-        result = ep_manager.inspect_people(idf_path)
+        logger.info("Inspecting People objects: %s", idf_path)
+        result = await _run_blocking(ep_manager.inspect_people, idf_path)
         return f"People objects inspection for {idf_path}:\n{result}"
     except FileNotFoundError as e:
-        logger.warning(f"IDF file not found: {idf_path}")
-        return f"File not found: {str(e)}"
+        logger.warning("IDF file not found: %s", idf_path)
+        return _file_not_found(e)
     except Exception as e:
-        logger.error(f"Error inspecting People objects for {idf_path}: {str(e)}")
-        return f"Error inspecting People objects for {idf_path}: {str(e)}"
+        logger.error("Error inspecting People objects for %s: %s", idf_path, e)
+        return _tool_error("inspecting People objects", e, idf_path)
 
 
 @mcp.tool()
@@ -280,18 +354,18 @@ async def modify_people(
         ])
     """
     try:
-        logger.info(f"Modifying People objects: {idf_path}")
-        result = ep_manager.modify_people(idf_path, modifications, output_path)
+        logger.info("Modifying People objects: %s", idf_path)
+        result = await _run_blocking(ep_manager.modify_people, idf_path, modifications, output_path, pool=_EDIT_POOL)
         return f"People modification results:\n{result}"
     except FileNotFoundError as e:
-        logger.warning(f"IDF file not found: {idf_path}")
-        return f"File not found: {str(e)}"
+        logger.warning("IDF file not found: %s", idf_path)
+        return _file_not_found(e)
     except ValueError as e:
-        logger.warning(f"Invalid input for modify_people: {str(e)}")
-        return f"Invalid input: {str(e)}"
+        logger.warning("Invalid input for modify_people: %s", e)
+        return _invalid_input(e)
     except Exception as e:
-        logger.error(f"Error modifying People objects for {idf_path}: {str(e)}")
-        return f"Error modifying People objects for {idf_path}: {str(e)}"
+        logger.error("Error modifying People objects for %s: %s", idf_path, e)
+        return _tool_error("modifying People objects", e, idf_path)
 
 
 @mcp.tool()
@@ -310,15 +384,15 @@ async def inspect_lights(idf_path: str) -> str:
         - Summary statistics by zone and calculation method
     """
     try:
-        logger.info(f"Inspecting Lights objects: {idf_path}")
-        result = ep_manager.inspect_lights(idf_path)
+        logger.info("Inspecting Lights objects: %s", idf_path)
+        result = await _run_blocking(ep_manager.inspect_lights, idf_path)
         return f"Lights objects inspection for {idf_path}:\n{result}"
     except FileNotFoundError as e:
-        logger.warning(f"IDF file not found: {idf_path}")
-        return f"File not found: {str(e)}"
+        logger.warning("IDF file not found: %s", idf_path)
+        return _file_not_found(e)
     except Exception as e:
-        logger.error(f"Error inspecting Lights objects for {idf_path}: {str(e)}")
-        return f"Error inspecting Lights objects for {idf_path}: {str(e)}"
+        logger.error("Error inspecting Lights objects for %s: %s", idf_path, e)
+        return _tool_error("inspecting Lights objects", e, idf_path)
 
 
 @mcp.tool()
@@ -394,18 +468,18 @@ async def modify_lights(
         ])
     """
     try:
-        logger.info(f"Modifying Lights objects: {idf_path}")
-        result = ep_manager.modify_lights(idf_path, modifications, output_path)
+        logger.info("Modifying Lights objects: %s", idf_path)
+        result = await _run_blocking(ep_manager.modify_lights, idf_path, modifications, output_path, pool=_EDIT_POOL)
         return f"Lights modification results:\n{result}"
     except FileNotFoundError as e:
-        logger.warning(f"IDF file not found: {idf_path}")
-        return f"File not found: {str(e)}"
+        logger.warning("IDF file not found: %s", idf_path)
+        return _file_not_found(e)
     except ValueError as e:
-        logger.warning(f"Invalid input for modify_lights: {str(e)}")
-        return f"Invalid input: {str(e)}"
+        logger.warning("Invalid input for modify_lights: %s", e)
+        return _invalid_input(e)
     except Exception as e:
-        logger.error(f"Error modifying Lights objects for {idf_path}: {str(e)}")
-        return f"Error modifying Lights objects for {idf_path}: {str(e)}"
+        logger.error("Error modifying Lights objects for %s: %s", idf_path, e)
+        return _tool_error("modifying Lights objects", e, idf_path)
 
 
 @mcp.tool()
@@ -424,15 +498,15 @@ async def inspect_electric_equipment(idf_path: str) -> str:
         - Summary statistics by zone and calculation method
     """
     try:
-        logger.info(f"Inspecting ElectricEquipment objects: {idf_path}")
-        result = ep_manager.inspect_electric_equipment(idf_path)
+        logger.info("Inspecting ElectricEquipment objects: %s", idf_path)
+        result = await _run_blocking(ep_manager.inspect_electric_equipment, idf_path)
         return f"ElectricEquipment objects inspection for {idf_path}:\n{result}"
     except FileNotFoundError as e:
-        logger.warning(f"IDF file not found: {idf_path}")
-        return f"File not found: {str(e)}"
+        logger.warning("IDF file not found: %s", idf_path)
+        return _file_not_found(e)
     except Exception as e:
-        logger.error(f"Error inspecting ElectricEquipment objects for {idf_path}: {str(e)}")
-        return f"Error inspecting ElectricEquipment objects for {idf_path}: {str(e)}"
+        logger.error("Error inspecting ElectricEquipment objects for %s: %s", idf_path, e)
+        return _tool_error("inspecting ElectricEquipment objects", e, idf_path)
 
 
 @mcp.tool()
@@ -502,18 +576,18 @@ async def modify_electric_equipment(
         ])
     """
     try:
-        logger.info(f"Modifying ElectricEquipment objects: {idf_path}")
-        result = ep_manager.modify_electric_equipment(idf_path, modifications, output_path)
+        logger.info("Modifying ElectricEquipment objects: %s", idf_path)
+        result = await _run_blocking(ep_manager.modify_electric_equipment, idf_path, modifications, output_path, pool=_EDIT_POOL)
         return f"ElectricEquipment modification results:\n{result}"
     except FileNotFoundError as e:
-        logger.warning(f"IDF file not found: {idf_path}")
-        return f"File not found: {str(e)}"
+        logger.warning("IDF file not found: %s", idf_path)
+        return _file_not_found(e)
     except ValueError as e:
-        logger.warning(f"Invalid input for modify_electric_equipment: {str(e)}")
-        return f"Invalid input: {str(e)}"
+        logger.warning("Invalid input for modify_electric_equipment: %s", e)
+        return _invalid_input(e)
     except Exception as e:
-        logger.error(f"Error modifying ElectricEquipment objects for {idf_path}: {str(e)}")
-        return f"Error modifying ElectricEquipment objects for {idf_path}: {str(e)}"
+        logger.error("Error modifying ElectricEquipment objects for %s: %s", idf_path, e)
+        return _tool_error("modifying ElectricEquipment objects", e, idf_path)
 
 
 @mcp.tool()
@@ -534,22 +608,24 @@ async def modify_simulation_control(
         JSON string with modification results
     """
     try:
-        logger.info(f"Modifying SimulationControl: {idf_path}")
+        logger.info("Modifying SimulationControl: %s", idf_path)
         
         # No need to parse JSON since we're receiving a dict directly
-        result = ep_manager.modify_simulation_settings(
+        result = await _run_blocking(
+            ep_manager.modify_simulation_settings,
             idf_path=idf_path,
             object_type="SimulationControl",
             field_updates=field_updates,  # Pass the dict directly
-            output_path=output_path
+            output_path=output_path,
+            pool=_EDIT_POOL
         )
         return f"SimulationControl modification results:\n{result}"
     except FileNotFoundError as e:
-        logger.warning(f"IDF file not found: {idf_path}")
-        return f"File not found: {str(e)}"
+        logger.warning("IDF file not found: %s", idf_path)
+        return _file_not_found(e)
     except Exception as e:
-        logger.error(f"Error modifying SimulationControl for {idf_path}: {str(e)}")
-        return f"Error modifying SimulationControl for {idf_path}: {str(e)}"
+        logger.error("Error modifying SimulationControl for %s: %s", idf_path, e)
+        return _tool_error("modifying SimulationControl", e, idf_path)
 
 
 @mcp.tool()
@@ -572,23 +648,25 @@ async def modify_run_period(
         JSON string with modification results
     """
     try:
-        logger.info(f"Modifying RunPeriod: {idf_path}")
+        logger.info("Modifying RunPeriod: %s", idf_path)
         
         # No need to parse JSON since we're receiving a dict directly
-        result = ep_manager.modify_simulation_settings(
+        result = await _run_blocking(
+            ep_manager.modify_simulation_settings,
             idf_path=idf_path,
             object_type="RunPeriod",
             field_updates=field_updates,  # Pass the dict directly
             run_period_index=run_period_index,
-            output_path=output_path
+            output_path=output_path,
+            pool=_EDIT_POOL
         )
         return f"RunPeriod modification results:\n{result}"
     except FileNotFoundError as e:
-        logger.warning(f"IDF file not found: {idf_path}")
-        return f"File not found: {str(e)}"
+        logger.warning("IDF file not found: %s", idf_path)
+        return _file_not_found(e)
     except Exception as e:
-        logger.error(f"Error modifying RunPeriod for {idf_path}: {str(e)}")
-        return f"Error modifying RunPeriod for {idf_path}: {str(e)}"
+        logger.error("Error modifying RunPeriod for %s: %s", idf_path, e)
+        return _tool_error("modifying RunPeriod", e, idf_path)
 
 
 @mcp.tool()
@@ -609,21 +687,23 @@ async def change_infiltration_by_mult(
         JSON string with modification results
     """
     try:
-        logger.info(f"Modifying Infiltration: {idf_path}")
+        logger.info("Modifying Infiltration: %s", idf_path)
         
         # No need to parse JSON since we're receiving a dict directly
-        result = ep_manager.change_infiltration_by_mult(
+        result = await _run_blocking(
+            ep_manager.change_infiltration_by_mult,
             idf_path=idf_path,
             mult=mult,  # Pass the float directly
-            output_path=output_path
+            output_path=output_path,
+            pool=_EDIT_POOL
         )
         return f"Infiltration modification results:\n{result}"
     except FileNotFoundError as e:
-        logger.warning(f"IDF file not found: {idf_path}")
-        return f"File not found: {str(e)}"
+        logger.warning("IDF file not found: %s", idf_path)
+        return _file_not_found(e)
     except Exception as e:
-        logger.error(f"Error Infiltration modification for {idf_path}: {str(e)}")
-        return f"Error Infiltration modification for {idf_path}: {str(e)}"
+        logger.error("Error Infiltration modification for %s: %s", idf_path, e)
+        return _tool_error("Infiltration modification", e, idf_path)
 
 
 @mcp.tool()
@@ -648,21 +728,23 @@ async def add_window_film_outside(
         JSON string with modification results
     """
     try:
-        logger.info(f"Adding window film to exterior windows: {idf_path}")
-        result = ep_manager.add_window_film_outside(
+        logger.info("Adding window film to exterior windows: %s", idf_path)
+        result = await _run_blocking(
+            ep_manager.add_window_film_outside,
             idf_path=idf_path,
             u_value=u_value,
             shgc=shgc,
             visible_transmittance=visible_transmittance,
-            output_path=output_path
+            output_path=output_path,
+            pool=_EDIT_POOL
         )
         return f"Window film modification results:\n{result}"
     except FileNotFoundError as e:
-        logger.warning(f"IDF file not found: {idf_path}")
-        return f"File not found: {str(e)}"
+        logger.warning("IDF file not found: %s", idf_path)
+        return _file_not_found(e)
     except Exception as e:
-        logger.error(f"Error adding window film for {idf_path}: {str(e)}")
-        return f"Error adding window film for {idf_path}: {str(e)}"
+        logger.error("Error adding window film for %s: %s", idf_path, e)
+        return _tool_error("adding window film", e, idf_path)
 
 
 @mcp.tool()
@@ -687,24 +769,26 @@ async def add_coating_outside(
         JSON string with modification results
     """
     try:
-        logger.info(f"Adding exterior coating to {location} surfaces: {idf_path}")
-        result = ep_manager.add_coating_outside(
+        logger.info("Adding exterior coating to %s surfaces: %s", location, idf_path)
+        result = await _run_blocking(
+            ep_manager.add_coating_outside,
             idf_path=idf_path,
             location=location,
             solar_abs=solar_abs,
             thermal_abs=thermal_abs,
-            output_path=output_path
+            output_path=output_path,
+            pool=_EDIT_POOL
         )
         return f"Exterior coating modification results:\n{result}"
     except FileNotFoundError as e:
-        logger.warning(f"IDF file not found: {idf_path}")
-        return f"File not found: {str(e)}"
+        logger.warning("IDF file not found: %s", idf_path)
+        return _file_not_found(e)
     except ValueError as e:
-        logger.warning(f"Invalid location parameter: {location}")
+        logger.warning("Invalid location parameter: %s", location)
         return f"Invalid location (must be 'wall' or 'roof'): {str(e)}"
     except Exception as e:
-        logger.error(f"Error adding exterior coating for {idf_path}: {str(e)}")
-        return f"Error adding exterior coating for {idf_path}: {str(e)}"
+        logger.error("Error adding exterior coating for %s: %s", idf_path, e)
+        return _tool_error("adding exterior coating", e, idf_path)
 
 
 @mcp.tool()
@@ -719,15 +803,15 @@ async def list_zones(idf_path: str) -> str:
         JSON string with detailed zone information
     """
     try:
-        logger.info(f"Listing zones: {idf_path}")
-        zones = ep_manager.list_zones(idf_path)
+        logger.info("Listing zones: %s", idf_path)
+        zones = await _run_blocking(ep_manager.list_zones, idf_path)
         return f"Zones in {idf_path}:\n{zones}"
     except FileNotFoundError as e:
-        logger.warning(f"IDF file not found: {idf_path}")
-        return f"File not found: {str(e)}"
+        logger.warning("IDF file not found: %s", idf_path)
+        return _file_not_found(e)
     except Exception as e:
-        logger.error(f"Error listing zones for {idf_path}: {str(e)}")
-        return f"Error listing zones for {idf_path}: {str(e)}"
+        logger.error("Error listing zones for %s: %s", idf_path, e)
+        return _tool_error("listing zones", e, idf_path)
 
 
 @mcp.tool()
@@ -742,15 +826,15 @@ async def get_surfaces(idf_path: str) -> str:
         JSON string with surface details
     """
     try:
-        logger.info(f"Getting surfaces: {idf_path}")
-        surfaces = ep_manager.get_surfaces(idf_path)
+        logger.info("Getting surfaces: %s", idf_path)
+        surfaces = await _run_blocking(ep_manager.get_surfaces, idf_path)
         return f"Surfaces in {idf_path}:\n{surfaces}"
     except FileNotFoundError as e:
-        logger.warning(f"IDF file not found: {idf_path}")
-        return f"File not found: {str(e)}"
+        logger.warning("IDF file not found: %s", idf_path)
+        return _file_not_found(e)
     except Exception as e:
-        logger.error(f"Error getting surfaces for {idf_path}: {str(e)}")
-        return f"Error getting surfaces for {idf_path}: {str(e)}"
+        logger.error("Error getting surfaces for %s: %s", idf_path, e)
+        return _tool_error("getting surfaces", e, idf_path)
 
 @mcp.tool()
 async def get_materials(idf_path: str) -> str:
@@ -764,15 +848,15 @@ async def get_materials(idf_path: str) -> str:
         JSON string with material details
     """
     try:
-        logger.info(f"Getting materials: {idf_path}")
-        materials = ep_manager.get_materials(idf_path)
+        logger.info("Getting materials: %s", idf_path)
+        materials = await _run_blocking(ep_manager.get_materials, idf_path)
         return f"Materials in {idf_path}:\n{materials}"
     except FileNotFoundError as e:
-        logger.warning(f"IDF file not found: {idf_path}")
-        return f"File not found: {str(e)}"
+        logger.warning("IDF file not found: %s", idf_path)
+        return _file_not_found(e)
     except Exception as e:
-        logger.error(f"Error getting materials for {idf_path}: {str(e)}")
-        return f"Error getting materials for {idf_path}: {str(e)}"
+        logger.error("Error getting materials for %s: %s", idf_path, e)
+        return _tool_error("getting materials", e, idf_path)
 
 
 @mcp.tool()
@@ -787,14 +871,15 @@ async def validate_idf(idf_path: str) -> str:
         JSON string with validation results, warnings, and errors
     """
     try:
-        logger.info(f"Validating IDF: {idf_path}")
-        validation_result = ep_manager.validate_idf(idf_path)
+        logger.info("Validating IDF: %s", idf_path)
+        validation_result = await _run_blocking(ep_manager.validate_idf, idf_path)
         return f"Validation results for {idf_path}:\n{validation_result}"
     except FileNotFoundError as e:
-        logger.warning(f"IDF file not found: {idf_path}")
-        return f"File not found: {str(e)}"
+        logger.warning("IDF file not found: %s", idf_path)
+        return _file_not_found(e)
     except Exception as e:
-        logger.error(f"Error validating IDF {idf_path}: {str(e)}")
+        logger.error("Error validating IDF %s: %s", idf_path, e)
+        # Kept inline: this response has no "for" before the path
         return f"Error validating IDF {idf_path}: {str(e)}"
 
 
@@ -815,18 +900,18 @@ async def get_output_variables(idf_path: str, discover_available: bool = False,
         When discover_available=False, shows only currently configured Output:Variable and Output:Meter objects.
     """
     try:
-        logger.info(f"Getting output variables: {idf_path} (discover_available={discover_available})")
-        result = ep_manager.get_output_variables(idf_path, discover_available, run_days)
+        logger.info("Getting output variables: %s (discover_available=%s)", idf_path, discover_available)
+        result = await _query_outputs(ep_manager.get_output_variables, idf_path, discover_available, run_days)
         
         mode = "available variables discovery" if discover_available else "configured variables"
         return f"Output variables ({mode}) for {idf_path}:\n{result}"
         
     except FileNotFoundError as e:
-        logger.warning(f"IDF file not found: {idf_path}")
-        return f"File not found: {str(e)}"
+        logger.warning("IDF file not found: %s", idf_path)
+        return _file_not_found(e)
     except Exception as e:
-        logger.error(f"Error getting output variables for {idf_path}: {str(e)}")
-        return f"Error getting output variables for {idf_path}: {str(e)}"
+        logger.error("Error getting output variables for %s: %s", idf_path, e)
+        return _tool_error("getting output variables", e, idf_path)
 
 
 @mcp.tool()
@@ -846,18 +931,49 @@ async def get_output_meters(idf_path: str, discover_available: bool = False, run
         When discover_available=False, shows only currently configured Output:Meter objects.
     """
     try:
-        logger.info(f"Getting output meters: {idf_path} (discover_available={discover_available})")
-        result = ep_manager.get_output_meters(idf_path, discover_available, run_days)
+        logger.info("Getting output meters: %s (discover_available=%s)", idf_path, discover_available)
+        result = await _query_outputs(ep_manager.get_output_meters, idf_path, discover_available, run_days)
         
         mode = "available meters discovery" if discover_available else "configured meters"
         return f"Output meters ({mode}) for {idf_path}:\n{result}"
         
     except FileNotFoundError as e:
-        logger.warning(f"IDF file not found: {idf_path}")
-        return f"File not found: {str(e)}"
+        logger.warning("IDF file not found: %s", idf_path)
+        return _file_not_found(e)
+    except Exception as e:
+        logger.error("Error getting output meters for %s: %s", idf_path, e)
+        return _tool_error("getting output meters", e, idf_path)
+
+
+@mcp.tool()
+async def get_outputs(idf_path: str, discover_available: bool = False, run_days: int = 1) -> str:
+    """
+    Get output variables and output meters together - either configured ones or all available ones
+    
+    Args:
+        idf_path: Path to the IDF file (can be absolute, relative, or just filename for sample files)
+        discover_available: If True, runs a single short simulation to discover all available
+                          variables and meters. If False, returns the currently configured
+                          Output:Variable and Output:Meter objects (default: False)
+        run_days: Number of days to run for discovery simulation (default: 1, only used if discover_available=True)
+    
+    Returns:
+        JSON string with "output_variables" and "output_meters" sections, in the same format as
+        get_output_variables and get_output_meters
+    """
+    try:
+        logger.info("Getting outputs: %s (discover_available=%s)", idf_path, discover_available)
+        result = await _query_outputs(ep_manager.get_outputs, idf_path, discover_available, run_days)
+        
+        mode = "available outputs discovery" if discover_available else "configured outputs"
+        return f"Outputs ({mode}) for {idf_path}:\n{result}"
+        
+    except FileNotFoundError as e:
+        logger.warning("IDF file not found: %s", idf_path)
+        return _file_not_found(e)
     except Exception as e:
-        logger.error(f"Error getting output meters for {idf_path}: {str(e)}")
-        return f"Error getting output meters for {idf_path}: {str(e)}"
+        logger.error("Error getting outputs for %s: %s", idf_path, e)
+        return _tool_error("getting outputs", e, idf_path)
 
 
 @mcp.tool()
@@ -902,27 +1018,29 @@ async def add_output_variables(
         ], validation_level="strict")
     """
     try:
-        logger.info(f"Adding output variables: {idf_path} ({len(variables)} variables, {validation_level} validation)")
+        logger.info("Adding output variables: %s (%s variables, %s validation)", idf_path, len(variables), validation_level)
         
-        result = ep_manager.add_output_variables(
+        result = await _run_blocking(
+            ep_manager.add_output_variables,
             idf_path=idf_path,
             variables=variables,
             validation_level=validation_level,
             allow_duplicates=allow_duplicates,
-            output_path=output_path
+            output_path=output_path,
+            pool=_EDIT_POOL
         )
         
         return f"Output variables addition results:\n{result}"
         
     except FileNotFoundError as e:
-        logger.warning(f"IDF file not found: {idf_path}")
-        return f"File not found: {str(e)}"
+        logger.warning("IDF file not found: %s", idf_path)
+        return _file_not_found(e)
     except ValueError as e:
-        logger.warning(f"Invalid arguments for add_output_variables: {str(e)}")
-        return f"Invalid arguments: {str(e)}"
+        logger.warning("Invalid arguments for add_output_variables: %s", e)
+        return _invalid_arguments(e)
     except Exception as e:
-        logger.error(f"Error adding output variables: {str(e)}")
-        return f"Error adding output variables: {str(e)}"
+        logger.error("Error adding output variables: %s", e)
+        return _tool_error("adding output variables", e)
 
 
 @mcp.tool()
@@ -968,33 +1086,98 @@ async def add_output_meters(
         ], validation_level="strict")
     """
     try:
-        logger.info(f"Adding output meters: {idf_path} ({len(meters)} meters, {validation_level} validation)")
+        logger.info("Adding output meters: %s (%s meters, %s validation)", idf_path, len(meters), validation_level)
         
-        result = ep_manager.add_output_meters(
+        result = await _run_blocking(
+            ep_manager.add_output_meters,
             idf_path=idf_path,
             meters=meters,
             validation_level=validation_level,
             allow_duplicates=allow_duplicates,
-            output_path=output_path
+            output_path=output_path,
+            pool=_EDIT_POOL
         )
         
         return f"Output meters addition results:\n{result}"
         
     except FileNotFoundError as e:
-        logger.warning(f"IDF file not found: {idf_path}")
-        return f"File not found: {str(e)}"
+        logger.warning("IDF file not found: %s", idf_path)
+        return _file_not_found(e)
+    except ValueError as e:
+        logger.warning("Invalid arguments for add_output_meters: %s", e)
+        return _invalid_arguments(e)
+    except Exception as e:
+        logger.error("Error adding output meters: %s", e)
+        return _tool_error("adding output meters", e)
+
+
+@mcp.tool()
+async def add_outputs(
+    idf_path: str,
+    variables: Optional[List] = None,  # Same formats as add_output_variables
+    meters: Optional[List] = None,  # Same formats as add_output_meters
+    validation_level: str = "moderate",
+    allow_duplicates: bool = False,
+    output_path: Optional[str] = None
+) -> str:
+    """
+    Add output variables and output meters to an EnergyPlus IDF file in one step
+    
+    Use this instead of calling add_output_variables and add_output_meters one after the other:
+    the model is read and written only once.
+    
+    Args:
+        idf_path: Path to the input IDF file (can be absolute, relative, or filename for sample files)
+        variables: Variable specifications in any format accepted by add_output_variables
+        meters: Meter specifications in any format accepted by add_output_meters
+        validation_level: "strict", "moderate" (default), or "lenient"
+        allow_duplicates: Whether to allow duplicate output specifications (default: False)
+        output_path: Optional path for output file (if None, creates one with _with_outputs suffix)
+    
+    Returns:
+        JSON string with separate results for the added variables and meters
+        
+    Examples:
+        add_outputs("model.idf",
+                    variables=["Zone Air Temperature"],
+                    meters=["Electricity:Facility", ["NaturalGas:Facility", "daily"]])
+    """
+    try:
+        if not variables and not meters:
+            raise ValueError("At least one output variable or meter is required")
+        
+        logger.info("Adding outputs: %s (%s variables, %s meters, %s validation)",
+                    idf_path, len(variables or []), len(meters or []), validation_level)
+        
+        result = await _run_blocking(
+            ep_manager.add_outputs,
+            idf_path=idf_path,
+            variables=variables,
+            meters=meters,
+            validation_level=validation_level,
+            allow_duplicates=allow_duplicates,
+            output_path=output_path,
+            pool=_EDIT_POOL
+        )
+        
+        return f"Outputs addition results:\n{result}"
+        
+    except FileNotFoundError as e:
+        logger.warning("IDF file not found: %s", idf_path)
+        return _file_not_found(e)
     except ValueError as e:
-        logger.warning(f"Invalid arguments for add_output_meters: {str(e)}")
-        return f"Invalid arguments: {str(e)}"
+        logger.warning("Invalid arguments for add_outputs: %s", e)
+        return _invalid_arguments(e)
     except Exception as e:
-        logger.error(f"Error adding output meters: {str(e)}")
-        return f"Error adding output meters: {str(e)}"
+        logger.error("Error adding outputs: %s", e)
+        return _tool_error("adding outputs", e)
 
 
 @mcp.tool()
 async def list_available_files(
     include_example_files: bool = False,
-    include_weather_data: bool = False
+    include_weather_data: bool = False,
+    limit: Optional[int] = None
 ) -> str:
     """
     List available files in specified directories
@@ -1002,17 +1185,41 @@ async def list_available_files(
     Args:
         include_example_files: Whether to include EnergyPlus example files directory (default: False)
         include_weather_data: Whether to include EnergyPlus weather data directory (default: False)
+        limit: Maximum number of files to list per directory (default: None, no limit). A directory
+               that has more files lists the first ones by name and is marked "truncated"
     
     Returns:
         JSON string with available files organized by source and type. Always includes sample_files directory.
     """
     try:
-        logger.info(f"Listing available files (example_files={include_example_files}, weather_data={include_weather_data})")
-        files = ep_manager.list_available_files(include_example_files, include_weather_data)
+        logger.info("Listing available files (example_files=%s, weather_data=%s, limit=%s)",
+                    include_example_files, include_weather_data, limit)
+        files = await _run_blocking(ep_manager.list_available_files, include_example_files, include_weather_data, limit)
         return f"Available files:\n{files}"
+    except ValueError as e:
+        logger.warning("Invalid arguments for list_available_files: %s", e)
+        return _invalid_arguments(e)
     except Exception as e:
-        logger.error(f"Error listing available files: {str(e)}")
-        return f"Error listing available files: {str(e)}"
+        logger.error("Error listing available files: %s", e)
+        return _tool_error("listing available files", e)
+
+
+# Configuration info rarely changes while the server runs, so it is served from
+# this cache and refreshed in the background once it is older than the TTL
+_CONFIG_INFO_TTL = 60.0  # seconds
+_config_info_cache: Dict[str, Any] = {"value": None, "timestamp": 0.0, "refresh_task": None}
+
+
+async def _refresh_config_info() -> None:
+    """Recompute the cached configuration info off the request path"""
+    try:
+        value = await _run_blocking(ep_manager.get_configuration_info)
+        _config_info_cache["value"] = value
+        _config_info_cache["timestamp"] = time.monotonic()
+    except Exception as e:
+        logger.warning("Background refresh of configuration info failed: %s", e)
+    finally:
+        _config_info_cache["refresh_task"] = None
 
 
 @mcp.tool()
@@ -1025,57 +1232,94 @@ async def get_server_configuration() -> str:
     """
     try:
         logger.info("Getting server configuration")
-        config_info = ep_manager.get_configuration_info()
+        config_info = _config_info_cache["value"]
+        
+        if config_info is None:
+            config_info = await _run_blocking(ep_manager.get_configuration_info)
+            _config_info_cache["value"] = config_info
+            _config_info_cache["timestamp"] = time.monotonic()
+        elif (time.monotonic() - _config_info_cache["timestamp"] > _CONFIG_INFO_TTL
+              and _config_info_cache["refresh_task"] is None):
+            # Serve the stale copy now and refresh it for the next caller
+            _config_info_cache["refresh_task"] = asyncio.create_task(_refresh_config_info())
+        
         return f"Current server configuration:\n{config_info}"
     except Exception as e:
-        logger.error(f"Error getting configuration: {str(e)}")
-        return f"Error getting configuration: {str(e)}"
+        logger.error("Error getting configuration: %s", e)
+        return _tool_error("getting configuration", e)
+
+
+@functools.lru_cache(maxsize=None)
+def _get_system_info() -> Dict[str, str]:
+    """Python and platform details for the status report (computed once per process)"""
+    return {
+        "python_version": sys.version,
+        "platform": platform.platform(),
+        "architecture": platform.architecture()[0]
+    }
+
+
+# Installation paths rarely change, so get_server_status re-checks them at most this often
+_INSTALL_CHECK_TTL = 30  # seconds
+
+
+@functools.lru_cache(maxsize=8)
+def _path_exists_cached(path: str, time_bucket: int) -> bool:
+    """os.path.exists memoized per TTL window (time_bucket changes every _INSTALL_CHECK_TTL seconds)"""
+    return os.path.exists(path)
+
+
+def _install_path_exists(path: Optional[str]) -> bool:
+    """Whether a static installation path exists, re-checked at most every _INSTALL_CHECK_TTL seconds"""
+    if not path:
+        return False
+    return _path_exists_cached(path, int(time.monotonic()) // _INSTALL_CHECK_TTL)
 
 
 @mcp.tool()
-async def get_server_status() -> str:
+async def get_server_status(pretty: bool = False) -> str:
     """
     Get current server status and health information
     
+    Args:
+        pretty: Indent the JSON output for human reading (default: False, compact)
+    
     Returns:
         JSON string with server status
     """
     try:
-        import sys
-        import platform
-        from datetime import datetime
-        
         status_info = {
             "server": {
                 "name": config.server.name,
                 "version": config.server.version,
                 "status": "running",
-                "startup_time": datetime.now().isoformat(),
+                "startup_time": _SERVER_START_TIME,
                 "debug_mode": config.debug_mode
             },
-            "system": {
-                "python_version": sys.version,
-                "platform": platform.platform(),
-                "architecture": platform.architecture()[0]
-            },
+            "system": _get_system_info(),
             "energyplus": {
                 "version": config.energyplus.version,
-                "idd_available": os.path.exists(config.energyplus.idd_path) if config.energyplus.idd_path else False,
-                "executable_available": os.path.exists(config.energyplus.executable_path) if config.energyplus.executable_path else False
+                "idd_available": _install_path_exists(config.energyplus.idd_path),
+                "executable_available": _install_path_exists(config.energyplus.executable_path)
             },
             "paths": {
-                "sample_files_available": os.path.exists(config.paths.sample_files_path),
+                "sample_files_available": _install_path_exists(config.paths.sample_files_path),
                 "temp_dir_available": os.path.exists(config.paths.temp_dir),
                 "output_dir_available": os.path.exists(config.paths.output_dir)
-            }
+            },
+            "simulations": {
+                "max_parallel": config.server.max_parallel_simulations,
+                "running": _simulation_counts["running"],
+                "queued": _simulation_counts["queued"]
+            },
+            "caches": ep_manager.get_cache_stats()
         }
         
-        import json
-        return f"Server status:\n{json.dumps(status_info, indent=2)}"
+        return f"Server status:\n{_dumps(status_info, pretty=pretty)}"
         
     except Exception as e:
-        logger.error(f"Error getting server status: {str(e)}")
-        return f"Error getting server status: {str(e)}"
+        logger.error("Error getting server status: %s", e)
+        return _tool_error("getting server status", e)
 
 
 @mcp.tool()
@@ -1090,15 +1334,15 @@ async def discover_hvac_loops(idf_path: str) -> str:
         JSON string with all HVAC loops found, organized by type
     """
     try:
-        logger.info(f"Discovering HVAC loops: {idf_path}")
-        loops = ep_manager.discover_hvac_loops(idf_path)
+        logger.info("Discovering HVAC loops: %s", idf_path)
+        loops = await _run_blocking(ep_manager.discover_hvac_loops, idf_path)
         return f"HVAC loops discovered in {idf_path}:\n{loops}"
     except FileNotFoundError as e:
-        logger.warning(f"IDF file not found: {idf_path}")
-        return f"File not found: {str(e)}"
+        logger.warning("IDF file not found: %s", idf_path)
+        return _file_not_found(e)
     except Exception as e:
-        logger.error(f"Error discovering HVAC loops for {idf_path}: {str(e)}")
-        return f"Error discovering HVAC loops for {idf_path}: {str(e)}"
+        logger.error("Error discovering HVAC loops for %s: %s", idf_path, e)
+        return _tool_error("discovering HVAC loops", e, idf_path)
 
 
 @mcp.tool()
@@ -1114,18 +1358,18 @@ async def get_loop_topology(idf_path: str, loop_name: str) -> str:
         JSON string with detailed loop topology including supply/demand sides, branches, and components
     """
     try:
-        logger.info(f"Getting loop topology for '{loop_name}': {idf_path}")
-        topology = ep_manager.get_loop_topology(idf_path, loop_name)
+        logger.info("Getting loop topology for '%s': %s", loop_name, idf_path)
+        topology = await _run_blocking(ep_manager.get_loop_topology, idf_path, loop_name)
         return f"Loop topology for '{loop_name}' in {idf_path}:\n{topology}"
     except FileNotFoundError as e:
-        logger.warning(f"IDF file not found: {idf_path}")
-        return f"File not found: {str(e)}"
+        logger.warning("IDF file not found: %s", idf_path)
+        return _file_not_found(e)
     except ValueError as e:
-        logger.warning(f"Loop not found: {loop_name}")
+        logger.warning("Loop not found: %s", loop_name)
         return f"Loop not found: {str(e)}"
     except Exception as e:
-        logger.error(f"Error getting loop topology for {idf_path}: {str(e)}")
-        return f"Error getting loop topology for {idf_path}: {str(e)}"
+        logger.error("Error getting loop topology for %s: %s", idf_path, e)
+        return _tool_error("getting loop topology", e, idf_path)
 
 
 @mcp.tool()
@@ -1150,15 +1394,15 @@ async def visualize_loop_diagram(
         JSON string with diagram generation results and file path
     """
     try:
-        logger.info(f"Creating loop diagram for '{loop_name or 'all loops'}': {idf_path} (show_legend={show_legend})")
-        result = ep_manager.visualize_loop_diagram(idf_path, loop_name, output_path, format, show_legend)
+        logger.info("Creating loop diagram for '%s': %s (show_legend=%s)", loop_name or 'all loops', idf_path, show_legend)
+        result = await _run_blocking(ep_manager.visualize_loop_diagram, idf_path, loop_name, output_path, format, show_legend, pool=_EDIT_POOL)
         return f"Loop diagram created:\n{result}"
     except FileNotFoundError as e:
-        logger.warning(f"IDF file not found: {idf_path}")
-        return f"File not found: {str(e)}"
+        logger.warning("IDF file not found: %s", idf_path)
+        return _file_not_found(e)
     except Exception as e:
-        logger.error(f"Error creating loop diagram for {idf_path}: {str(e)}")
-        return f"Error creating loop diagram for {idf_path}: {str(e)}"
+        logger.error("Error creating loop diagram for %s: %s", idf_path, e)
+        return _tool_error("creating loop diagram", e, idf_path)
 
 
 @mcp.tool()
@@ -1168,7 +1412,7 @@ async def run_energyplus_simulation(
     output_directory: Optional[str] = None,
     annual: bool = True,
     design_day: bool = False,
-    readvars: bool = True,
+    readvars: Optional[bool] = None,
     expandobjects: bool = True
 ) -> str:
     """
@@ -1180,18 +1424,19 @@ async def run_energyplus_simulation(
         output_directory: Directory for simulation outputs (if None, creates timestamped directory in outputs/)
         annual: Run annual simulation (default: True)
         design_day: Run design day only simulation (default: False) 
-        readvars: Run ReadVarsESO after simulation to process outputs (default: True)
+        readvars: Run ReadVarsESO after simulation to process outputs (default: None, which runs it
+                  only when the model has Output:Variable or Output:Meter objects)
         expandobjects: Run ExpandObjects prior to simulation for HVAC templates (default: True)
     
     Returns:
         JSON string with simulation results, duration, and output file paths
     """
     try:
-        logger.info(f"Running EnergyPlus simulation: {idf_path}")
+        logger.info("Running EnergyPlus simulation: %s", idf_path)
         if weather_file:
-            logger.info(f"With weather file: {weather_file}")
+            logger.info("With weather file: %s", weather_file)
         
-        result = ep_manager.run_simulation(
+        result = await _run_simulation(
             idf_path=idf_path,
             weather_file=weather_file,
             output_directory=output_directory,
@@ -1202,11 +1447,104 @@ async def run_energyplus_simulation(
         )
         return f"EnergyPlus simulation completed:\n{result}"
     except FileNotFoundError as e:
-        logger.warning(f"File not found for simulation: {str(e)}")
-        return f"File not found: {str(e)}"
+        logger.warning("File not found for simulation: %s", e)
+        return _file_not_found(e)
+    except Exception as e:
+        logger.error("Error running EnergyPlus simulation: %s", e)
+        return _tool_error("running simulation", e)
+
+
+@mcp.tool()
+async def run_energyplus_simulations(
+    jobs: List[Dict[str, Any]],
+    weather_file: Optional[str] = None,
+    annual: bool = True,
+    design_day: bool = False,
+    readvars: Optional[bool] = None,
+    expandobjects: bool = True
+) -> str:
+    """
+    Run several EnergyPlus simulations in parallel (e.g. parametric variants of one model)
+    
+    Args:
+        jobs: List of simulation jobs. Each job is a dict with a required "idf_path" and optional
+              "weather_file", "output_directory", "annual", "design_day", "readvars" and
+              "expandobjects" keys that override the shared settings below
+        weather_file: Weather file (.epw) or city name shared by all jobs that do not set their own
+        annual: Run annual simulations (default: True)
+        design_day: Run design day only simulations (default: False)
+        readvars: Run ReadVarsESO after each simulation (default: None, which decides per model
+                  based on its Output:Variable and Output:Meter objects)
+        expandobjects: Run ExpandObjects prior to each simulation (default: True)
+    
+    Returns:
+        JSON string with one result entry per job, in the order the jobs were given
+    
+    Examples:
+        run_energyplus_simulations([
+            {"idf_path": "model.idf"},
+            {"idf_path": "model_modified.idf"}
+        ], weather_file="San Francisco")
+    """
+    try:
+        if not jobs:
+            raise ValueError("At least one simulation job is required")
+        for index, job in enumerate(jobs):
+            if not isinstance(job, dict) or not job.get("idf_path"):
+                raise ValueError(f"Job {index} must be a dict with an 'idf_path'")
+        
+        logger.info("Running %s EnergyPlus simulations", len(jobs))
+        
+        # Jobs without an explicit output directory get their own folder in a batch directory.
+        # mkdtemp makes the batch directory unique, so batches started in the same second
+        # (or concurrently) never share folders
+        batch_dir = None
+        if any(not job.get("output_directory") for job in jobs):
+            os.makedirs(config.paths.output_dir, exist_ok=True)
+            batch_dir = Path(tempfile.mkdtemp(
+                dir=config.paths.output_dir, prefix=f"batch_{datetime.now().strftime('%Y%m%d_%H%M%S')}_"
+            ))
+        
+        async def run_job(index: int, job: Dict[str, Any]) -> Dict[str, Any]:
+            output_directory = job.get("output_directory") or str(
+                batch_dir / f"job_{index + 1:02d}_{Path(job['idf_path']).stem}"
+            )
+            try:
+                result = await _run_simulation(
+                    runner=ep_manager.run_simulation_dict,
+                    idf_path=job["idf_path"],
+                    weather_file=job.get("weather_file", weather_file),
+                    output_directory=output_directory,
+                    annual=job.get("annual", annual),
+                    design_day=job.get("design_day", design_day),
+                    readvars=job.get("readvars", readvars),
+                    expandobjects=job.get("expandobjects", expandobjects)
+                )
+                return {"job": index, "idf_path": job["idf_path"], "result": result}
+            except Exception as e:
+                logger.warning("Simulation job %s (%s) failed: %s", index, job["idf_path"], e)
+                return {"job": index, "idf_path": job["idf_path"], "success": False, "error": str(e)}
+        
+        results = await asyncio.gather(*(run_job(index, job) for index, job in enumerate(jobs)))
+        # A job fails either by raising or by the runner reporting an unsuccessful simulation
+        failed = sum(
+            1 for entry in results
+            if entry.get("success") is False or entry.get("result", {}).get("success") is False
+        )
+        
+        summary = {
+            "total_jobs": len(jobs),
+            "succeeded": len(jobs) - failed,
+            "failed": failed,
+            "results": results
+        }
+        return f"EnergyPlus batch simulation completed:\n{_dumps(summary, pretty=True)}"
+    except ValueError as e:
+        logger.warning("Invalid arguments for run_energyplus_simulations: %s", e)
+        return _invalid_arguments(e)
     except Exception as e:
-        logger.error(f"Error running EnergyPlus simulation: {str(e)}")
-        return f"Error running simulation: {str(e)}"
+        logger.error("Error running EnergyPlus batch simulation: %s", e)
+        return _tool_error("running batch simulation", e)
 
 
 @mcp.tool()
@@ -1229,117 +1567,164 @@ async def create_interactive_plot(
         JSON string with plot creation results and file path
     """
     try:
-        logger.info(f"Creating interactive plot from: {output_directory}")
-        result = ep_manager.create_interactive_plot(output_directory, idf_name, file_type, custom_title)
+        logger.info("Creating interactive plot from: %s", output_directory)
+        result = await _run_blocking(ep_manager.create_interactive_plot, output_directory, idf_name, file_type, custom_title,
+                                     pool=_EDIT_POOL)
         return f"Interactive plot created:\n{result}"
     except FileNotFoundError as e:
-        logger.warning(f"Output files not found: {str(e)}")
+        logger.warning("Output files not found: %s", e)
         return f"Files not found: {str(e)}"
     except Exception as e:
-        logger.error(f"Error creating interactive plot: {str(e)}")
-        return f"Error creating interactive plot: {str(e)}"
+        logger.error("Error creating interactive plot: %s", e)
+        return _tool_error("creating interactive plot", e)
+
+
+# Block size used to read log files backwards
+_LOG_READ_CHUNK = 64 * 1024
+
+# Log locations written by Config._setup_logging; the workspace root is fixed at startup
+_LOG_DIR = Path(config.paths.workspace_root) / "logs"
+_SERVER_LOG_FILE = _LOG_DIR / "energyplus_mcp_server.log"
+_ERROR_LOG_FILE = _LOG_DIR / "energyplus_mcp_errors.log"
+
+
+def _read_log_tail(log_file: Path, lines: int) -> tuple:
+    """
+    Return a log file's size and last lines without reading the whole file
+    
+    The file is read backwards from the end in fixed-size blocks, only until the line
+    break before the oldest requested line has been seen. Only the returned lines are decoded.
+    At least one line is returned from a non-empty file, even if lines is zero or negative.
+    
+    Returns:
+        Tuple of (file size in bytes, list of the most recent lines)
+    """
+    lines = max(1, lines)
+    with open(log_file, 'rb') as f:
+        size = f.seek(0, os.SEEK_END)
+        position = size
+        blocks = []
+        line_breaks = 0
+        while position > 0:
+            read_size = min(_LOG_READ_CHUNK, position)
+            position -= read_size
+            f.seek(position)
+            block = f.read(read_size)
+            blocks.append(block)
+            line_breaks += block.count(b"\n")
+            # A line break at the end of the file ends the last line rather than starting a new one
+            if line_breaks - blocks[0].endswith(b"\n") >= lines:
+                break
+    
+    tail = b"".join(reversed(blocks))
+    recent_lines = tail.splitlines(keepends=True)[-lines:]
+    return size, [line.decode('utf-8', errors='replace') for line in recent_lines]
 
 
 @mcp.tool()
-async def get_server_logs(lines: int = 50) -> str:
+async def get_server_logs(lines: int = 50, pretty: bool = False) -> str:
     """
     Get recent server log entries
     
     Args:
-        lines: Number of recent log lines to return (default 50)
+        lines: Number of recent log lines to return (default 50, at least 1)
+        pretty: Indent the JSON output for human reading (default: False, compact)
     
     Returns:
-        Recent log entries as text
+        Recent log entries as text. The JSON reports the log's size as "log_size_bytes"; it
+        replaces the former "total_lines" count, which required reading the whole file
     """
     try:
-        log_file = Path(config.paths.workspace_root) / "logs" / "energyplus_mcp_server.log"
+        log_file = _SERVER_LOG_FILE
         
-        if not log_file.exists():
+        # Read last N lines efficiently; opening the file doubles as the existence check
+        try:
+            log_size, recent_lines = await _run_blocking(_read_log_tail, log_file, lines)
+        except FileNotFoundError:
             return "Log file not found. Server may be using console logging only."
         
-        # Read last N lines efficiently
-        with open(log_file, 'r') as f:
-            all_lines = f.readlines()
-            recent_lines = all_lines[-lines:] if len(all_lines) > lines else all_lines
-        
         log_content = {
             "log_file": str(log_file),
-            "total_lines": len(all_lines),
+            "log_size_bytes": log_size,
             "showing_lines": len(recent_lines),
             "recent_logs": "".join(recent_lines)
         }
         
-        return f"Recent server logs:\n{json.dumps(log_content, indent=2)}"
+        return f"Recent server logs:\n{_dumps(log_content, pretty=pretty)}"
         
     except Exception as e:
-        logger.error(f"Error reading server logs: {str(e)}")
-        return f"Error reading server logs: {str(e)}"
+        logger.error("Error reading server logs: %s", e)
+        return _tool_error("reading server logs", e)
 
 
 @mcp.tool()
-async def get_error_logs(lines: int = 20) -> str:
+async def get_error_logs(lines: int = 20, pretty: bool = False) -> str:
     """
     Get recent error log entries
     
     Args:
-        lines: Number of recent error lines to return (default 20)
+        lines: Number of recent error lines to return (default 20, at least 1)
+        pretty: Indent the JSON output for human reading (default: False, compact)
     
     Returns:
-        Recent error log entries as text
+        Recent error log entries as text. The JSON reports the log's size as "error_log_size_bytes";
+        it replaces the former "total_error_lines" count, which required reading the whole file
     """
     try:
-        error_log_file = Path(config.paths.workspace_root) / "logs" / "energyplus_mcp_errors.log"
+        error_log_file = _ERROR_LOG_FILE
         
-        if not error_log_file.exists():
+        try:
+            log_size, recent_lines = await _run_blocking(_read_log_tail, error_log_file, lines)
+        except FileNotFoundError:
             return "Error log file not found. No errors logged yet."
         
-        with open(error_log_file, 'r') as f:
-            all_lines = f.readlines()
-            recent_lines = all_lines[-lines:] if len(all_lines) > lines else all_lines
-        
         error_content = {
             "error_log_file": str(error_log_file),
-            "total_error_lines": len(all_lines),
+            "error_log_size_bytes": log_size,
             "showing_lines": len(recent_lines),
             "recent_errors": "".join(recent_lines)
         }
         
-        return f"Recent error logs:\n{json.dumps(error_content, indent=2)}"
+        return f"Recent error logs:\n{_dumps(error_content, pretty=pretty)}"
         
     except Exception as e:
-        logger.error(f"Error reading error logs: {str(e)}")
-        return f"Error reading error logs: {str(e)}"
+        logger.error("Error reading error logs: %s", e)
+        return _tool_error("reading error logs", e)
 
 
 @mcp.tool()
-async def clear_logs() -> str:
+async def clear_logs(pretty: bool = False) -> str:
     """
     Clear/rotate current log files (creates backup)
     
+    Args:
+        pretty: Indent the JSON output for human reading (default: False, compact)
+    
     Returns:
         Status of log clearing operation
     """
     try:
-        log_dir = Path(config.paths.workspace_root) / "logs"
+        log_dir = _LOG_DIR
         
         if not log_dir.exists():
             return "No log directory found."
         
         cleared_files = []
+        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
         
-        # Main log file
-        main_log = log_dir / "energyplus_mcp_server.log"
-        if main_log.exists():
-            backup_name = f"energyplus_mcp_server_backup_{datetime.now().strftime('%Y%m%d_%H%M%S')}.log"
-            main_log.rename(log_dir / backup_name)
-            cleared_files.append(str(main_log))
+        # Main log file and error log file, each moved to a timestamped backup
+        rotation_plan = [
+            (_SERVER_LOG_FILE, log_dir / f"energyplus_mcp_server_backup_{timestamp}.log"),
+            (_ERROR_LOG_FILE, log_dir / f"energyplus_mcp_errors_backup_{timestamp}.log")
+        ]
         
-        # Error log file
-        error_log = log_dir / "energyplus_mcp_errors.log"
-        if error_log.exists():
-            backup_name = f"energyplus_mcp_errors_backup_{datetime.now().strftime('%Y%m%d_%H%M%S')}.log"
-            error_log.rename(log_dir / backup_name)
-            cleared_files.append(str(error_log))
+        # os.replace doubles as the existence check; a missing log simply isn't rotated
+        for log_file, backup_file in rotation_plan:
+            try:
+                os.replace(log_file, backup_file)
+                cleared_files.append(str(log_file))
+            except FileNotFoundError:
+                pass
         
         result = {
             "success": True,
@@ -1349,17 +1734,17 @@ async def clear_logs() -> str:
         }
         
         logger.info("Log files cleared and backed up")
-        return json.dumps(result, indent=2)
+        return _dumps(result, pretty=pretty)
         
     except Exception as e:
-        logger.error(f"Error clearing logs: {str(e)}")
-        return f"Error clearing logs: {str(e)}"
+        logger.error("Error clearing logs: %s", e)
+        return _tool_error("clearing logs", e)
 
 
 if __name__ == "__main__":
-    logger.info(f"Starting {config.server.name} v{config.server.version}")
-    logger.info(f"EnergyPlus version: {config.energyplus.version}")
-    logger.info(f"Sample files path: {config.paths.sample_files_path}")
+    logger.info("Starting %s v%s", config.server.name, config.server.version)
+    logger.info("EnergyPlus version: %s", config.energyplus.version)
+    logger.info("Sample files path: %s", config.paths.sample_files_path)
     
     try:
         # Use FastMCP's built-in run method with stdio transport
@@ -1367,7 +1752,7 @@ if __name__ == "__main__":
     except KeyboardInterrupt:
         logger.info("Server shutdown requested")
     except Exception as e:
-        logger.error(f"Server error: {str(e)}")
+        logger.error("Server error: %s", e)
         raise
     finally:
         logger.info("Server stopped")
@@ -18,9 +18,12 @@ from .output_meters import OutputMeterManager
 from .people_utils import PeopleManager
 from .lights_utils import LightsManager
 from .electric_equipment_utils import ElectricEquipmentManager
+from .idf_cache import get_idf, parse_idf, clear_idf_cache, idf_cache_info
+from .runner import run_idf
 from .path_utils import (
     PathResolver,
     resolve_path,
+    input_search_dirs,
     resolve_idf_path,
     resolve_weather_file_path,
     resolve_output_path,
@@ -41,8 +44,14 @@ __all__ = [
     "PeopleManager",
     "LightsManager",
     "ElectricEquipmentManager",
+    "get_idf",
+    "parse_idf",
+    "clear_idf_cache",
+    "idf_cache_info",
+    "run_idf",
     "PathResolver",
     "resolve_path",
+    "input_search_dirs",
     "resolve_idf_path",
     "resolve_weather_file_path",
     "resolve_output_path",
@@ -9,10 +9,11 @@ any required approvals from the U.S. Dept. of Energy). All rights reserved.
 See License.txt in the parent directory for license details.
 """
 
-import json
 from graphviz import Digraph  # first and only import shown
 import os
 
+from .jsonx import loads
+
 
 class HVACDiagramGenerator:
     """Generate a hierarchical HVAC loop diagram with Graphviz."""
@@ -50,14 +51,14 @@ class HVACDiagramGenerator:
     # Public API -------------------------------------------------------------
     def create_diagram_from_topology(
         self,
-        topology_json: str,
+        topology: str | dict,
         output_path: str,
         title: str | None = None,
         fmt: str = "png",
         show_legend: bool = True,
     ) -> dict:
-        """Parse JSON, build a Graphviz Digraph, and render to file."""
-        data = json.loads(topology_json)
+        """Build a Graphviz Digraph from topology data (dict or JSON string) and render to file."""
+        data = loads(topology) if isinstance(topology, str) else topology
 
         dot = Digraph(comment=title or data.get("loop_name", "HVAC Loop"))
         dot.attr(rankdir="LR", splines="spline", nodesep="0.35", ranksep="0.6")
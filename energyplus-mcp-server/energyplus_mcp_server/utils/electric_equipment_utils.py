@@ -11,11 +11,16 @@ See License.txt in the parent directory for license details.
 """
 
 import logging
+from types import MappingProxyType
 from typing import Dict, List, Any, Optional
-from eppy.modeleditor import IDF
+
+from .idf_cache import get_idf, parse_idf
 
 logger = logging.getLogger(__name__)
 
+# Shared read-only default for modifications without field updates
+_EMPTY_FIELD_UPDATES = MappingProxyType({})
+
 
 class ElectricEquipmentManager:
     """Manager for EnergyPlus ElectricEquipment objects"""
@@ -40,6 +45,33 @@ class ElectricEquipmentManager:
         "Data Center": 215.0
     }
     
+    # Valid ElectricEquipment object fields based on IDD
+    VALID_FIELDS = frozenset({
+        "Schedule_Name",
+        "Design_Level_Calculation_Method",
+        "Design_Level",
+        "Watts_per_Floor_Area",
+        "Watts_per_Person",
+        "Fraction_Latent",
+        "Fraction_Radiant",
+        "Fraction_Lost",
+        "EndUse_Subcategory"
+    })
+    
+    # Fraction fields that must be between 0.0 and 1.0
+    FRACTION_FIELDS = frozenset({
+        "Fraction_Latent",
+        "Fraction_Radiant",
+        "Fraction_Lost"
+    })
+    
+    # Numeric fields that must be >= 0
+    POSITIVE_NUMERIC_FIELDS = frozenset({
+        "Design_Level",
+        "Watts_per_Floor_Area",
+        "Watts_per_Person"
+    })
+    
     def __init__(self):
         """Initialize the ElectricEquipment manager"""
         pass
@@ -55,7 +87,7 @@ class ElectricEquipmentManager:
             Dictionary with electric equipment objects information
         """
         try:
-            idf = IDF(idf_path)
+            idf = get_idf(idf_path)
             equipment_objects = idf.idfobjects.get("ElectricEquipment", [])
             
             result = {
@@ -167,7 +199,7 @@ class ElectricEquipmentManager:
             Dictionary with modification results
         """
         try:
-            idf = IDF(idf_path)
+            idf = parse_idf(idf_path)
             equipment_objects = idf.idfobjects.get("ElectricEquipment", [])
             
             result = {
@@ -183,7 +215,7 @@ class ElectricEquipmentManager:
                 try:
                     # Apply modification based on target
                     target = mod_spec.get("target", "all")
-                    field_updates = mod_spec.get("field_updates", {})
+                    field_updates = mod_spec.get("field_updates", _EMPTY_FIELD_UPDATES)
                     
                     if target == "all":
                         # Apply to all ElectricEquipment objects
@@ -193,7 +225,7 @@ class ElectricEquipmentManager:
                             )
                     elif target.startswith("zone:"):
                         # Apply to ElectricEquipment objects in specific zone
-                        zone_name = target.replace("zone:", "").strip()
+                        zone_name = target[len("zone:"):].strip()
                         for equipment_obj in equipment_objects:
                             if getattr(equipment_obj, 'Zone_or_ZoneList_or_Space_or_SpaceList_Name', '') == zone_name:
                                 self._apply_equipment_modifications(
@@ -201,7 +233,7 @@ class ElectricEquipmentManager:
                                 )
                     elif target.startswith("name:"):
                         # Apply to specific ElectricEquipment object by name
-                        equipment_name = target.replace("name:", "").strip()
+                        equipment_name = target[len("name:"):].strip()
                         for equipment_obj in equipment_objects:
                             if getattr(equipment_obj, 'Name', '') == equipment_name:
                                 self._apply_equipment_modifications(
@@ -232,37 +264,10 @@ class ElectricEquipmentManager:
     def _apply_equipment_modifications(self, equipment_obj: Any, field_updates: Dict[str, Any], 
                                       result: Dict[str, Any]) -> None:
         """Apply field updates to an ElectricEquipment object"""
-        # Valid ElectricEquipment object fields based on IDD
-        valid_fields = {
-            "Schedule_Name",
-            "Design_Level_Calculation_Method", 
-            "Design_Level",
-            "Watts_per_Floor_Area",
-            "Watts_per_Person",
-            "Fraction_Latent",
-            "Fraction_Radiant",
-            "Fraction_Lost",
-            "EndUse_Subcategory"
-        }
-        
-        # Fraction fields that must be between 0.0 and 1.0
-        fraction_fields = {
-            "Fraction_Latent",
-            "Fraction_Radiant", 
-            "Fraction_Lost"
-        }
-        
-        # Numeric fields that must be >= 0
-        positive_numeric_fields = {
-            "Design_Level",
-            "Watts_per_Floor_Area",
-            "Watts_per_Person"
-        }
-        
         equipment_name = getattr(equipment_obj, 'Name', 'Unknown')
         
         for field_name, new_value in field_updates.items():
-            if field_name not in valid_fields:
+            if field_name not in self.VALID_FIELDS:
                 result["errors"].append(f"Invalid field '{field_name}' for ElectricEquipment object '{equipment_name}'")
                 continue
             
@@ -277,7 +282,7 @@ class ElectricEquipmentManager:
                         continue
                 
                 # Validate fraction fields (0.0 to 1.0)
-                if field_name in fraction_fields:
+                if field_name in self.FRACTION_FIELDS:
                     try:
                         float_value = float(new_value)
                         if not (0.0 <= float_value <= 1.0):
@@ -292,7 +297,7 @@ class ElectricEquipmentManager:
                         continue
                 
                 # Validate positive numeric fields
-                if field_name in positive_numeric_fields:
+                if field_name in self.POSITIVE_NUMERIC_FIELDS:
                     try:
                         float_value = float(new_value)
                         if float_value < 0.0:
@@ -339,19 +344,6 @@ class ElectricEquipmentManager:
             "warnings": []
         }
         
-        # Valid field names based on IDD
-        valid_fields = {
-            "Schedule_Name",
-            "Design_Level_Calculation_Method", 
-            "Design_Level",
-            "Watts_per_Floor_Area",
-            "Watts_per_Person",
-            "Fraction_Latent",
-            "Fraction_Radiant",
-            "Fraction_Lost",
-            "EndUse_Subcategory"
-        }
-        
         for i, mod_spec in enumerate(modifications):
             # Check required fields
             if "target" not in mod_spec:
@@ -368,10 +360,10 @@ class ElectricEquipmentManager:
                 # Validate individual field updates
                 field_updates = mod_spec["field_updates"]
                 for field_name, value in field_updates.items():
-                    if field_name not in valid_fields:
+                    if field_name not in self.VALID_FIELDS:
                         validation_result["errors"].append(
                             f"Modification {i}: Invalid field name '{field_name}'. "
-                            f"Valid fields: {sorted(valid_fields)}"
+                            f"Valid fields: {sorted(self.VALID_FIELDS)}"
                         )
                         validation_result["valid"] = False
                     
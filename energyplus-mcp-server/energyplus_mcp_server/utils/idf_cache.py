@@ -0,0 +1,75 @@
+"""
+Parsed IDF cache for EnergyPlus MCP Server
+Shares one parse of each unchanged IDF file between the read-only tools
+
+EnergyPlus Model Context Protocol Server (EnergyPlus-MCP)
+Copyright (c) 2025, The Regents of the University of California,
+through Lawrence Berkeley National Laboratory (subject to receipt of
+any required approvals from the U.S. Dept. of Energy). All rights reserved.
+
+See License.txt in the parent directory for license details.
+"""
+
+import os
+import functools
+import threading
+from typing import Optional
+from eppy.modeleditor import IDF
+
+# eppy loads the IDD into class attributes on first use and is not thread-safe while parsing.
+# Parsing is pure Python and holds the GIL anyway, so serializing it costs little
+_PARSE_LOCK = threading.Lock()
+
+
+def parse_idf(idf_path: str, weather_path: Optional[str] = None) -> IDF:
+    """
+    Parse a private, uncached copy of an IDF file
+    
+    Use this for models that will be modified or simulated; get_idf is for read-only use.
+    
+    Args:
+        idf_path: Path to an existing IDF file
+        weather_path: Weather file to attach to the model (optional)
+        
+    Returns:
+        Parsed IDF object
+    """
+    with _PARSE_LOCK:
+        if weather_path:
+            return IDF(idf_path, weather_path)
+        return IDF(idf_path)
+
+
+@functools.lru_cache(maxsize=32)
+def _parse_idf(idf_path: str, mtime_ns: int, size: int) -> IDF:
+    """Parse an IDF file (mtime_ns and size only key the cache)"""
+    return parse_idf(idf_path)
+
+
+def get_idf(idf_path: str) -> IDF:
+    """
+    Get the parsed IDF for read-only use, reusing the previous parse while the file is unchanged
+    
+    The returned object is shared between callers and must not be modified, including
+    the lists in idf.idfobjects (copy them before extending or sorting). Tools that edit
+    a model parse their own copy with parse_idf instead. The cached parse is replaced
+    once the file's modification time or size changes.
+    
+    Args:
+        idf_path: Path to an existing IDF file
+        
+    Returns:
+        Parsed IDF object
+    """
+    stat_result = os.stat(idf_path)
+    return _parse_idf(idf_path, stat_result.st_mtime_ns, stat_result.st_size)
+
+
+def clear_idf_cache() -> None:
+    """Drop all cached parses (e.g. after a tool has written an IDF file)"""
+    _parse_idf.cache_clear()
+
+
+def idf_cache_info():
+    """Hit/miss statistics of the parsed-IDF cache (functools cache_info named tuple)"""
+    return _parse_idf.cache_info()
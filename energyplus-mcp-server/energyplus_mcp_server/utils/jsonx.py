@@ -0,0 +1,93 @@
+"""
+JSON serialization helpers for EnergyPlus MCP Server.
+Uses orjson when it is installed and falls back to the standard library otherwise.
+
+EnergyPlus Model Context Protocol Server (EnergyPlus-MCP)
+Copyright (c) 2025, The Regents of the University of California,
+through Lawrence Berkeley National Laboratory (subject to receipt of
+any required approvals from the U.S. Dept. of Energy). All rights reserved.
+
+See License.txt in the parent directory for license details.
+"""
+
+import json
+import math
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # orjson is an optional speedup
+    orjson = None
+
+
+if orjson is not None:
+    _COMPACT_OPTIONS = orjson.OPT_NON_STR_KEYS
+    _PRETTY_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_INDENT_2
+
+
+def _default(obj: Any) -> Any:
+    """Convert values neither encoder handles natively (Decimal, dates for the stdlib path)"""
+    if isinstance(obj, Decimal):
+        value = float(obj)
+        return value if math.isfinite(value) else None
+    if isinstance(obj, (datetime, date)):
+        return obj.isoformat()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _replace_non_finite(obj: Any) -> Any:
+    """Replace NaN and infinite floats with None, the way orjson serializes them"""
+    if isinstance(obj, float):
+        return obj if math.isfinite(obj) else None
+    if isinstance(obj, dict):
+        return {key: _replace_non_finite(value) for key, value in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [_replace_non_finite(value) for value in obj]
+    return obj
+
+
+def dumps(obj: Any, pretty: bool = False) -> str:
+    """
+    Serialize an object to a JSON string
+
+    The output is the same with and without orjson: non-ASCII text is written as-is,
+    NaN and infinity become null, and compact output has no spaces after separators.
+
+    Args:
+        obj: Object to serialize
+        pretty: Indent the output with two spaces (same layout as json.dumps(obj, indent=2))
+
+    Returns:
+        JSON string
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(
+                obj, default=_default, option=_PRETTY_OPTIONS if pretty else _COMPACT_OPTIONS
+            ).decode()
+        except TypeError:
+            # orjson rejects a few values the stdlib encoder accepts (e.g. integers
+            # wider than 64 bits); let json.dumps handle or report those
+            pass
+
+    obj = _replace_non_finite(obj)
+    if pretty:
+        return json.dumps(obj, indent=2, ensure_ascii=False, default=_default)
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False, default=_default)
+
+
+def loads(data: Any) -> Any:
+    """
+    Parse a JSON document from a str or bytes
+
+    Args:
+        data: JSON text
+
+    Returns:
+        Parsed Python object
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
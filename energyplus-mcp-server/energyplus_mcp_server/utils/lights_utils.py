@@ -11,11 +11,16 @@ See License.txt in the parent directory for license details.
 """
 
 import logging
+from types import MappingProxyType
 from typing import Dict, List, Any, Optional
-from eppy.modeleditor import IDF
+
+from .idf_cache import get_idf, parse_idf
 
 logger = logging.getLogger(__name__)
 
+# Shared read-only default for modifications without field updates
+_EMPTY_FIELD_UPDATES = MappingProxyType({})
+
 
 class LightsManager:
     """Manager for EnergyPlus Lights objects"""
@@ -39,6 +44,42 @@ class LightsManager:
         "Workshop": 14.0
     }
     
+    # Valid Lights object fields based on IDD
+    VALID_FIELDS = frozenset({
+        "Schedule_Name",
+        "Design_Level_Calculation_Method",
+        "Lighting_Level",
+        "Watts_per_Floor_Area",  # Fixed field name
+        "Watts_per_Person",
+        "Return_Air_Fraction",
+        "Fraction_Radiant",
+        "Fraction_Visible",
+        "Fraction_Replaceable",
+        "EndUse_Subcategory",  # Fixed field name
+        "Return_Air_Fraction_Calculated_from_Plenum_Temperature",
+        "Return_Air_Fraction_Function_of_Plenum_Temperature_Coefficient_1",
+        "Return_Air_Fraction_Function_of_Plenum_Temperature_Coefficient_2",
+        "Return_Air_Heat_Gain_Node_Name",
+        "Exhaust_Air_Heat_Gain_Node_Name"
+    })
+    
+    # Fraction fields that must be between 0.0 and 1.0
+    FRACTION_FIELDS = frozenset({
+        "Return_Air_Fraction",
+        "Fraction_Radiant",
+        "Fraction_Visible",
+        "Fraction_Replaceable"
+    })
+    
+    # Numeric fields that must be >= 0
+    POSITIVE_NUMERIC_FIELDS = frozenset({
+        "Lighting_Level",
+        "Watts_per_Floor_Area",
+        "Watts_per_Person",
+        "Return_Air_Fraction_Function_of_Plenum_Temperature_Coefficient_1",
+        "Return_Air_Fraction_Function_of_Plenum_Temperature_Coefficient_2"
+    })
+    
     def __init__(self):
         """Initialize the Lights manager"""
         pass
@@ -54,7 +95,7 @@ class LightsManager:
             Dictionary with lights objects information
         """
         try:
-            idf = IDF(idf_path)
+            idf = get_idf(idf_path)
             lights_objects = idf.idfobjects.get("Lights", [])
             
             result = {
@@ -176,7 +217,7 @@ class LightsManager:
             Dictionary with modification results
         """
         try:
-            idf = IDF(idf_path)
+            idf = parse_idf(idf_path)
             lights_objects = idf.idfobjects.get("Lights", [])
             
             result = {
@@ -192,7 +233,7 @@ class LightsManager:
                 try:
                     # Apply modification based on target
                     target = mod_spec.get("target", "all")
-                    field_updates = mod_spec.get("field_updates", {})
+                    field_updates = mod_spec.get("field_updates", _EMPTY_FIELD_UPDATES)
                     
                     if target == "all":
                         # Apply to all Lights objects
@@ -202,7 +243,7 @@ class LightsManager:
                             )
                     elif target.startswith("zone:"):
                         # Apply to Lights objects in specific zone
-                        zone_name = target.replace("zone:", "").strip()
+                        zone_name = target[len("zone:"):].strip()
                         for lights_obj in lights_objects:
                             if getattr(lights_obj, 'Zone_or_ZoneList_or_Space_or_SpaceList_Name', '') == zone_name:
                                 self._apply_lights_modifications(
@@ -210,7 +251,7 @@ class LightsManager:
                                 )
                     elif target.startswith("name:"):
                         # Apply to specific Lights object by name
-                        lights_name = target.replace("name:", "").strip()
+                        lights_name = target[len("name:"):].strip()
                         for lights_obj in lights_objects:
                             if getattr(lights_obj, 'Name', '') == lights_name:
                                 self._apply_lights_modifications(
@@ -241,46 +282,10 @@ class LightsManager:
     def _apply_lights_modifications(self, lights_obj: Any, field_updates: Dict[str, Any], 
                                    result: Dict[str, Any]) -> None:
         """Apply field updates to a Lights object"""
-        # Valid Lights object fields based on IDD
-        valid_fields = {
-            "Schedule_Name",
-            "Design_Level_Calculation_Method", 
-            "Lighting_Level",
-            "Watts_per_Floor_Area",  # Fixed field name
-            "Watts_per_Person",
-            "Return_Air_Fraction",
-            "Fraction_Radiant",
-            "Fraction_Visible",
-            "Fraction_Replaceable",
-            "EndUse_Subcategory",  # Fixed field name
-            "Return_Air_Fraction_Calculated_from_Plenum_Temperature",
-            "Return_Air_Fraction_Function_of_Plenum_Temperature_Coefficient_1",
-            "Return_Air_Fraction_Function_of_Plenum_Temperature_Coefficient_2",
-            "Return_Air_Heat_Gain_Node_Name",
-            "Exhaust_Air_Heat_Gain_Node_Name"
-        }
-        
-        # Fraction fields that must be between 0.0 and 1.0
-        fraction_fields = {
-            "Return_Air_Fraction",
-            "Fraction_Radiant", 
-            "Fraction_Visible",
-            "Fraction_Replaceable"
-        }
-        
-        # Numeric fields that must be >= 0
-        positive_numeric_fields = {
-            "Lighting_Level",
-            "Watts_per_Floor_Area",
-            "Watts_per_Person",
-            "Return_Air_Fraction_Function_of_Plenum_Temperature_Coefficient_1",
-            "Return_Air_Fraction_Function_of_Plenum_Temperature_Coefficient_2"
-        }
-        
         lights_name = getattr(lights_obj, 'Name', 'Unknown')
         
         for field_name, new_value in field_updates.items():
-            if field_name not in valid_fields:
+            if field_name not in self.VALID_FIELDS:
                 result["errors"].append(f"Invalid field '{field_name}' for Lights object '{lights_name}'")
                 continue
             
@@ -295,7 +300,7 @@ class LightsManager:
                         continue
                 
                 # Validate fraction fields (0.0 to 1.0)
-                if field_name in fraction_fields:
+                if field_name in self.FRACTION_FIELDS:
                     try:
                         float_value = float(new_value)
                         if not (0.0 <= float_value <= 1.0):
@@ -310,7 +315,7 @@ class LightsManager:
                         continue
                 
                 # Validate positive numeric fields
-                if field_name in positive_numeric_fields:
+                if field_name in self.POSITIVE_NUMERIC_FIELDS:
                     try:
                         float_value = float(new_value)
                         if float_value < 0.0:
@@ -365,25 +370,6 @@ class LightsManager:
             "warnings": []
         }
         
-        # Valid field names based on IDD
-        valid_fields = {
-            "Schedule_Name",
-            "Design_Level_Calculation_Method", 
-            "Lighting_Level",
-            "Watts_per_Floor_Area",
-            "Watts_per_Person",
-            "Return_Air_Fraction",
-            "Fraction_Radiant",
-            "Fraction_Visible",
-            "Fraction_Replaceable",
-            "EndUse_Subcategory",
-            "Return_Air_Fraction_Calculated_from_Plenum_Temperature",
-            "Return_Air_Fraction_Function_of_Plenum_Temperature_Coefficient_1",
-            "Return_Air_Fraction_Function_of_Plenum_Temperature_Coefficient_2",
-            "Return_Air_Heat_Gain_Node_Name",
-            "Exhaust_Air_Heat_Gain_Node_Name"
-        }
-        
         for i, mod_spec in enumerate(modifications):
             # Check required fields
             if "target" not in mod_spec:
@@ -400,10 +386,10 @@ class LightsManager:
                 # Validate individual field updates
                 field_updates = mod_spec["field_updates"]
                 for field_name, value in field_updates.items():
-                    if field_name not in valid_fields:
+                    if field_name not in self.VALID_FIELDS:
                         validation_result["errors"].append(
                             f"Modification {i}: Invalid field name '{field_name}'. "
-                            f"Valid fields: {sorted(valid_fields)}"
+                            f"Valid fields: {sorted(self.VALID_FIELDS)}"
                         )
                         validation_result["valid"] = False
                     
@@ -11,10 +11,9 @@ See License.txt in the parent directory for license details.
 """
 
 import os
-import json
 import logging
 import time
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Iterable
 from pathlib import Path
 from datetime import datetime
 import shutil
@@ -22,6 +21,9 @@ import re
 
 from eppy.modeleditor import IDF
 
+from .idf_cache import get_idf, parse_idf
+from .runner import run_idf
+
 logger = logging.getLogger(__name__)
 
 
@@ -34,15 +36,12 @@ class ValidationCache:
         self._cache_timestamps = {}
     
     def get_cache_key(self, idf_path: str) -> str:
-        """Generate cache key based on file path and modification time"""
+        """Generate cache key based on file path, modification time and size (one stat call)"""
         try:
-            path_obj = Path(idf_path)
-            if path_obj.exists():
-                mtime = os.path.getmtime(idf_path)
-                return f"{idf_path}:{mtime}"
-            return idf_path
-        except Exception:
+            stat_result = os.stat(idf_path)
+        except OSError:
             return idf_path
+        return f"{idf_path}:{stat_result.st_mtime_ns}:{stat_result.st_size}"
     
     def is_cache_valid(self, cache_key: str, max_age_seconds: int = 300) -> bool:
         """Check if cache entry is still valid (default: 5 minutes)"""
@@ -128,36 +127,101 @@ class OutputMeterManager:
                     "simulation_error": sim_result.get("error", "Unknown error")
                 }
             
-            # Parse .mdd file for meters (Meter Data Dictionary)
-            mdd_file_path = self._find_mdd_file(sim_result["output_directory"])
-            if not mdd_file_path:
+            result = self.summarize_discovery_output(sim_result["output_directory"], idf_path, run_days)
+            if not result["success"]:
+                return result
+            
+            # Clean up temporary files
+            self._cleanup_temp_files(temp_idf_path, sim_result["output_directory"])
+            
+            return result
+            
+        except Exception as e:
+            logger.error(f"Error discovering available output meters: {e}")
+            raise RuntimeError(f"Error discovering available output meters: {str(e)}")
+    
+    def discover_available_outputs(self, idf_path: str, variable_manager, run_days: int = 1) -> Dict[str, Any]:
+        """
+        Discover available output variables and meters with a single simulation
+        
+        Output:VariableDictionary makes EnergyPlus write both the .rdd and the .mdd file,
+        so one discovery run serves both kinds of outputs.
+        
+        Args:
+            idf_path: Path to the IDF file
+            variable_manager: OutputVariableManager used to summarize the .rdd file
+            run_days: Number of days to run simulation (default: 1 for speed)
+        
+        Returns:
+            Dictionary with "output_variables" and "output_meters" discovery results
+        """
+        try:
+            logger.info(f"Discovering available output variables and meters for: {idf_path}")
+            
+            temp_idf_path = self._create_temp_idf_for_meter_discovery(idf_path, run_days)
+            
+            logger.info("Running short simulation to generate output data dictionaries...")
+            sim_result = self._run_meter_discovery_simulation(temp_idf_path)
+            
+            if not sim_result["success"]:
                 return {
                     "success": False,
-                    "error": "Could not find .mdd file in simulation output"
+                    "error": "Failed to run simulation for output discovery",
+                    "simulation_error": sim_result.get("error", "Unknown error")
                 }
             
-            # Extract meters from .mdd file
-            meters = self._parse_mdd_file_for_meters(mdd_file_path)
-            
-            # Clean up temporary files
-            self._cleanup_temp_files(temp_idf_path, sim_result["output_directory"])
+            output_directory = sim_result["output_directory"]
+            try:
+                variables = variable_manager.summarize_discovery_output(output_directory, idf_path, run_days)
+                meters = self.summarize_discovery_output(output_directory, idf_path, run_days)
+            finally:
+                self._cleanup_temp_files(temp_idf_path, output_directory)
             
-            result = {
-                "success": True,
+            return {
+                "success": variables["success"] and meters["success"],
                 "discovery_mode": True,
                 "input_file": idf_path,
-                "total_meters": len(meters),
-                "run_days": run_days,
-                "categories": self._categorize_meters(meters),
-                "meters": meters
+                "output_variables": variables,
+                "output_meters": meters
             }
             
-            logger.info(f"Discovered {len(meters)} available output meters")
-            return result
-            
         except Exception as e:
-            logger.error(f"Error discovering available output meters: {e}")
-            raise RuntimeError(f"Error discovering available output meters: {str(e)}")
+            logger.error(f"Error discovering available outputs: {e}")
+            raise RuntimeError(f"Error discovering available outputs: {str(e)}")
+    
+    def summarize_discovery_output(self, output_directory: str, idf_path: str, run_days: int) -> Dict[str, Any]:
+        """
+        Build the meter discovery result from the .mdd file of a finished discovery simulation
+        
+        Args:
+            output_directory: Output directory of the discovery simulation
+            idf_path: Path to the original IDF file
+            run_days: Number of days the discovery simulation ran
+        
+        Returns:
+            Dictionary with discovered meters and metadata
+        """
+        # Parse .mdd file for meters (Meter Data Dictionary)
+        mdd_file_path = self._find_mdd_file(output_directory)
+        if not mdd_file_path:
+            return {
+                "success": False,
+                "error": "Could not find .mdd file in simulation output"
+            }
+        
+        # Extract meters from .mdd file
+        meters = self._parse_mdd_file_for_meters(mdd_file_path)
+        
+        logger.info(f"Discovered {len(meters)} available output meters")
+        return {
+            "success": True,
+            "discovery_mode": True,
+            "input_file": idf_path,
+            "total_meters": len(meters),
+            "run_days": run_days,
+            "categories": self._categorize_meters(meters),
+            "meters": meters
+        }
     
     def get_configured_meters(self, idf_path: str) -> Dict[str, Any]:
         """
@@ -171,7 +235,7 @@ class OutputMeterManager:
         """
         try:
             logger.debug(f"Getting configured output meters for: {idf_path}")
-            idf = IDF(idf_path)
+            idf = get_idf(idf_path)
             
             output_meters = idf.idfobjects.get("Output:Meter", [])
             output_meter_fileonly = idf.idfobjects.get("Output:Meter:MeterFileOnly", [])
@@ -241,7 +305,7 @@ class OutputMeterManager:
     
     def _create_temp_idf_for_meter_discovery(self, idf_path: str, run_days: int) -> str:
         """Create temporary IDF optimized for meter discovery simulation"""
-        idf = IDF(idf_path)
+        idf = parse_idf(idf_path)
         
         # Remove existing Output:VariableDictionary to avoid conflicts
         existing_var_dict = idf.idfobjects.get('Output:VariableDictionary', [])
@@ -316,9 +380,9 @@ class OutputMeterManager:
             
             # Load IDF for simulation
             if weather_file and os.path.exists(weather_file):
-                idf = IDF(temp_idf_path, weather_file)
+                idf = parse_idf(temp_idf_path, weather_file)
             else:
-                idf = IDF(temp_idf_path)
+                idf = parse_idf(temp_idf_path)
             
             # Run simulation with minimal options optimized for meter discovery
             simulation_options = {
@@ -337,7 +401,7 @@ class OutputMeterManager:
                 simulation_options['weather'] = weather_file
             
             start_time = datetime.now()
-            result = idf.run(**simulation_options)
+            result = run_idf(idf, **simulation_options)
             end_time = datetime.now()
             
             return {
@@ -385,18 +449,18 @@ class OutputMeterManager:
         meters = []
         
         try:
+            # Stream the file rather than holding all of its lines in memory
             with open(mdd_file_path, 'r', encoding='utf-8') as f:
-                lines = f.readlines()
-            
-            # Determine format by checking if we have Output:Meter lines
-            has_output_meter_format = any(line.strip().startswith('Output:Meter') for line in lines)
-            
-            if has_output_meter_format:
-                # Parse Output:Meter format
-                meters = self._parse_output_meter_format(lines)
-            else:
-                # Parse CSV format
-                meters = self._parse_csv_format(lines)
+                # Determine format by checking if we have Output:Meter lines (stops at the first one)
+                has_output_meter_format = any(line.strip().startswith('Output:Meter') for line in f)
+                f.seek(0)
+                
+                if has_output_meter_format:
+                    # Parse Output:Meter format
+                    meters = self._parse_output_meter_format(f)
+                else:
+                    # Parse CSV format
+                    meters = self._parse_csv_format(f)
                 
         except Exception as e:
             logger.error(f"Error reading .mdd file {mdd_file_path}: {e}")
@@ -414,7 +478,7 @@ class OutputMeterManager:
         
         return sorted_meters
     
-    def _parse_output_meter_format(self, lines: List[str]) -> List[Dict[str, Any]]:
+    def _parse_output_meter_format(self, lines: Iterable[str]) -> List[Dict[str, Any]]:
         """Parse .mdd file in Output:Meter format"""
         meters = []
         
@@ -480,7 +544,7 @@ class OutputMeterManager:
         
         return meters
     
-    def _parse_csv_format(self, lines: List[str]) -> List[Dict[str, Any]]:
+    def _parse_csv_format(self, lines: Iterable[str]) -> List[Dict[str, Any]]:
         """Parse .mdd file in CSV format"""
         meters = []
         
@@ -982,32 +1046,38 @@ class OutputMeterManager:
             "will_add": len(new_meters)
         }
     
+    def append_meters(self, idf: IDF, meters: List[Dict]) -> List[Dict]:
+        """Add output meter objects to an already loaded IDF (the caller saves it)"""
+        added_meters = []
+        
+        # Add each meter
+        for meter_spec in meters:
+            meter_type = meter_spec.get("meter_type", "Output:Meter")
+            
+            # Create new meter object of the specified type
+            output_meter = idf.newidfobject(meter_type)
+            
+            # Set fields based on meter type
+            if meter_type in ["Output:Meter", "Output:Meter:MeterFileOnly"]:
+                output_meter.Key_Name = meter_spec["meter_name"]
+                output_meter.Reporting_Frequency = meter_spec["frequency"]
+            elif meter_type in ["Output:Meter:Cumulative", "Output:Meter:Cumulative:MeterFileOnly"]:
+                output_meter.Key_Name = meter_spec["meter_name"]
+                output_meter.Reporting_Frequency = meter_spec["frequency"]
+            
+            added_meters.append(meter_spec)
+            logger.debug(f"Added {meter_type}: {meter_spec}")
+        
+        return added_meters
+    
     def add_meters_to_idf(self, idf_path: str, meters: List[Dict], 
                          output_path: str) -> Dict[str, Any]:
         """Add output meters to IDF file and save"""
         try:
             # Load IDF
-            idf = IDF(idf_path)
+            idf = parse_idf(idf_path)
             
-            added_meters = []
-            
-            # Add each meter
-            for meter_spec in meters:
-                meter_type = meter_spec.get("meter_type", "Output:Meter")
-                
-                # Create new meter object of the specified type
-                output_meter = idf.newidfobject(meter_type)
-                
-                # Set fields based on meter type
-                if meter_type in ["Output:Meter", "Output:Meter:MeterFileOnly"]:
-                    output_meter.Key_Name = meter_spec["meter_name"]
-                    output_meter.Reporting_Frequency = meter_spec["frequency"]
-                elif meter_type in ["Output:Meter:Cumulative", "Output:Meter:Cumulative:MeterFileOnly"]:
-                    output_meter.Key_Name = meter_spec["meter_name"]
-                    output_meter.Reporting_Frequency = meter_spec["frequency"]
-                
-                added_meters.append(meter_spec)
-                logger.debug(f"Added {meter_type}: {meter_spec}")
+            added_meters = self.append_meters(idf, meters)
             
             # Save modified IDF
             idf.save(output_path)
@@ -11,7 +11,6 @@ See License.txt in the parent directory for license details.
 """
 
 import os
-import json
 import logging
 import time
 from typing import Dict, List, Any, Optional, Set, Tuple
@@ -22,6 +21,9 @@ from difflib import get_close_matches
 
 from eppy.modeleditor import IDF
 
+from .idf_cache import get_idf, parse_idf
+from .runner import run_idf
+
 logger = logging.getLogger(__name__)
 
 
@@ -34,15 +36,12 @@ class ValidationCache:
         self._cache_timestamps = {}
     
     def get_cache_key(self, idf_path: str) -> str:
-        """Generate cache key based on file path and modification time"""
+        """Generate cache key based on file path, modification time and size (one stat call)"""
         try:
-            path_obj = Path(idf_path)
-            if path_obj.exists():
-                mtime = os.path.getmtime(idf_path)
-                return f"{idf_path}:{mtime}"
-            return idf_path
-        except Exception:
+            stat_result = os.stat(idf_path)
+        except OSError:
             return idf_path
+        return f"{idf_path}:{stat_result.st_mtime_ns}:{stat_result.st_size}"
     
     def is_cache_valid(self, cache_key: str, max_age_seconds: int = 300) -> bool:
         """Check if cache entry is still valid (default: 5 minutes)"""
@@ -100,37 +99,53 @@ class OutputVariableManager:
                     "simulation_error": sim_result.get("error", "Unknown error")
                 }
             
-            # Parse .rdd file
-            rdd_file_path = self._find_rdd_file(sim_result["output_directory"])
-            if not rdd_file_path:
-                return {
-                    "success": False,
-                    "error": "Could not find .rdd file in simulation output"
-                }
-            
-            # Extract variables from .rdd file
-            variables = self._parse_rdd_file(rdd_file_path)
+            result = self.summarize_discovery_output(sim_result["output_directory"], idf_path, run_days)
+            if not result["success"]:
+                return result
             
             # Clean up temporary files
             self._cleanup_temp_files(temp_idf_path, sim_result["output_directory"])
             
-            result = {
-                "success": True,
-                "discovery_mode": True,
-                "input_file": idf_path,
-                "total_variables": len(variables),
-                "run_days": run_days,
-                "categories": self._categorize_variables(variables),
-                "variables": variables
-            }
-            
-            logger.info(f"Discovered {len(variables)} available output variables")
             return result
             
         except Exception as e:
             logger.error(f"Error discovering available output variables: {e}")
             raise RuntimeError(f"Error discovering available output variables: {str(e)}")
     
+    def summarize_discovery_output(self, output_directory: str, idf_path: str, run_days: int) -> Dict[str, Any]:
+        """
+        Build the variable discovery result from the .rdd file of a finished discovery simulation
+        
+        Args:
+            output_directory: Output directory of the discovery simulation
+            idf_path: Path to the original IDF file
+            run_days: Number of days the discovery simulation ran
+        
+        Returns:
+            Dictionary with discovered variables and metadata
+        """
+        # Parse .rdd file
+        rdd_file_path = self._find_rdd_file(output_directory)
+        if not rdd_file_path:
+            return {
+                "success": False,
+                "error": "Could not find .rdd file in simulation output"
+            }
+        
+        # Extract variables from .rdd file
+        variables = self._parse_rdd_file(rdd_file_path)
+        
+        logger.info(f"Discovered {len(variables)} available output variables")
+        return {
+            "success": True,
+            "discovery_mode": True,
+            "input_file": idf_path,
+            "total_variables": len(variables),
+            "run_days": run_days,
+            "categories": self._categorize_variables(variables),
+            "variables": variables
+        }
+    
     def get_configured_variables(self, idf_path: str) -> Dict[str, Any]:
         """
         Get currently configured output variables from the IDF file
@@ -143,7 +158,7 @@ class OutputVariableManager:
         """
         try:
             logger.debug(f"Getting configured output variables for: {idf_path}")
-            idf = IDF(idf_path)
+            idf = get_idf(idf_path)
             
             output_vars = idf.idfobjects.get("Output:Variable", [])
             output_meters = idf.idfobjects.get("Output:Meter", [])
@@ -186,7 +201,7 @@ class OutputVariableManager:
     
     def _create_temp_idf_with_variable_dictionary(self, idf_path: str, run_days: int) -> str:
         """Create temporary IDF with Output:VariableDictionary and short run period"""
-        idf = IDF(idf_path)
+        idf = parse_idf(idf_path)
         
         # Check if Output:VariableDictionary already exists
         existing_var_dict = idf.idfobjects.get('Output:VariableDictionary', [])
@@ -245,9 +260,9 @@ class OutputVariableManager:
             
             # Load IDF for simulation (with weather file if available)
             if weather_file:
-                idf = IDF(temp_idf_path, weather_file)
+                idf = parse_idf(temp_idf_path, weather_file)
             else:
-                idf = IDF(temp_idf_path)
+                idf = parse_idf(temp_idf_path)
             
             # Run simulation with minimal options
             simulation_options = {
@@ -265,7 +280,7 @@ class OutputVariableManager:
                 simulation_options['weather'] = weather_file
             
             start_time = datetime.now()
-            result = idf.run(**simulation_options)
+            result = run_idf(idf, **simulation_options)
             end_time = datetime.now()
             
             return {
@@ -697,25 +712,31 @@ class OutputVariableManager:
             "will_add": len(new_variables)
         }
     
+    def append_variables(self, idf: IDF, variables: List[Dict]) -> List[Dict]:
+        """Add Output:Variable objects to an already loaded IDF (the caller saves it)"""
+        added_variables = []
+        
+        # Add each variable
+        for var_spec in variables:
+            # Create new Output:Variable object
+            output_var = idf.newidfobject('Output:Variable')
+            output_var.Key_Value = var_spec["key_value"]
+            output_var.Variable_Name = var_spec["variable_name"]
+            output_var.Reporting_Frequency = var_spec["frequency"]
+            
+            added_variables.append(var_spec)
+            logger.debug(f"Added Output:Variable: {var_spec}")
+        
+        return added_variables
+    
     def add_variables_to_idf(self, idf_path: str, variables: List[Dict], 
                            output_path: str) -> Dict[str, Any]:
         """Add output variables to IDF file and save"""
         try:
             # Load IDF
-            idf = IDF(idf_path)
+            idf = parse_idf(idf_path)
             
-            added_variables = []
-            
-            # Add each variable
-            for var_spec in variables:
-                # Create new Output:Variable object
-                output_var = idf.newidfobject('Output:Variable')
-                output_var.Key_Value = var_spec["key_value"]
-                output_var.Variable_Name = var_spec["variable_name"]
-                output_var.Reporting_Frequency = var_spec["frequency"]
-                
-                added_variables.append(var_spec)
-                logger.debug(f"Added Output:Variable: {var_spec}")
+            added_variables = self.append_variables(idf, variables)
             
             # Save modified IDF
             idf.save(output_path)
@@ -11,7 +11,6 @@ See License.txt in the parent directory for license details.
 """
 
 import os
-from pathlib import Path
 from typing import List, Optional, Union
 import fnmatch
 import difflib
@@ -19,6 +18,11 @@ import difflib
 from ..config import Config
 
 
+def _lowered_extensions(extensions: Optional[List[str]]) -> tuple:
+    """Lower-case a list of extensions into a tuple usable with str.endswith"""
+    return tuple(ext.lower() for ext in extensions) if extensions else ()
+
+
 class PathResolver:
     """Helper class for path resolution with fuzzy matching capabilities"""
     
@@ -45,18 +49,23 @@ class PathResolver:
         ]
         
         target_name = os.path.basename(target_path).lower()
+        extensions_lower = _lowered_extensions(extensions)
         
         for search_dir in search_dirs:
-            if not search_dir or not os.path.exists(search_dir):
+            if not search_dir:
                 continue
                 
             try:
+                # os.walk yields nothing for a missing directory, so no separate exists check
                 for root, dirs, files in os.walk(search_dir):
+                    # Don't descend into hidden directories (.git, .venv, ...) under the workspace root
+                    dirs[:] = [d for d in dirs if not d.startswith('.')]
+                    
                     for file in files:
                         file_lower = file.lower()
                         
                         # Filter by extensions if provided
-                        if extensions and not any(file_lower.endswith(ext.lower()) for ext in extensions):
+                        if extensions_lower and not file_lower.endswith(extensions_lower):
                             continue
                         
                         # Calculate similarity
@@ -73,6 +82,32 @@ class PathResolver:
         return [path for path, _ in suggestions[:10]]  # Return top 10 matches
 
 
+def input_search_dirs(config: Config, file_types: List[str] = None) -> List[str]:
+    """
+    Directories resolve_path looks in for an existing input file, in search order
+    
+    Args:
+        config: Configuration object
+        file_types: List of acceptable file extensions (e.g., ['.idf', '.epw'])
+    
+    Returns:
+        List of configured directories (a relative path is finally also tried as-is)
+    """
+    search_paths = [
+        # 1. Relative to sample files directory
+        config.paths.sample_files_path,
+        # 2. Relative to workspace root
+        config.paths.workspace_root,
+        # 3. Relative to EnergyPlus example files (if applicable)
+        config.energyplus.example_files_path if file_types and '.idf' in file_types else None,
+        # 4. Relative to EnergyPlus weather data (if applicable)
+        config.energyplus.weather_data_path if file_types and '.epw' in file_types else None,
+    ]
+    
+    # Remove None values
+    return [path for path in search_paths if path]
+
+
 def resolve_path(config: Config, file_path: str, file_types: List[str] = None, 
                  description: str = "file", must_exist: bool = True, 
                  default_dir: str = None, enable_fuzzy_weather_matching: bool = False) -> str:
@@ -98,11 +133,13 @@ def resolve_path(config: Config, file_path: str, file_types: List[str] = None,
     if not file_path:
         raise ValueError(f"{description} path cannot be empty")
     
+    file_types_lower = _lowered_extensions(file_types)
+    
     # If it's already an absolute path
     if os.path.isabs(file_path):
         if must_exist and not os.path.exists(file_path):
             raise FileNotFoundError(f"{description} not found: {file_path}")
-        if file_types and not any(file_path.lower().endswith(ext.lower()) for ext in file_types):
+        if file_types_lower and not file_path.lower().endswith(file_types_lower):
             raise ValueError(f"File '{file_path}' does not have expected extension: {file_types}")
         return file_path
     
@@ -120,35 +157,20 @@ def resolve_path(config: Config, file_path: str, file_types: List[str] = None,
             return os.path.join(config.paths.output_dir, file_path)
     
     # For input paths (must_exist=True), search in various locations
-    search_paths = [
-        # 1. Relative to sample files directory
-        config.paths.sample_files_path,
-        # 2. Relative to workspace root
-        config.paths.workspace_root,
-        # 3. Relative to EnergyPlus example files (if applicable)
-        config.energyplus.example_files_path if file_types and '.idf' in file_types else None,
-        # 4. Relative to EnergyPlus weather data (if applicable)
-        config.energyplus.weather_data_path if file_types and '.epw' in file_types else None,
-    ]
+    search_paths = input_search_dirs(config, file_types)
     
-    # Remove None values
-    search_paths = [path for path in search_paths if path]
-    
-    # Try each search path
+    # Try each search path (a missing search directory simply yields a missing candidate)
     for search_path in search_paths:
-        if not search_path or not os.path.exists(search_path):
-            continue
-            
         candidate_path = os.path.join(search_path, file_path)
         if os.path.exists(candidate_path):
-            if file_types and not any(candidate_path.lower().endswith(ext.lower()) for ext in file_types):
+            if file_types_lower and not candidate_path.lower().endswith(file_types_lower):
                 continue
             return os.path.abspath(candidate_path)
     
     # Try as-is (relative to current directory)
     if os.path.exists(file_path):
         abs_path = os.path.abspath(file_path)
-        if file_types and not any(abs_path.lower().endswith(ext.lower()) for ext in file_types):
+        if file_types_lower and not abs_path.lower().endswith(file_types_lower):
             raise ValueError(f"File '{file_path}' does not have expected extension: {file_types}")
         return abs_path
     
@@ -192,6 +214,7 @@ def find_weather_files_by_name(config: Config, partial_name: str) -> List[str]:
     """
     matching_files = []
     partial_lower = partial_name.lower()
+    partial_words = partial_lower.replace('_', ' ').replace('-', ' ').split()
     
     # Search directories
     search_dirs = [
@@ -200,21 +223,26 @@ def find_weather_files_by_name(config: Config, partial_name: str) -> List[str]:
     ]
     
     for search_dir in search_dirs:
-        if not search_dir or not os.path.exists(search_dir):
+        if not search_dir:
+            continue
+        
+        try:
+            with os.scandir(search_dir) as entries:
+                for entry in entries:
+                    file_name_lower = entry.name.lower()
+                    if not file_name_lower.endswith('.epw') or not entry.is_file():
+                        continue
+                    
+                    # Check if partial name is in the file name (case insensitive)
+                    if partial_lower in file_name_lower:
+                        matching_files.append(entry.path)
+                    else:
+                        # Check if individual words from partial name are in file name
+                        if partial_words and all(word in file_name_lower for word in partial_words):
+                            matching_files.append(entry.path)
+        except OSError:
+            # Missing or unreadable search directory
             continue
-            
-        search_path = Path(search_dir)
-        for file_path in search_path.glob("*.epw"):
-            file_name_lower = file_path.name.lower()
-            
-            # Check if partial name is in the file name (case insensitive)
-            if partial_lower in file_name_lower:
-                matching_files.append(str(file_path))
-            else:
-                # Check if individual words from partial name are in file name
-                partial_words = partial_lower.replace('_', ' ').replace('-', ' ').split()
-                if partial_words and all(word in file_name_lower for word in partial_words):
-                    matching_files.append(str(file_path))
     
     # Sort by length (shorter names are likely more relevant)
     matching_files.sort(key=lambda x: len(os.path.basename(x)))
@@ -241,7 +269,7 @@ def validate_file_path(file_path: str, must_exist: bool = True, expected_extensi
         return False
     
     if expected_extensions:
-        if not any(file_path.lower().endswith(ext.lower()) for ext in expected_extensions):
+        if not file_path.lower().endswith(_lowered_extensions(expected_extensions)):
             return False
     
     return True
@@ -268,10 +296,11 @@ def get_file_info(file_path: str) -> dict:
     Returns:
         Dictionary with file information
     """
-    if not os.path.exists(file_path):
+    try:
+        stat = os.stat(file_path)
+    except OSError:
         return {"exists": False}
     
-    stat = os.stat(file_path)
     return {
         "exists": True,
         "path": os.path.abspath(file_path),
@@ -11,11 +11,16 @@ See License.txt in the parent directory for license details.
 """
 
 import logging
+from types import MappingProxyType
 from typing import Dict, List, Any, Optional
-from eppy.modeleditor import IDF
+
+from .idf_cache import get_idf, parse_idf
 
 logger = logging.getLogger(__name__)
 
+# Shared read-only default for modifications without field updates
+_EMPTY_FIELD_UPDATES = MappingProxyType({})
+
 
 class PeopleManager:
     """Manager for EnergyPlus People objects"""
@@ -37,6 +42,27 @@ class PeopleManager:
         "Light bench work": 234
     }
     
+    # Valid People object fields
+    VALID_FIELDS = frozenset({
+        "Number_of_People_Schedule_Name",
+        "Number_of_People_Calculation_Method",
+        "Number_of_People",
+        "People_per_Floor_Area",
+        "Floor_Area_per_Person",
+        "Fraction_Radiant",
+        "Sensible_Heat_Fraction",
+        "Activity_Level_Schedule_Name",
+        "Carbon_Dioxide_Generation_Rate",
+        "Enable_ASHRAE_55_Comfort_Warnings",
+        "Mean_Radiant_Temperature_Calculation_Type",
+        "Surface_Name_or_Angle_Factor_List_Name",
+        "Work_Efficiency_Schedule_Name",
+        "Clothing_Insulation_Schedule_Name",
+        "Air_Velocity_Schedule_Name",
+        "Thermal_Comfort_Model_1_Type",
+        "Thermal_Comfort_Model_2_Type"
+    })
+    
     def __init__(self):
         """Initialize the People manager"""
         pass
@@ -52,7 +78,7 @@ class PeopleManager:
             Dictionary with people objects information
         """
         try:
-            idf = IDF(idf_path)
+            idf = get_idf(idf_path)
             people_objects = idf.idfobjects.get("People", [])
             
             result = {
@@ -170,7 +196,7 @@ class PeopleManager:
             Dictionary with modification results
         """
         try:
-            idf = IDF(idf_path)
+            idf = parse_idf(idf_path)
             people_objects = idf.idfobjects.get("People", [])
             
             result = {
@@ -186,7 +212,7 @@ class PeopleManager:
                 try:
                     # Apply modification based on target
                     target = mod_spec.get("target", "all")
-                    field_updates = mod_spec.get("field_updates", {})
+                    field_updates = mod_spec.get("field_updates", _EMPTY_FIELD_UPDATES)
                     
                     if target == "all":
                         # Apply to all People objects
@@ -196,7 +222,7 @@ class PeopleManager:
                             )
                     elif target.startswith("zone:"):
                         # Apply to People objects in specific zone
-                        zone_name = target.replace("zone:", "").strip()
+                        zone_name = target[len("zone:"):].strip()
                         for people_obj in people_objects:
                             if getattr(people_obj, 'Zone_or_ZoneList_Name', '') == zone_name:
                                 self._apply_people_modifications(
@@ -204,7 +230,7 @@ class PeopleManager:
                                 )
                     elif target.startswith("name:"):
                         # Apply to specific People object by name
-                        people_name = target.replace("name:", "").strip()
+                        people_name = target[len("name:"):].strip()
                         for people_obj in people_objects:
                             if getattr(people_obj, 'Name', '') == people_name:
                                 self._apply_people_modifications(
@@ -235,31 +261,10 @@ class PeopleManager:
     def _apply_people_modifications(self, people_obj: Any, field_updates: Dict[str, Any], 
                                    result: Dict[str, Any]) -> None:
         """Apply field updates to a People object"""
-        # Valid People object fields
-        valid_fields = {
-            "Number_of_People_Schedule_Name",
-            "Number_of_People_Calculation_Method", 
-            "Number_of_People",
-            "People_per_Floor_Area",
-            "Floor_Area_per_Person",
-            "Fraction_Radiant",
-            "Sensible_Heat_Fraction",
-            "Activity_Level_Schedule_Name",
-            "Carbon_Dioxide_Generation_Rate",
-            "Enable_ASHRAE_55_Comfort_Warnings",
-            "Mean_Radiant_Temperature_Calculation_Type",
-            "Surface_Name_or_Angle_Factor_List_Name",
-            "Work_Efficiency_Schedule_Name",
-            "Clothing_Insulation_Schedule_Name",
-            "Air_Velocity_Schedule_Name",
-            "Thermal_Comfort_Model_1_Type",
-            "Thermal_Comfort_Model_2_Type"
-        }
-        
         people_name = getattr(people_obj, 'Name', 'Unknown')
         
         for field_name, new_value in field_updates.items():
-            if field_name not in valid_fields:
+            if field_name not in self.VALID_FIELDS:
                 result["errors"].append(f"Invalid field '{field_name}' for People object '{people_name}'")
                 continue
             
@@ -0,0 +1,126 @@
+"""
+EnergyPlus runner for EnergyPlus MCP Server
+Runs parsed models like eppy's IDF.run without changing the process working directory
+
+EnergyPlus Model Context Protocol Server (EnergyPlus-MCP)
+Copyright (c) 2025, The Regents of the University of California,
+through Lawrence Berkeley National Laboratory (subject to receipt of
+any required approvals from the U.S. Dept. of Energy). All rights reserved.
+
+See License.txt in the parent directory for license details.
+"""
+
+import os
+import shutil
+import logging
+import tempfile
+import uuid
+from io import StringIO
+from subprocess import CalledProcessError, check_call
+from typing import Any
+
+from eppy.modeleditor import IDF
+from eppy.runner.run_functions import EnergyPlusRunError, install_paths, parse_error
+
+logger = logging.getLogger(__name__)
+
+# EnergyPlus command line options accepted by run_idf, in the order eppy passes them
+_RUN_OPTIONS = ("weather", "output_directory", "annual", "design_day", "idd", "epmacro",
+                "expandobjects", "readvars", "output_prefix", "output_suffix")
+
+
+def run_idf(idf: IDF, **kwargs: Any) -> str:
+    """
+    Run a parsed IDF with EnergyPlus, taking the same options as eppy's IDF.run
+
+    eppy's runner changes the working directory of the whole process while EnergyPlus
+    runs, which breaks relative paths in every other thread and can leave the process
+    in a deleted directory when two simulations overlap. This runs EnergyPlus in its
+    own temporary directory through the subprocess cwd argument instead.
+
+    Args:
+        idf: Parsed IDF; it is saved to a temporary copy for the run
+        **kwargs: weather, output_directory, annual, design_day, idd, epmacro, expandobjects,
+                  readvars, output_prefix, output_suffix and verbose ("v", "q" or "s")
+
+    Returns:
+        "OK" once EnergyPlus has finished
+
+    Raises:
+        EnergyPlusRunError: If an input file is missing or EnergyPlus fails
+        ValueError: If an option is unknown
+    """
+    verbose = kwargs.pop("verbose", "v").lower()
+    options = {"weather": getattr(idf, "epw", None), "output_directory": "", "idd": idf.iddname}
+    for name, value in kwargs.items():
+        if name not in _RUN_OPTIONS:
+            raise ValueError(f"Unknown EnergyPlus run option: {name}")
+        options[name] = value
+
+    ep_version = "-".join(str(x) for x in idf.idd_version[:3])
+    eplus_exe_path, eplus_weather_path = install_paths(ep_version, options["idd"])
+
+    # Resolve every path up front; EnergyPlus itself runs in a throwaway directory
+    weather = options["weather"]
+    if weather:
+        # Without a weather file EnergyPlus can still run the design days
+        if os.path.isfile(weather):
+            weather = os.path.abspath(weather)
+        else:
+            weather = os.path.join(eplus_weather_path, weather)
+        if not os.path.isfile(weather):
+            raise EnergyPlusRunError(f"ERROR: Could not find weather file: {weather}")
+        options["weather"] = weather
+    options["output_directory"] = os.path.abspath(options["output_directory"])
+    if isinstance(options["idd"], str):
+        options["idd"] = os.path.abspath(options["idd"])
+    else:
+        options["idd"] = None
+
+    run_dir = tempfile.mkdtemp(prefix="eplus_run_")
+    if isinstance(idf.idfname, str):
+        # Like eppy, save the copy next to the original so relative paths in the model still resolve
+        idf_path = f"{os.path.splitext(os.path.abspath(idf.idfname))[0]}_{uuid.uuid4().hex[:6]}.idf"
+    else:
+        idf_path = os.path.join(run_dir, "in.idf")
+    try:
+        idf.save(idf_path)
+        if not options.get("expandobjects"):
+            # HVACTemplate objects only work after ExpandObjects
+            with open(idf_path, "r", encoding="latin-1") as f:
+                options["expandobjects"] = "HVACTEMPLATE:" in f.read().upper()
+
+        cmd = [eplus_exe_path]
+        for name in _RUN_OPTIONS:
+            value = options.get(name)
+            if not value:
+                continue
+            cmd.append("--" + name.replace("_", "-"))
+            if not isinstance(value, bool):
+                cmd.append(str(value))
+        cmd.append(idf_path)
+        logger.debug("Running EnergyPlus: %s", " ".join(cmd))
+
+        try:
+            if verbose == "v":
+                check_call(cmd, cwd=run_dir)
+            elif verbose == "q":
+                with open(os.devnull, "w") as null:
+                    check_call(cmd, cwd=run_dir, stdout=null)
+            elif verbose == "s":
+                with open(os.devnull, "w") as null:
+                    check_call(cmd, cwd=run_dir, stdout=null, stderr=null)
+            else:
+                raise ValueError(f"Unknown verbose mode: {verbose}")
+        except CalledProcessError:
+            if options.get("output_prefix"):
+                err_file = os.path.join(options["output_directory"], options["output_prefix"] + ".err")
+            else:
+                err_file = os.path.join(options["output_directory"], "eplusout.err")
+            raise EnergyPlusRunError(parse_error(StringIO(), err_file))
+    finally:
+        if os.path.exists(idf_path):
+            os.remove(idf_path)
+        shutil.rmtree(run_dir, ignore_errors=True)
+
+    return "OK"
@@ -18,6 +18,15 @@ from dataclasses import dataclass, field
 
 logger = logging.getLogger(__name__)
 
+# Patterns used on every call are compiled once at import
+_TIME_FORMAT_RE = re.compile(r'^([0-1]?[0-9]|2[0-4]):([0-5][0-9])$')  # HH:MM or H:MM
+_TIME_RANGE_RES = (
+    re.compile(r'(\d{1,2}):?(\d{0,2})\s*(am|pm)\s*[-–—]\s*(\d{1,2}):?(\d{0,2})\s*(am|pm)'),
+    re.compile(r'(\d{1,2}):(\d{2})\s*[-–—]\s*(\d{1,2}):(\d{2})'),
+    re.compile(r'from\s+(\d{1,2}):?(\d{0,2})\s*(am|pm)\s+to\s+(\d{1,2}):?(\d{0,2})\s*(am|pm)'),
+)
+_NUMBER_RE = re.compile(r'([\d.]+)')
+
 
 class ScheduleValueParser:
     """Parser for extracting values from different EnergyPlus schedule objects"""
@@ -138,8 +147,7 @@ class ScheduleValueParser:
     def _validate_time_format(time_str: str) -> bool:
         """Validate time format (HH:MM or H:MM)"""
         try:
-            time_pattern = r'^([0-1]?[0-9]|2[0-4]):([0-5][0-9])$'
-            return bool(re.match(time_pattern, time_str))
+            return bool(_TIME_FORMAT_RE.match(time_str))
         except:
             return False
 
@@ -375,11 +383,12 @@ class ScheduleValueParser:
             return {"error": str(e)}
 
 
-@dataclass
+@dataclass(slots=True)
 class SimpleScheduleFormat:
     """
     Simplified intermediate format for schedule modifications.
     Focuses on daily patterns with basic weekly/seasonal support.
+    Uses __slots__ since one instance is created per converted schedule.
     """
     name: str = ""
     schedule_type_limits: str = ""
@@ -428,6 +437,11 @@ class ScheduleLanguageParser:
         r'reduce\s+by\s+([\d.]+)%?': 'decrease_percent'
     }
     
+    # Compiled (pattern, label) pairs, in the same order as the dictionaries above
+    _DAY_PATTERNS_COMPILED = tuple((re.compile(pattern), day_type) for pattern, day_type in DAY_PATTERNS.items())
+    _OPERATION_PATTERNS_COMPILED = tuple((re.compile(pattern), operation)
+                                         for pattern, operation in OPERATION_PATTERNS.items())
+    
     @classmethod
     def parse_time_range(cls, text: str) -> Tuple[str, str]:
         """Parse time range from text like '8am-6pm' or '08:00-18:00'."""
@@ -435,15 +449,11 @@ class ScheduleLanguageParser:
             logger.warning("Invalid text input for time range parsing")
             return "08:00", "18:00"
         
-        # Handle range patterns
-        range_patterns = [
-            r'(\d{1,2}):?(\d{0,2})\s*(am|pm)\s*[-–—]\s*(\d{1,2}):?(\d{0,2})\s*(am|pm)',
-            r'(\d{1,2}):(\d{2})\s*[-–—]\s*(\d{1,2}):(\d{2})',
-            r'from\s+(\d{1,2}):?(\d{0,2})\s*(am|pm)\s+to\s+(\d{1,2}):?(\d{0,2})\s*(am|pm)'
-        ]
+        text_lower = text.lower()
         
-        for pattern in range_patterns:
-            match = re.search(pattern, text.lower())
+        # Handle range patterns
+        for pattern in _TIME_RANGE_RES:
+            match = pattern.search(text_lower)
             if match:
                 groups = match.groups()
                 try:
@@ -464,17 +474,17 @@ class ScheduleLanguageParser:
                     continue
         
         # Handle predefined patterns
-        if 'business' in text.lower() or 'office' in text.lower():
+        if 'business' in text_lower or 'office' in text_lower:
             return "08:00", "18:00"
-        elif 'lunch' in text.lower():
+        elif 'lunch' in text_lower:
             return "12:00", "13:00"
-        elif 'overnight' in text.lower():
+        elif 'overnight' in text_lower:
             return "22:00", "06:00"
-        elif 'morning' in text.lower():
+        elif 'morning' in text_lower:
             return "06:00", "12:00"
-        elif 'afternoon' in text.lower():
+        elif 'afternoon' in text_lower:
             return "12:00", "18:00"
-        elif 'evening' in text.lower():
+        elif 'evening' in text_lower:
             return "18:00", "22:00"
         
         # Default fallback
@@ -521,9 +531,10 @@ class ScheduleLanguageParser:
         if not text or not isinstance(text, str):
             return ['all']
         
+        text_lower = text.lower()
         day_types = []
-        for pattern, day_type in cls.DAY_PATTERNS.items():
-            if re.search(pattern, text.lower()):
+        for pattern, day_type in cls._DAY_PATTERNS_COMPILED:
+            if pattern.search(text_lower):
                 day_types.append(day_type)
         
         return day_types if day_types else ['all']
@@ -534,8 +545,9 @@ class ScheduleLanguageParser:
         if not text or not isinstance(text, str):
             return 'unknown', None
         
-        for pattern, operation in cls.OPERATION_PATTERNS.items():
-            match = re.search(pattern, text.lower())
+        text_lower = text.lower()
+        for pattern, operation in cls._OPERATION_PATTERNS_COMPILED:
+            match = pattern.search(text_lower)
             if match:
                 try:
                     if operation in ['set_value', 'increase_percent', 'decrease_percent']:
@@ -554,7 +566,7 @@ class ScheduleLanguageParser:
                     continue
         
         # Default - try to extract any number as a set value
-        number_match = re.search(r'([\d.]+)', text)
+        number_match = _NUMBER_RE.search(text)
         if number_match:
             try:
                 value = float(number_match.group(1))
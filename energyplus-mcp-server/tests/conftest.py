@@ -0,0 +1,86 @@
+"""
+Shared fixtures for the EnergyPlus MCP Server tests
+
+The tests run without an EnergyPlus installation: eppy parses models with one of the
+IDD files it ships, and the workspace lives in a temporary directory.
+
+EnergyPlus Model Context Protocol Server (EnergyPlus-MCP)
+Copyright (c) 2025, The Regents of the University of California,
+through Lawrence Berkeley National Laboratory (subject to receipt of
+any required approvals from the U.S. Dept. of Energy). All rights reserved.
+
+See License.txt in the parent directory for license details.
+"""
+
+import os
+
+import eppy
+import pytest
+
+from energyplus_mcp_server import config as config_module
+from energyplus_mcp_server.config import Config, PathConfig
+
+# eppy allows a single IDD per process, so every test uses this one
+TEST_IDD_PATH = os.path.join(os.path.dirname(eppy.__file__), "resources", "iddfiles", "Energy+V9_2_0.idd")
+
+MINIMAL_IDF = """\
+Version,9.2;
+
+Building,
+    Test Building,           !- Name
+    0,                       !- North Axis {deg}
+    Suburbs,                 !- Terrain
+    0.04,                    !- Loads Convergence Tolerance Value
+    0.4,                     !- Temperature Convergence Tolerance Value {deltaC}
+    FullExterior,            !- Solar Distribution
+    25,                      !- Maximum Number of Warmup Days
+    6;                       !- Minimum Number of Warmup Days
+
+SimulationControl,
+    No,                      !- Do Zone Sizing Calculation
+    No,                      !- Do System Sizing Calculation
+    No,                      !- Do Plant Sizing Calculation
+    Yes,                     !- Run Simulation for Sizing Periods
+    No;                      !- Run Simulation for Weather File Run Periods
+
+Zone,
+    Zone One;                !- Name
+"""
+
+
+@pytest.fixture(scope="session")
+def test_config(tmp_path_factory):
+    """Configuration with a temporary workspace, installed as the global configuration"""
+    workspace = tmp_path_factory.mktemp("workspace")
+    (workspace / "sample_files").mkdir()
+
+    previous_idd = os.environ.get("EPLUS_IDD_PATH")
+    os.environ["EPLUS_IDD_PATH"] = TEST_IDD_PATH
+    try:
+        config = Config(paths=PathConfig(workspace_root=str(workspace), output_dir=str(workspace / "outputs")))
+    finally:
+        if previous_idd is None:
+            del os.environ["EPLUS_IDD_PATH"]
+        else:
+            os.environ["EPLUS_IDD_PATH"] = previous_idd
+
+    config_module.get_config._config = config
+    return config
+
+
+@pytest.fixture
+def manager(test_config):
+    """A fresh EnergyPlusManager, so cached results never leak between tests"""
+    from energyplus_mcp_server.energyplus_tools import EnergyPlusManager
+    from energyplus_mcp_server.utils.idf_cache import clear_idf_cache
+
+    clear_idf_cache()
+    return EnergyPlusManager(test_config)
+
+
+@pytest.fixture
+def idf_file(tmp_path):
+    """Path of a minimal IDF model in a temporary directory"""
+    path = tmp_path / "model.idf"
+    path.write_text(MINIMAL_IDF)
+    return str(path)
@@ -0,0 +1,227 @@
+"""
+Tests for EnergyPlusManager
+
+EnergyPlus Model Context Protocol Server (EnergyPlus-MCP)
+Copyright (c) 2025, The Regents of the University of California,
+through Lawrence Berkeley National Laboratory (subject to receipt of
+any required approvals from the U.S. Dept. of Energy). All rights reserved.
+
+See License.txt in the parent directory for license details.
+"""
+
+import json
+import os
+
+import pytest
+
+from energyplus_mcp_server.utils.idf_cache import get_idf, parse_idf
+
+from .conftest import MINIMAL_IDF
+
+
+# ------------------------ Modification result reuse ------------------------
+
+def _disable_sizing_runs(manager, idf_file, output_path):
+    return json.loads(manager.modify_simulation_settings(
+        idf_file, "SimulationControl", {"Run_Simulation_for_Sizing_Periods": "No"}, output_path=output_path
+    ))
+
+
+def test_repeated_modification_reuses_the_written_file(manager, idf_file, tmp_path):
+    output_path = str(tmp_path / "out.idf")
+    first = _disable_sizing_runs(manager, idf_file, output_path)
+    assert "reused_result" not in first
+
+    second = _disable_sizing_runs(manager, idf_file, output_path)
+    assert second["reused_result"] is True
+    assert second["output_file"] == output_path
+    assert "copied_from" not in second
+    assert second["modifications_made"] == first["modifications_made"]
+
+
+def test_repeated_modification_copies_to_a_new_output_path(manager, idf_file, tmp_path):
+    first_path = str(tmp_path / "first.idf")
+    second_path = str(tmp_path / "second.idf")
+    _disable_sizing_runs(manager, idf_file, first_path)
+
+    second = _disable_sizing_runs(manager, idf_file, second_path)
+    assert second["reused_result"] is True
+    assert second["output_file"] == second_path
+    assert second["copied_from"] == first_path
+    with open(first_path) as first_file, open(second_path) as second_file:
+        assert first_file.read() == second_file.read()
+
+
+def test_modification_reruns_when_its_output_was_changed(manager, idf_file, tmp_path):
+    output_path = tmp_path / "out.idf"
+    _disable_sizing_runs(manager, idf_file, str(output_path))
+    output_path.write_text(output_path.read_text() + "\n! edited by hand\n")
+
+    assert "reused_result" not in _disable_sizing_runs(manager, idf_file, str(output_path))
+
+
+def test_modification_reruns_when_the_input_changed(manager, idf_file, tmp_path):
+    output_path = str(tmp_path / "out.idf")
+    _disable_sizing_runs(manager, idf_file, output_path)
+    with open(idf_file, "a") as f:
+        f.write("\nZone, Zone Two;\n")
+
+    result = _disable_sizing_runs(manager, idf_file, output_path)
+    assert "reused_result" not in result
+    assert os.path.getsize(output_path) > 0
+
+
+# ------------------------ Shared parsed models ------------------------
+
+def test_modifications_do_not_leak_into_the_shared_parse(manager, idf_file, tmp_path):
+    shared = get_idf(idf_file)
+    _disable_sizing_runs(manager, idf_file, str(tmp_path / "out.idf"))
+
+    # Writes clear the cache, so check both the earlier shared parse and a fresh one
+    for idf in (shared, get_idf(idf_file)):
+        assert idf.idfobjects["SimulationControl"][0].Run_Simulation_for_Sizing_Periods == "Yes"
+
+
+def test_exterior_coating_does_not_duplicate_objects(manager, tmp_path):
+    idf_path = tmp_path / "walls.idf"
+    idf_path.write_text(MINIMAL_IDF + """
+Material, Brick, Rough, 0.1, 0.9, 1900, 800;
+
+Material:NoMass, Insulation, Rough, 2.0;
+
+Construction, Exterior Wall, Brick, Insulation;
+
+BuildingSurface:Detailed, Wall 1, Wall, Exterior Wall, Zone One, Outdoors, , SunExposed, WindExposed, , 4,
+    0, 0, 3, 0, 0, 0, 5, 0, 0, 5, 0, 3;
+""")
+    output_path = tmp_path / "coated.idf"
+    result = json.loads(manager.add_coating_outside(str(idf_path), "wall", output_path=str(output_path)))
+
+    assert {m["layer"] for m in result["modifications_made"]} == {"Brick"}
+    coated = parse_idf(str(output_path))
+    assert [m.Name for m in coated.idfobjects["Material"]] == ["Brick"]
+    assert [m.Name for m in coated.idfobjects["Material:NoMass"]] == ["Insulation"]
+    assert len(coated.idfobjects["BuildingSurface:Detailed"]) == 1
+
+
+# ------------------------ Weather file resolution ------------------------
+
+@pytest.fixture
+def weather_dir(test_config, tmp_path, monkeypatch):
+    """A sample files directory holding one San Francisco weather file"""
+    (tmp_path / "USA_CA_San.Francisco.Intl.AP.724940_TMY3.epw").write_text("")
+    monkeypatch.setattr(test_config.paths, "sample_files_path", str(tmp_path))
+    return tmp_path
+
+
+def test_direct_weather_paths_are_not_cached(manager, weather_dir):
+    direct = manager._resolve_weather_file_path("USA_CA_San.Francisco.Intl.AP.724940_TMY3.epw")
+
+    assert direct == str(weather_dir / "USA_CA_San.Francisco.Intl.AP.724940_TMY3.epw")
+    assert manager.get_cache_stats()["weather_matches"]["currsize"] == 0
+
+
+def test_fuzzy_weather_matches_are_reused(manager, weather_dir):
+    first = manager._resolve_weather_file_path("San Francisco")
+    second = manager._resolve_weather_file_path("San Francisco")
+
+    assert first == second == str(weather_dir / "USA_CA_San.Francisco.Intl.AP.724940_TMY3.epw")
+    stats = manager.get_cache_stats()["weather_matches"]
+    assert (stats["hits"], stats["misses"]) == (1, 1)
+
+
+def test_fuzzy_weather_matching_sees_added_and_removed_files(manager, weather_dir):
+    with pytest.raises(FileNotFoundError):
+        manager._resolve_weather_file_path("Chicago")
+    chicago = weather_dir / "USA_IL_Chicago-OHare.Intl.AP.725300_TMY3.epw"
+    chicago.write_text("")
+    assert manager._resolve_weather_file_path("Chicago") == str(chicago)
+
+    chicago.unlink()
+    with pytest.raises(FileNotFoundError):
+        manager._resolve_weather_file_path("Chicago")
+
+
+# ------------------------ File listing ------------------------
+
+@pytest.fixture
+def listing_dir(test_config, tmp_path, monkeypatch):
+    """A sample files directory holding c.idf, a.epw, d.txt and b.idf"""
+    for name in ("c.idf", "a.epw", "d.txt", "b.idf"):
+        (tmp_path / name).write_text("")
+    monkeypatch.setattr(test_config.paths, "sample_files_path", str(tmp_path))
+    return tmp_path
+
+
+def test_listing_limit_keeps_the_first_files_by_name(manager, listing_dir):
+    sample_files = manager.list_available_files_dict(limit=2)["sample_files"]
+
+    assert sample_files["truncated"] is True
+    assert [f["name"] for f in sample_files["Weather files"]] == ["a.epw"]
+    assert [f["name"] for f in sample_files["IDF files"]] == ["b.idf"]
+    assert sample_files["Other files"] == []
+
+
+@pytest.mark.parametrize("limit", [None, 4])
+def test_listing_within_the_limit_is_complete(manager, listing_dir, limit):
+    sample_files = manager.list_available_files_dict(limit=limit)["sample_files"]
+
+    assert "truncated" not in sample_files
+    assert [f["name"] for f in sample_files["IDF files"]] == ["b.idf", "c.idf"]
+
+
+def test_listing_rejects_a_negative_limit(manager, listing_dir):
+    with pytest.raises(ValueError):
+        manager.list_available_files_dict(limit=-1)
+
+
+# ------------------------ Simulation results ------------------------
+
+@pytest.fixture
+def fake_run_idf(monkeypatch):
+    """Replace EnergyPlus; models whose path contains "fail" raise like a failed run"""
+    from energyplus_mcp_server import energyplus_tools
+
+    def run_idf(idf, **options):
+        if "fail" in idf.idfname:
+            raise RuntimeError("EnergyPlus failed")
+        return "OK"
+
+    monkeypatch.setattr(energyplus_tools, "run_idf", run_idf)
+
+
+def test_run_simulation_dict_returns_a_dict(manager, idf_file, tmp_path, fake_run_idf):
+    result = manager.run_simulation_dict(idf_file, output_directory=str(tmp_path / "out"))
+
+    assert result["success"] is True
+    assert result["input_idf"] == idf_file
+    assert result["simulation_options"]["readvars"] is False
+
+
+def test_run_simulation_encodes_the_dict_result(manager, idf_file, tmp_path, fake_run_idf):
+    result = json.loads(manager.run_simulation(idf_file, output_directory=str(tmp_path / "out")))
+
+    assert result["success"] is True
+    assert result["output_directory"] == str(tmp_path / "out")
+
+
+def test_run_simulation_dict_reports_failed_runs(manager, tmp_path, fake_run_idf):
+    idf_path = tmp_path / "fail.idf"
+    idf_path.write_text(MINIMAL_IDF)
+    result = manager.run_simulation_dict(str(idf_path), output_directory=str(tmp_path / "out"))
+
+    assert result["success"] is False
+    assert result["error"] == "EnergyPlus failed"
+
+
+def test_listing_limit_only_stats_the_files_it_keeps(manager, listing_dir, monkeypatch):
+    statted = []
+    categorize_file = manager._categorize_file
+
+    def recording_categorize_file(entry, source):
+        statted.append(entry.name)
+        return categorize_file(entry, source)
+
+    monkeypatch.setattr(manager, "_categorize_file", recording_categorize_file)
+    manager.list_available_files_dict(limit=2)
+    assert statted == ["a.epw", "b.idf"]
@@ -0,0 +1,188 @@
+"""
+Tests for the MCP tool wrappers in server.py
+
+EnergyPlus Model Context Protocol Server (EnergyPlus-MCP)
+Copyright (c) 2025, The Regents of the University of California,
+through Lawrence Berkeley National Laboratory (subject to receipt of
+any required approvals from the U.S. Dept. of Energy). All rights reserved.
+
+See License.txt in the parent directory for license details.
+"""
+
+import io
+import json
+import os
+import threading
+
+import pytest
+
+
+@pytest.fixture
+def server(test_config):
+    """The server module, imported once the test configuration is installed"""
+    from energyplus_mcp_server import server
+    return server
+
+
+def _tool_json(response: str):
+    """Parse the JSON payload that follows the first line of a tool response"""
+    return json.loads(response.split("\n", 1)[1])
+
+
+# ------------------------ run_energyplus_simulations ------------------------
+
+@pytest.fixture
+def fake_simulation(server, monkeypatch):
+    """Replace run_simulation_dict; models named fail*.idf report an unsuccessful simulation"""
+    calls = []
+
+    def run_simulation_dict(idf_path, output_directory=None, **kwargs):
+        calls.append({"idf_path": idf_path, "output_directory": output_directory})
+        if os.path.basename(idf_path).startswith("fail"):
+            return {"success": False, "input_idf": idf_path, "error": "EnergyPlus failed"}
+        if idf_path == "missing.idf":
+            raise FileNotFoundError(idf_path)
+        return {"success": True, "input_idf": idf_path, "output_directory": output_directory}
+
+    monkeypatch.setattr(server.ep_manager, "run_simulation_dict", run_simulation_dict)
+    return calls
+
+
+@pytest.mark.asyncio
+async def test_batch_counts_unsuccessful_simulations_as_failed(server, fake_simulation):
+    response = await server.run_energyplus_simulations(
+        [{"idf_path": "good.idf"}, {"idf_path": "fail.idf"}, {"idf_path": "missing.idf"}]
+    )
+
+    summary = _tool_json(response)
+    assert (summary["total_jobs"], summary["succeeded"], summary["failed"]) == (3, 1, 2)
+    assert summary["results"][1]["result"]["success"] is False
+    assert summary["results"][2]["success"] is False
+
+
+@pytest.mark.asyncio
+async def test_batches_get_separate_output_directories(server, fake_simulation, tmp_path):
+    explicit = str(tmp_path / "explicit")
+    await server.run_energyplus_simulations([{"idf_path": "good.idf"}, {"idf_path": "good.idf", "output_directory": explicit}])
+    await server.run_energyplus_simulations([{"idf_path": "good.idf"}])
+
+    first, second, third = (call["output_directory"] for call in fake_simulation)
+    assert second == explicit
+    assert os.path.dirname(first) != os.path.dirname(third)
+    assert os.path.isdir(os.path.dirname(first)) and os.path.isdir(os.path.dirname(third))
+
+
+# ------------------------ Output discovery ------------------------
+
+@pytest.mark.parametrize("tool_name", ["get_output_variables", "get_output_meters", "get_outputs"])
+@pytest.mark.asyncio
+async def test_output_discovery_takes_a_simulation_slot(server, monkeypatch, tool_name):
+    threads = []
+
+    def query(idf_path, discover_available, run_days):
+        threads.append((discover_available, threading.current_thread().name))
+        return "{}"
+
+    monkeypatch.setattr(server.ep_manager, tool_name, query)
+    tool = getattr(server, tool_name)
+    await tool("model.idf")
+    await tool("model.idf", discover_available=True)
+
+    assert threads[0][0] is False and not threads[0][1].startswith("ep-sim")
+    assert threads[1][0] is True and threads[1][1].startswith("ep-sim")
+
+
+# ------------------------ Error responses ------------------------
+
+@pytest.mark.parametrize("tool_name", ["load_idf_model", "validate_idf", "list_zones"])
+@pytest.mark.asyncio
+async def test_tools_report_missing_files_the_same_way(server, tool_name):
+    response = await getattr(server, tool_name)("does_not_exist.idf")
+    assert response.startswith("File not found: ")
+
+
+@pytest.mark.parametrize("tool_name, method, expected", [
+    ("load_idf_model", "load_idf", "Error loading IDF {path}: boom"),
+    ("validate_idf", "validate_idf", "Error validating IDF {path}: boom"),
+    ("list_zones", "list_zones", "Error listing zones for {path}: boom"),
+    ("get_output_meters", "get_output_meters", "Error getting output meters for {path}: boom"),
+])
+@pytest.mark.asyncio
+async def test_tools_keep_their_error_texts(server, monkeypatch, idf_file, tool_name, method, expected):
+    def broken(*args, **kwargs):
+        raise RuntimeError("boom")
+
+    monkeypatch.setattr(server.ep_manager, method, broken)
+    assert await getattr(server, tool_name)(idf_file) == expected.format(path=idf_file)
+
+
+@pytest.mark.asyncio
+async def test_create_interactive_plot_keeps_its_missing_files_text(server, monkeypatch):
+    def missing(*args, **kwargs):
+        raise FileNotFoundError("no CSV outputs")
+
+    monkeypatch.setattr(server.ep_manager, "create_interactive_plot", missing)
+    assert await server.create_interactive_plot("outputs") == "Files not found: no CSV outputs"
+
+
+@pytest.mark.asyncio
+async def test_list_available_files_rejects_a_negative_limit(server):
+    assert (await server.list_available_files(limit=-1)).startswith("Invalid arguments: ")
+
+
+# ------------------------ Log tail ------------------------
+
+@pytest.fixture(params=[64 * 1024, 7])
+def log_chunk(server, monkeypatch, request):
+    """Read logs in one block, and in blocks smaller than a line"""
+    monkeypatch.setattr(server, "_LOG_READ_CHUNK", request.param)
+
+
+@pytest.mark.parametrize("content", ["one\ntwo\nthree\nfour\n", "one\ntwo\nthree\nfour"])
+def test_log_tail_returns_the_last_lines(server, log_chunk, tmp_path, content):
+    log_file = tmp_path / "server.log"
+    log_file.write_bytes(content.encode())
+
+    assert server._read_log_tail(log_file, 2) == (len(content), ["three\n", content[content.index("four"):]])
+    assert server._read_log_tail(log_file, 10)[1] == content.splitlines(keepends=True)
+
+
+@pytest.mark.parametrize("lines", [0, -3])
+def test_log_tail_returns_at_least_one_line(server, tmp_path, lines):
+    log_file = tmp_path / "server.log"
+    log_file.write_bytes(b"one\ntwo\n")
+    assert server._read_log_tail(log_file, lines) == (8, ["two\n"])
+
+
+def test_log_tail_of_an_empty_file(server, log_chunk, tmp_path):
+    log_file = tmp_path / "server.log"
+    log_file.write_bytes(b"")
+    assert server._read_log_tail(log_file, 5) == (0, [])
+
+
+def test_log_tail_stops_reading_at_the_requested_lines(server, monkeypatch, tmp_path):
+    monkeypatch.setattr(server, "_LOG_READ_CHUNK", 16)
+    log_file = tmp_path / "server.log"
+    log_file.write_bytes(b"".join(b"line %04d\n" % i for i in range(1000)))
+    reads = []
+
+    class CountingFile:
+        def __init__(self, f):
+            self._f = f
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *exc_info):
+            self._f.close()
+
+        def seek(self, *args):
+            return self._f.seek(*args)
+
+        def read(self, size):
+            reads.append(size)
+            return self._f.read(size)
+
+    monkeypatch.setattr(server, "open", lambda path, mode: CountingFile(io.open(path, mode)), raising=False)
+    assert server._read_log_tail(log_file, 3)[1] == ["line 0997\n", "line 0998\n", "line 0999\n"]
+    assert sum(reads) <= 48
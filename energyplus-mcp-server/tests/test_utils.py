@@ -0,0 +1,178 @@
+"""
+Tests for the utility modules of the EnergyPlus MCP Server
+
+EnergyPlus Model Context Protocol Server (EnergyPlus-MCP)
+Copyright (c) 2025, The Regents of the University of California,
+through Lawrence Berkeley National Laboratory (subject to receipt of
+any required approvals from the U.S. Dept. of Energy). All rights reserved.
+
+See License.txt in the parent directory for license details.
+"""
+
+import json
+import os
+from datetime import date, datetime
+from decimal import Decimal
+from subprocess import CalledProcessError
+
+import pytest
+from eppy.runner.run_functions import EnergyPlusRunError
+
+from energyplus_mcp_server.utils import jsonx, runner
+from energyplus_mcp_server.utils.idf_cache import clear_idf_cache, get_idf, parse_idf
+
+from .conftest import TEST_IDD_PATH
+
+
+@pytest.fixture(params=["orjson", "stdlib"])
+def json_backend(request, monkeypatch):
+    """Run a test once with orjson (when installed) and once with the stdlib fallback"""
+    if request.param == "orjson":
+        if jsonx.orjson is None:
+            pytest.skip("orjson is not installed")
+    else:
+        monkeypatch.setattr(jsonx, "orjson", None)
+    return request.param
+
+
+# ------------------------ jsonx ------------------------
+
+def test_dumps_compact(json_backend):
+    assert jsonx.dumps({"a": [1, 2], "b": None}) == '{"a":[1,2],"b":null}'
+
+
+def test_dumps_pretty_matches_json_indent_2(json_backend):
+    payload = {"zones": [{"name": "Zone 1", "area": 12.5}], "count": 1}
+    assert jsonx.dumps(payload, pretty=True) == json.dumps(payload, indent=2)
+
+
+def test_dumps_keeps_non_ascii_text(json_backend):
+    assert jsonx.dumps({"name": "Zürich °C"}) == '{"name":"Zürich °C"}'
+
+
+def test_dumps_writes_non_finite_floats_as_null(json_backend):
+    payload = {"nan": float("nan"), "values": [float("inf"), -float("inf"), 1.5], "nested": ({"x": float("nan")},)}
+    assert jsonx.dumps(payload) == '{"nan":null,"values":[null,null,1.5],"nested":[{"x":null}]}'
+
+
+def test_dumps_converts_decimal_and_dates(json_backend):
+    payload = {
+        "decimal": Decimal("2.5"),
+        "decimal_nan": Decimal("NaN"),
+        "date": date(2025, 1, 31),
+        "timestamp": datetime(2025, 1, 31, 12, 30, 15),
+    }
+    assert jsonx.loads(jsonx.dumps(payload)) == {
+        "decimal": 2.5,
+        "decimal_nan": None,
+        "date": "2025-01-31",
+        "timestamp": "2025-01-31T12:30:15",
+    }
+
+
+def test_dumps_stringifies_non_str_keys(json_backend):
+    assert jsonx.dumps({1: "a"}) == '{"1":"a"}'
+
+
+def test_dumps_rejects_unknown_types(json_backend):
+    with pytest.raises(TypeError):
+        jsonx.dumps({"value": object()})
+
+
+def test_dumps_handles_integers_wider_than_64_bits(json_backend):
+    assert jsonx.dumps([2 ** 70]) == "[1180591620717411303424]"
+
+
+@pytest.mark.parametrize("data", ['{"a":[1,"é"]}', b'{"a":[1,"\\u00e9"]}'])
+def test_loads_accepts_str_and_bytes(json_backend, data):
+    assert jsonx.loads(data) == {"a": [1, "é"]}
+
+
+# ------------------------ idf_cache ------------------------
+
+def test_get_idf_reuses_the_parse_of_an_unchanged_file(manager, idf_file):
+    assert get_idf(idf_file) is get_idf(idf_file)
+    assert get_idf(idf_file) is not parse_idf(idf_file)
+
+
+def test_get_idf_reparses_after_a_size_change(manager, idf_file):
+    first = get_idf(idf_file)
+    with open(idf_file, "a") as f:
+        f.write("\nZone, Zone Two;\n")
+
+    second = get_idf(idf_file)
+    assert second is not first
+    assert [zone.Name for zone in second.idfobjects["Zone"]] == ["Zone One", "Zone Two"]
+
+
+def test_get_idf_reparses_after_a_same_size_rewrite(manager, idf_file):
+    first = get_idf(idf_file)
+    with open(idf_file) as f:
+        content = f.read()
+    with open(idf_file, "w") as f:
+        f.write(content.replace("Zone One", "Zone 1st"))
+    stat_result = os.stat(idf_file)
+    os.utime(idf_file, ns=(stat_result.st_atime_ns, stat_result.st_mtime_ns + 1_000_000_000))
+
+    second = get_idf(idf_file)
+    assert second is not first
+    assert second.idfobjects["Zone"][0].Name == "Zone 1st"
+
+
+def test_clear_idf_cache_drops_cached_parses(manager, idf_file):
+    first = get_idf(idf_file)
+    clear_idf_cache()
+    assert get_idf(idf_file) is not first
+
+
+# ------------------------ runner ------------------------
+
+@pytest.fixture
+def fake_energyplus(tmp_path, monkeypatch):
+    """Record EnergyPlus invocations instead of running a real installation"""
+    calls = []
+
+    def fake_check_call(cmd, cwd=None, **kwargs):
+        calls.append({"cmd": cmd, "cwd": cwd, "process_cwd": os.getcwd(), "model_saved": os.path.isfile(cmd[-1])})
+        return 0
+
+    monkeypatch.setattr(runner, "install_paths", lambda version, iddname: ("/opt/eplus/energyplus", str(tmp_path)))
+    monkeypatch.setattr(runner, "check_call", fake_check_call)
+    return calls
+
+
+def test_run_idf_keeps_the_process_working_directory(manager, idf_file, tmp_path, fake_energyplus):
+    weather = tmp_path / "weather.epw"
+    weather.write_text("")
+    output_directory = str(tmp_path / "out")
+    cwd = os.getcwd()
+
+    result = runner.run_idf(parse_idf(idf_file), weather=str(weather), output_directory=output_directory,
+                            readvars=True, output_prefix="model", verbose="q")
+
+    assert result == "OK"
+    call = fake_energyplus[0]
+    assert call["process_cwd"] == cwd == os.getcwd()
+    assert call["cwd"] != cwd and not os.path.exists(call["cwd"])
+    assert call["cmd"][:-1] == ["/opt/eplus/energyplus", "--weather", str(weather), "--output-directory",
+                                output_directory, "--idd", TEST_IDD_PATH, "--readvars", "--output-prefix", "model"]
+    # The model copy exists for the run and is removed afterwards
+    assert call["model_saved"] and not os.path.exists(call["cmd"][-1])
+
+
+def test_run_idf_reports_the_error_file_on_failure(manager, idf_file, tmp_path, monkeypatch, fake_energyplus):
+    output_directory = tmp_path / "out"
+    output_directory.mkdir()
+    (output_directory / "model.err").write_text("** Severe  ** Something went wrong")
+
+    def failing_check_call(cmd, cwd=None, **kwargs):
+        raise CalledProcessError(1, cmd)
+
+    monkeypatch.setattr(runner, "check_call", failing_check_call)
+    with pytest.raises(EnergyPlusRunError, match="Something went wrong"):
+        runner.run_idf(parse_idf(idf_file), output_directory=str(output_directory), output_prefix="model")
+
+
+def test_run_idf_rejects_unknown_options(manager, idf_file, fake_energyplus):
+    with pytest.raises(ValueError):
+        runner.run_idf(parse_idf(idf_file), design_days=True)